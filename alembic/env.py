@@ -1,9 +1,11 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
+from dotenv import load_dotenv
 
 from app.infra.sqlalchemy.config.database import Base
 from app.infra.sqlalchemy.models.models import *
@@ -12,6 +14,12 @@ from app.infra.sqlalchemy.models.models import *
 # access to the values within the .ini file in use.
 config = context.config
 
+# Mesma variável usada pela aplicação ('%' escapado por causa do configparser).
+# Importar os models não cria engine nem lê o .env; isso é feito aqui.
+load_dotenv()
+if os.getenv("DATABASE_URL"):
+    config.set_main_option("sqlalchemy.url", os.getenv("DATABASE_URL").replace("%", "%%"))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
@@ -29,6 +37,15 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_object(objeto, nome, tipo, refletido, comparado_com):
+    """Índices restritos a um dialeto (ex.: FULLTEXT só no MySQL) são ignorados nos demais."""
+    ddl_if = getattr(objeto, "_ddl_if", None)
+    if tipo == "index" and ddl_if is not None and ddl_if.dialect:
+        dialetos = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+        return context.get_context().dialect.name in dialetos
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -45,6 +62,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -68,7 +86,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,45 @@
+"""indices fulltext da busca
+
+Índices FULLTEXT usados por GET /busca. Só no MySQL: nos demais bancos a
+busca usa um índice invertido em memória e nada é criado.
+
+Revision ID: 1f655baf6cb9
+Revises: 29f2a8eb9876
+Create Date: 2026-10-18 12:39:35.487397
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f655baf6cb9'
+down_revision: Union[str, Sequence[str], None] = '29f2a8eb9876'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDICES = [
+    # (nome, tabela, colunas)
+    ("ft_projeto_nome_descricao", "projeto", ["nome", "descricao"]),
+    ("ft_empresa_nome_descricao", "empresa", ["nome", "descricao"]),
+    ("ft_usuario_nome", "usuario", ["nome"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "mysql":
+        return
+    for nome, tabela, colunas in INDICES:
+        op.create_index(nome, tabela, colunas, mysql_prefix="FULLTEXT")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "mysql":
+        return
+    for nome, tabela, _colunas in reversed(INDICES):
+        op.drop_index(nome, table_name=tabela)
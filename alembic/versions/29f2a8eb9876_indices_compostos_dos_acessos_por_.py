@@ -0,0 +1,45 @@
+"""indices compostos dos acessos por semestre
+
+Índices para os filtros mais usados: equipe_projeto(id_projeto, semestre),
+membro_equipe(id_usuario) em check_projeto_acesso, lideranca(id_projeto,
+semestre) e status em projeto/projeto_dashboard. Conferir com
+scripts/verificar_planos.py.
+
+Revision ID: 29f2a8eb9876
+Revises: 92efb0ab7ecb
+Create Date: 2026-10-18 12:09:10.968966
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '29f2a8eb9876'
+down_revision: Union[str, Sequence[str], None] = '92efb0ab7ecb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDICES = [
+    # (nome, tabela, colunas)
+    ("idx_equipe_projeto_projeto_semestre", "equipe_projeto", ["id_projeto", "semestre", "id_equipe", "fase"]),
+    ("idx_membro_equipe_usuario", "membro_equipe", ["id_usuario", "id_equipe"]),
+    ("idx_lideranca_projeto_semestre", "lideranca", ["id_projeto", "semestre", "id_usuario"]),
+    ("idx_projeto_status", "projeto", ["status", "id_projeto"]),
+    ("idx_projeto_dashboard_status", "projeto_dashboard", ["status", "id_projeto"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for nome, tabela, colunas in INDICES:
+        op.create_index(nome, tabela, colunas)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for nome, tabela, _colunas in reversed(INDICES):
+        op.drop_index(nome, table_name=tabela)
@@ -0,0 +1,73 @@
+"""tabelas de resumo, fila de e-mails e versao de role
+
+Parte de um banco criado com o database/DDL.sql original. Bancos novos,
+criados com o DDL.sql atual, já têm estes objetos: use `alembic stamp head`.
+
+Revision ID: 92efb0ab7ecb
+Revises: 
+Create Date: 2026-10-18 12:09:09.273266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '92efb0ab7ecb'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("usuario", sa.Column("role_version", sa.Integer(), nullable=False, server_default="0"))
+
+    op.create_table(
+        "projeto_dashboard",
+        sa.Column("id_projeto", sa.Integer(), sa.ForeignKey("projeto.id_projeto", ondelete="CASCADE"), primary_key=True),
+        sa.Column("nome_projeto", sa.String(100), nullable=False),
+        sa.Column("descricao", sa.TEXT()),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("fase", sa.CHAR(1)),
+        sa.Column("orientador_tecnico", sa.String(255)),
+        sa.Column("semestre_inicial", sa.String(7)),
+        sa.Column("semestre_referencia", sa.Integer(), nullable=False),
+    )
+    op.create_index("idx_projeto_dashboard_semestre", "projeto_dashboard", ["semestre_referencia"])
+
+    op.create_table(
+        "versao_recurso",
+        sa.Column("chave", sa.String(64), primary_key=True),
+        sa.Column("versao", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("id_email", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("destinatario", sa.String(255), nullable=False),
+        sa.Column("assunto", sa.String(255), nullable=False),
+        sa.Column("corpo", sa.TEXT(), nullable=False),
+        sa.Column("status", sa.Enum("pendente", "enviando", "enviado", "falhou"), nullable=False,
+                  server_default="pendente"),
+        sa.Column("tentativas", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("proxima_tentativa", sa.DateTime(), nullable=False),
+        sa.Column("reservado_em", sa.DateTime()),
+        sa.Column("lote", sa.String(32)),
+        sa.Column("ultimo_erro", sa.String(500)),
+        sa.Column("criado_em", sa.DateTime(), nullable=False),
+        sa.Column("enviado_em", sa.DateTime()),
+    )
+    op.create_index("idx_email_outbox_status_proxima", "email_outbox", ["status", "proxima_tentativa"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_email_outbox_status_proxima", table_name="email_outbox")
+    op.drop_table("email_outbox")
+    op.drop_table("versao_recurso")
+    op.drop_index("idx_projeto_dashboard_semestre", table_name="projeto_dashboard")
+    op.drop_table("projeto_dashboard")
+    op.drop_column("usuario", "role_version")
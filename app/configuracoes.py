@@ -0,0 +1,101 @@
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Configuracoes:
+    """
+    Configuração dos recursos que a aplicação cria sob demanda (engines,
+    assinatura de tokens e worker de e-mail). `de_ambiente()` lê as mesmas
+    variáveis de sempre; testes podem montar uma instância diretamente e
+    passar a create_app().
+    """
+
+    database_url: str | None = None
+    # Se vazio, derivado de database_url (ex.: mysql+pymysql -> mysql+aiomysql)
+    async_database_url: str | None = None
+    # Réplica de leitura opcional (dashboard, listagens, obter); vazio = tudo no primário
+    database_read_url: str | None = None
+    async_database_read_url: str | None = None
+    # Depois de uma escrita, o cliente lê do primário por este tempo (ler as próprias escritas)
+    db_leitura_primario_s: float = 5
+    # "dev": NullPool, uma conexão nova por sessão; "prod": QueuePool com recycle e pre-ping
+    db_engine_mode: str = "dev"
+    # echo loga todo SQL de forma síncrona; consultas lentas e N+1 já vão para o log "app.sql"
+    db_echo: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 3600
+    # Routers de domínio com AsyncSession (ver database_async.py)
+    db_async: bool = False
+    # false para rodar o worker da fila de e-mails em outro processo
+    email_worker_ativo: bool = True
+
+    # Assinatura dos JWTs e cache de tokens já verificados
+    jwt_secret_key: str | None = field(default=None, repr=False)
+    token_cache_max_entries: int = 4096
+
+    # SMTP. Para testar localmente: python -m aiosmtpd -n -l localhost:1025
+    # com MAIL_SERVER=localhost MAIL_PORT=1025 MAIL_STARTTLS=false e sem MAIL_USERNAME.
+    mail_username: str | None = None
+    mail_password: str | None = field(default=None, repr=False)
+    mail_from: str | None = None
+    mail_server: str | None = None
+    mail_port: int = 587
+    mail_starttls: bool = True
+    mail_ssl_tls: bool = False
+    mail_timeout: float = 30
+
+    # Worker da fila (email_outbox)
+    email_worker_intervalo: float = 5
+    email_lote: int = 50
+    email_max_tentativas: int = 5
+    email_backoff_base: int = 30  # 30s, 60s, 120s, ...
+    email_reserva_expira: int = 300
+    # Conexão SMTP ociosa por mais que isso (s) é fechada e reaberta no próximo envio
+    email_smtp_ocioso: float = 60
+
+    @classmethod
+    def de_ambiente(cls, ambiente: Mapping[str, str] | None = None) -> "Configuracoes":
+        """Lê as variáveis de `ambiente` (padrão: os.environ)."""
+        ambiente = os.environ if ambiente is None else ambiente
+
+        def texto(nome: str, padrao: str | None = None) -> str | None:
+            return ambiente.get(nome, padrao)
+
+        def booleano(nome: str, padrao: str) -> bool:
+            return ambiente.get(nome, padrao).lower() == "true"
+
+        return cls(
+            database_url=texto("DATABASE_URL"),
+            async_database_url=texto("ASYNC_DATABASE_URL"),
+            database_read_url=texto("DATABASE_READ_URL"),
+            async_database_read_url=texto("ASYNC_DATABASE_READ_URL"),
+            db_leitura_primario_s=float(texto("DB_LEITURA_PRIMARIO_S", 5)),
+            db_engine_mode=texto("DB_ENGINE_MODE", "dev").lower(),
+            db_echo=booleano("DB_ECHO", "False"),
+            db_pool_size=int(texto("DB_POOL_SIZE", 5)),
+            db_max_overflow=int(texto("DB_MAX_OVERFLOW", 10)),
+            db_pool_timeout=float(texto("DB_POOL_TIMEOUT", 30)),
+            db_pool_recycle=int(texto("DB_POOL_RECYCLE", 3600)),
+            db_async=booleano("DB_ASYNC", "False"),
+            email_worker_ativo=booleano("EMAIL_WORKER_ATIVO", "true"),
+            jwt_secret_key=texto("JWT_SECRET_KEY"),
+            token_cache_max_entries=int(texto("TOKEN_CACHE_MAX_ENTRIES", 4096)),
+            mail_username=texto("MAIL_USERNAME"),
+            mail_password=texto("MAIL_PASSWORD"),
+            mail_from=texto("MAIL_FROM"),
+            mail_server=texto("MAIL_SERVER"),
+            mail_port=int(texto("MAIL_PORT", 587)),
+            mail_starttls=booleano("MAIL_STARTTLS", "True"),
+            mail_ssl_tls=booleano("MAIL_SSL_TLS", "False"),
+            mail_timeout=float(texto("MAIL_TIMEOUT", 30)),
+            email_worker_intervalo=float(texto("EMAIL_WORKER_INTERVALO", 5)),
+            email_lote=int(texto("EMAIL_LOTE", 50)),
+            email_max_tentativas=int(texto("EMAIL_MAX_TENTATIVAS", 5)),
+            email_backoff_base=int(texto("EMAIL_BACKOFF_BASE", 30)),
+            email_reserva_expira=int(texto("EMAIL_RESERVA_EXPIRA", 300)),
+            email_smtp_ocioso=float(texto("EMAIL_SMTP_OCIOSO", 60)),
+        )
@@ -1,14 +1,15 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.infra.sqlalchemy.models.models import Usuario
-from app.utils.security import verificar_senha, gerar_senha, hash_senha
-from app.utils.security import verificar_senha
+from app.utils.security import verificar_senha, gerar_senha, hash_senha_async
 from app.utils.jwt_handler import criar_access_token
 from app.infra.sqlalchemy.models import models
-from app.utils.email_handler import send_email
+from app.utils.email_handler import enfileirar_email
+from app.utils.role_version import geracao_role_versions, registrar_role_version
 
 
 def login_user(db: Session, email: str, senha: str):
+    geracao = geracao_role_versions()
     user = db.query(Usuario).filter(Usuario.email == email).first()
     if not user:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
@@ -16,10 +17,14 @@ def login_user(db: Session, email: str, senha: str):
     if not verificar_senha(senha, user.senha_hash):
         raise HTTPException(status_code=401, detail="Senha incorreta")
 
+    # Role e versão da role vão assinadas no token (evita consultas por request)
     access_token = criar_access_token({
         "user_id": user.id_usuario,
-        "email": user.email
+        "email": user.email,
+        "role": get_user_role(db, user.id_usuario),
+        "rv": user.role_version
     })
+    registrar_role_version(user.id_usuario, user.role_version, geracao)
 
     return {
         "access_token": access_token,
@@ -32,12 +37,12 @@ async def reset_password_and_email(db: Session, email: str):
     # Por segurança, não informamos ao cliente se o e-mail foi encontrado ou não.
     # A mensagem de retorno é a mesma em ambos os casos.
     if user:
-        # Gerar e salvar a nova senha
+        # Gerar a nova senha
         nova_senha = gerar_senha(8)
-        user.senha_hash = hash_senha(nova_senha)
-        db.commit()
+        user.senha_hash = await hash_senha_async(nova_senha)
 
-        # Preparar e enviar o e-mail
+        # O e-mail vai para a fila na mesma transação da nova senha;
+        # o envio SMTP acontece em segundo plano (email_handler.worker_email)
         subject = "Redefinição de Senha - Sistema TTG"
         body = f"""
         <html>
@@ -51,7 +56,8 @@ async def reset_password_and_email(db: Session, email: str):
             </body>
         </html>
         """
-        await send_email(recipient_email=user.email, subject=subject, body=body)
+        enfileirar_email(db, destinatario=user.email, assunto=subject, corpo=body)
+        db.commit()
 
     return {"message": "Se existir uma conta com o e-mail informado, uma nova senha foi enviada."}
 
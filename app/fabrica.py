@@ -0,0 +1,96 @@
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from app.configuracoes import Configuracoes
+from app.infra.sqlalchemy.config.database import configurar_banco, descartar_engine
+from app.infra.sqlalchemy.config.database_async import descartar_async_engine
+from app.infra.sqlalchemy.repositorios.busca import indice_busca
+from app.router import login_route, admin_routes, metricas_routes, busca_routes
+from app.utils.acesso_projeto import cache_acesso_projeto
+from app.utils.email_handler import worker_email
+from app.utils.jwt_bearer import get_current_user
+from app.utils.jwt_handler import cache_tokens, configurar_tokens
+from app.utils.metricas import MiddlewareMetricas
+from app.utils.role_version import limpar_role_versions
+from app.utils.roteamento_leitura import MiddlewareRoteamentoLeitura, fixacao_primario
+from app.utils.security import pool_senhas
+
+
+def _limpar_caches():
+    cache_tokens.limpar()
+    cache_acesso_projeto.limpar()
+    limpar_role_versions()
+    fixacao_primario.limpar()
+    indice_busca.limpar()
+
+
+def create_app(configuracoes: Configuracoes | None = None) -> FastAPI:
+    """
+    Monta a aplicação. Nada é aberto aqui: o engine é criado na primeira
+    sessão e o worker de e-mail e os caches ficam atrelados ao lifespan.
+    """
+    configuracoes = configuracoes or Configuracoes.de_ambiente()
+    configurar_banco(configuracoes)
+    configurar_tokens(configuracoes)
+
+    if configuracoes.db_async:
+        # Routers de domínio com AsyncSession
+        from app.router import empresa_routes_async as empresa_routes, aluno_routes_async as aluno_routes
+        from app.router import projeto_routes_async as projeto_routes, equipe_routes_async as equipe_routes
+    else:
+        from app.router import empresa_routes, aluno_routes, projeto_routes, equipe_routes
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        _limpar_caches()
+        worker_email.configurar(configuracoes)
+        if configuracoes.email_worker_ativo:
+            worker_email.iniciar()
+        yield
+        worker_email.parar()
+        pool_senhas.encerrar()
+        descartar_engine()
+        await descartar_async_engine()
+        _limpar_caches()
+
+    app = FastAPI(title="Meu Backend", lifespan=lifespan)
+    app.state.configuracoes = configuracoes
+
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag"],
+    )
+    # Leituras na réplica, exceto logo depois de uma escrita do mesmo cliente
+    if configuracoes.database_read_url:
+        app.add_middleware(MiddlewareRoteamentoLeitura, segundos=configuracoes.db_leitura_primario_s)
+    # Métricas por rota (GET /metrics); adicionado por último para envolver os demais
+    app.add_middleware(MiddlewareMetricas)
+
+    # Inclui as rotas
+    app.include_router(login_route.router)
+    app.include_router(empresa_routes.router)
+    app.include_router(aluno_routes.router)
+    app.include_router(projeto_routes.router)
+    app.include_router(equipe_routes.router)
+    app.include_router(busca_routes.router)
+    app.include_router(admin_routes.router)
+    app.include_router(metricas_routes.router)
+
+    @app.get("/")
+    def root():
+        return {"message": "API funcionando!"}
+
+    @app.get("/me")
+    def get_me(current_user: dict = Depends(get_current_user)):
+        return {
+            "id": current_user["user_id"],
+            "email": current_user["email"],
+            "role": current_user["role"]
+        }
+
+    return app
@@ -1,31 +1,190 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import NullPool
-from dotenv import load_dotenv
-import os
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool, QueuePool
+from app.configuracoes import Configuracoes
+from app.infra.sqlalchemy.config.instrumentacao import instrumentar_engine
+import threading
+import time
 
-load_dotenv()
+# Nada aqui conecta ou lê o ambiente na importação: o engine é criado na primeira
+# sessão, com a configuração de configurar_banco() (create_app) ou do ambiente.
+_configuracoes: Configuracoes | None = None
+_engine: Engine | None = None
+_engine_leitura: Engine | None = None
+_lock = threading.Lock()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
 
-print("--- CONEXAO COM BANCO ---")
-print(f"URL: {DATABASE_URL}")
+class QueuePoolComMetricas(QueuePool):
+    """
+    QueuePool que contabiliza checkouts, timeouts e o tempo de espera
+    por uma conexão livre, para ajustar o tamanho do pool por worker.
+    Falhas ao abrir uma conexão nova contam à parte (não são pool esgotado).
+    """
 
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,
-    #pool_recycle=3600,
-    #pool_pre_ping=True,
-    poolclass=NullPool
-)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metricas_lock = threading.Lock()
+        self.total_checkouts = 0
+        self.total_timeouts = 0
+        self.total_erros_conexao = 0
+        self.espera_total_s = 0.0
+        self.espera_max_s = 0.0
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            conexao = super()._do_get()
+        except exc.TimeoutError:
+            with self._metricas_lock:
+                self.total_timeouts += 1
+            raise
+        except Exception:
+            with self._metricas_lock:
+                self.total_erros_conexao += 1
+            raise
+        espera = time.perf_counter() - inicio
+        with self._metricas_lock:
+            self.total_checkouts += 1
+            self.espera_total_s += espera
+            if espera > self.espera_max_s:
+                self.espera_max_s = espera
+        return conexao
+
+
+def configurar_banco(configuracoes: Configuracoes):
+    """Define a configuração dos engines; um engine já criado com outra configuração é descartado."""
+    global _configuracoes
+    with _lock:
+        if configuracoes == _configuracoes:
+            return
+        _configuracoes = configuracoes
+    descartar_engine()
+
+
+def obter_configuracoes() -> Configuracoes:
+    global _configuracoes
+    with _lock:
+        if _configuracoes is None:
+            _configuracoes = Configuracoes.de_ambiente()
+        return _configuracoes
+
+
+def _criar_engine(configuracoes: Configuracoes, url: str) -> Engine:
+    if configuracoes.db_engine_mode == "prod":
+        return create_engine(
+            url,
+            echo=configuracoes.db_echo,
+            poolclass=QueuePoolComMetricas,
+            pool_size=configuracoes.db_pool_size,
+            max_overflow=configuracoes.db_max_overflow,
+            pool_timeout=configuracoes.db_pool_timeout,
+            pool_recycle=configuracoes.db_pool_recycle,
+            pool_pre_ping=True
+        )
+    return create_engine(
+        url,
+        echo=configuracoes.db_echo,
+        poolclass=NullPool
+    )
+
+
+def get_engine() -> Engine:
+    """Engine síncrono, criado sob demanda (o driver do banco só é importado aqui)."""
+    global _engine
+    if _engine is None:
+        configuracoes = obter_configuracoes()
+        with _lock:
+            if _engine is None:
+                engine = _criar_engine(configuracoes, configuracoes.database_url)
+                instrumentar_engine(engine)
+                _fabrica_sessoes.configure(bind=engine)
+                _engine = engine
+    return _engine
+
+
+def get_engine_leitura() -> Engine:
+    """Engine da réplica (database_read_url), criado sob demanda; sem réplica, o próprio primário."""
+    global _engine_leitura
+    if _engine_leitura is None:
+        configuracoes = obter_configuracoes()
+        if not configuracoes.database_read_url:
+            return get_engine()
+        with _lock:
+            if _engine_leitura is None:
+                engine = _criar_engine(configuracoes, configuracoes.database_read_url)
+                instrumentar_engine(engine)
+                _fabrica_sessoes_leitura.configure(bind=engine)
+                _engine_leitura = engine
+    return _engine_leitura
+
+
+def descartar_engine():
+    """Fecha as conexões dos pools; o próximo get_engine() cria um engine novo."""
+    global _engine, _engine_leitura
+    with _lock:
+        engines = (_engine, _engine_leitura)
+        _engine = _engine_leitura = None
+    for engine in engines:
+        if engine is not None:
+            engine.dispose()
+
+
+_fabrica_sessoes = sessionmaker(autocommit=False, autoflush=False)
+# info["leitura"] marca sessões da réplica: quem precisar escrever usa SessionLocal()
+_fabrica_sessoes_leitura = sessionmaker(autocommit=False, autoflush=False, info={"leitura": True})
 Base = declarative_base()
 
 
+def SessionLocal(**kwargs) -> Session:
+    """Mesma interface do sessionmaker; garante o engine antes de abrir a sessão."""
+    get_engine()
+    return _fabrica_sessoes(**kwargs)
+
+
+def SessionLeitura(**kwargs) -> Session:
+    """Sessão na réplica de leitura, ou no primário se nenhuma estiver configurada."""
+    if not obter_configuracoes().database_read_url:
+        return SessionLocal(**kwargs)
+    get_engine_leitura()
+    return _fabrica_sessoes_leitura(**kwargs)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_pool_metrics() -> dict:
+    """Retorna o estado atual do pool de conexões do engine principal."""
+    configuracoes = obter_configuracoes()
+    if _engine is None:
+        return {"modo": configuracoes.db_engine_mode, "pool": None}
+    pool = _engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"modo": configuracoes.db_engine_mode, "pool": type(pool).__name__}
+
+    metricas = {
+        "modo": configuracoes.db_engine_mode,
+        "pool": type(pool).__name__,
+        "tamanho": pool.size(),
+        "max_overflow": configuracoes.db_max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+    }
+    if isinstance(pool, QueuePoolComMetricas):
+        with pool._metricas_lock:
+            total = pool.total_checkouts
+            metricas.update({
+                "total_checkouts": total,
+                "total_timeouts": pool.total_timeouts,
+                "total_erros_conexao": pool.total_erros_conexao,
+                "espera_total_ms": round(pool.espera_total_s * 1000, 3),
+                "espera_media_ms": round(pool.espera_total_s * 1000 / total, 3) if total else 0.0,
+                "espera_max_ms": round(pool.espera_max_s * 1000, 3),
+            })
+    return metricas
@@ -0,0 +1,105 @@
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool
+from app.infra.sqlalchemy.config.instrumentacao import instrumentar_engine
+from app.infra.sqlalchemy.config.database import obter_configuracoes
+
+# Drivers síncronos -> drivers assíncronos equivalentes
+_DRIVERS_ASYNC = {
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql+mysqlconnector": "mysql+aiomysql",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def _derivar_url_async(url: str | None) -> str | None:
+    if not url or "://" not in url:
+        return url
+    driver, resto = url.split("://", 1)
+    return f"{_DRIVERS_ASYNC.get(driver, driver)}://{resto}"
+
+
+_async_engine = None
+_AsyncSessionLocal = None
+_async_engine_leitura = None
+_AsyncSessionLeitura = None
+
+
+def _criar_async_engine(configuracoes, url: str):
+    if configuracoes.db_engine_mode == "prod":
+        engine = create_async_engine(
+            url,
+            echo=configuracoes.db_echo,
+            pool_size=configuracoes.db_pool_size,
+            max_overflow=configuracoes.db_max_overflow,
+            pool_timeout=configuracoes.db_pool_timeout,
+            pool_recycle=configuracoes.db_pool_recycle,
+            pool_pre_ping=True
+        )
+    else:
+        engine = create_async_engine(
+            url,
+            echo=configuracoes.db_echo,
+            poolclass=NullPool
+        )
+    instrumentar_engine(engine.sync_engine)
+    return engine
+
+
+def get_async_engine():
+    """Cria o AsyncEngine sob demanda (o driver async só é exigido se for usado)."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        configuracoes = obter_configuracoes()
+        url = configuracoes.async_database_url or _derivar_url_async(configuracoes.database_url)
+        _async_engine = _criar_async_engine(configuracoes, url)
+        # expire_on_commit=False: evita lazy-load (proibido em async) ao serializar a resposta
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=_async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+        )
+    return _async_engine
+
+
+def get_async_engine_leitura():
+    """AsyncEngine da réplica de leitura; sem réplica configurada, o do primário."""
+    global _async_engine_leitura, _AsyncSessionLeitura
+    if _async_engine_leitura is None:
+        configuracoes = obter_configuracoes()
+        if not configuracoes.database_read_url:
+            return get_async_engine()
+        url = configuracoes.async_database_read_url or _derivar_url_async(configuracoes.database_read_url)
+        _async_engine_leitura = _criar_async_engine(configuracoes, url)
+        _AsyncSessionLeitura = async_sessionmaker(
+            bind=_async_engine_leitura, autoflush=False, expire_on_commit=False, class_=AsyncSession,
+            info={"leitura": True}
+        )
+    return _async_engine_leitura
+
+
+async def descartar_async_engine():
+    global _async_engine, _AsyncSessionLocal, _async_engine_leitura, _AsyncSessionLeitura
+    engines = (_async_engine, _async_engine_leitura)
+    _async_engine = _AsyncSessionLocal = _async_engine_leitura = _AsyncSessionLeitura = None
+    for engine in engines:
+        if engine is not None:
+            await engine.dispose()
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    get_async_engine()
+    return _AsyncSessionLocal()
+
+
+def AsyncSessionLeitura() -> AsyncSession:
+    """AsyncSession na réplica de leitura, ou no primário se nenhuma estiver configurada."""
+    if not obter_configuracoes().database_read_url:
+        return AsyncSessionLocal()
+    get_async_engine_leitura()
+    return _AsyncSessionLeitura()
+
+
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Consultas acima deste tempo (ms) vão para o log "app.sql" (amostradas por SQL_LENTA_AMOSTRAGEM)
+SQL_LENTA_MS = float(os.getenv("SQL_LENTA_MS", 200))
+SQL_LENTA_AMOSTRAGEM = float(os.getenv("SQL_LENTA_AMOSTRAGEM", 1.0))
+# Mesma consulta (mesmo SQL, parâmetros diferentes) repetida N vezes numa requisição = provável N+1
+SQL_N_MAIS_1_LIMIAR = int(os.getenv("SQL_N_MAIS_1_LIMIAR", 10))
+SQL_N_MAIS_1_MAX_REGISTROS = 200
+SQL_LOG_MAX_CARACTERES = 1000
+
+logger = logging.getLogger("app.sql")
+
+
+class EstatisticasSQL:
+    """Consultas executadas, tempo gasto no banco e formas de SQL vistas durante uma requisição."""
+
+    __slots__ = ("consultas", "tempo_s", "formas", "requisicao")
+
+    def __init__(self, requisicao: str | None = None):
+        self.consultas = 0
+        self.tempo_s = 0.0
+        self.formas: dict[str, int] = {}
+        self.requisicao = requisicao
+
+
+# Definido pelo middleware de métricas no início de cada requisição. O objeto é
+# compartilhado com o threadpool (rotas síncronas) e com o greenlet do AsyncSession,
+# que recebem uma cópia do contexto.
+contexto_sql: ContextVar[EstatisticasSQL | None] = ContextVar("contexto_sql", default=None)
+
+
+class RegistroInstrumentacao:
+    """Totais do processo: consultas lentas e suspeitas de N+1 por rota."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.consultas_lentas = 0
+        self.consultas_com_erro = 0
+        self.suspeitas_n_mais_1: dict[tuple[str, str], dict] = {}
+
+    def registrar_lenta(self):
+        with self._lock:
+            self.consultas_lentas += 1
+
+    def registrar_erro(self):
+        with self._lock:
+            self.consultas_com_erro += 1
+
+    def registrar_n_mais_1(self, rota: str, sql: str, repeticoes: int):
+        with self._lock:
+            chave = (rota, sql)
+            suspeita = self.suspeitas_n_mais_1.get(chave)
+            if suspeita is None:
+                if len(self.suspeitas_n_mais_1) >= SQL_N_MAIS_1_MAX_REGISTROS:
+                    return
+                suspeita = self.suspeitas_n_mais_1[chave] = {"ocorrencias": 0, "max_repeticoes": 0}
+            suspeita["ocorrencias"] += 1
+            suspeita["max_repeticoes"] = max(suspeita["max_repeticoes"], repeticoes)
+
+    def n_mais_1_por_rota(self) -> dict[str, int]:
+        with self._lock:
+            totais: dict[str, int] = {}
+            for (rota, _), suspeita in self.suspeitas_n_mais_1.items():
+                totais[rota] = totais.get(rota, 0) + suspeita["ocorrencias"]
+            return totais
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            suspeitas = sorted(self.suspeitas_n_mais_1.items(), key=lambda item: -item[1]["ocorrencias"])
+            return {
+                "sql_lenta_ms": SQL_LENTA_MS,
+                "n_mais_1_limiar": SQL_N_MAIS_1_LIMIAR,
+                "consultas_lentas": self.consultas_lentas,
+                "consultas_com_erro": self.consultas_com_erro,
+                "suspeitas_n_mais_1": [
+                    {"rota": rota, "sql": sql, **suspeita} for (rota, sql), suspeita in suspeitas
+                ],
+            }
+
+
+registro_instrumentacao = RegistroInstrumentacao()
+
+
+def _log_estruturado(evento: str, **campos):
+    logger.warning(json.dumps({"evento": evento, **campos}, ensure_ascii=False, default=str))
+
+
+# O início de cada consulta fica no contexto de execução (um por statement): uma
+# consulta que falha não deixa sobra na conexão para a próxima medir errado
+def _antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._inicio_consulta = time.perf_counter()
+
+
+def _duracao(context) -> float:
+    inicio = getattr(context, "_inicio_consulta", None)
+    return time.perf_counter() - inicio if inicio is not None else 0.0
+
+
+def _registrar_na_requisicao(statement: str, duracao: float, executemany: bool):
+    estatisticas = contexto_sql.get()
+    if estatisticas is not None:
+        estatisticas.consultas += 1
+        estatisticas.tempo_s += duracao
+        if not executemany:
+            estatisticas.formas[statement] = estatisticas.formas.get(statement, 0) + 1
+    return estatisticas
+
+
+def _depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+    duracao = _duracao(context)
+    estatisticas = _registrar_na_requisicao(statement, duracao, executemany)
+
+    if duracao * 1000 >= SQL_LENTA_MS:
+        registro_instrumentacao.registrar_lenta()
+        if random.random() < SQL_LENTA_AMOSTRAGEM:
+            # Parâmetros ficam fora do log (podem conter e-mails, hashes de senha etc.)
+            _log_estruturado(
+                "consulta_lenta",
+                duracao_ms=round(duracao * 1000, 2),
+                requisicao=estatisticas.requisicao if estatisticas else None,
+                executemany=executemany,
+                sql=statement[:SQL_LOG_MAX_CARACTERES],
+            )
+
+
+def _ao_falhar(contexto_erro):
+    """Consulta que levantou erro (IntegrityError, deadlock, timeout): conta e entra no tempo da requisição."""
+    contexto = contexto_erro.execution_context
+    if contexto is None or getattr(contexto, "_inicio_consulta", None) is None:
+        return
+    registro_instrumentacao.registrar_erro()
+    _registrar_na_requisicao(contexto_erro.statement or "", _duracao(contexto), False)
+    contexto._inicio_consulta = None
+
+
+def detectar_n_mais_1(estatisticas: EstatisticasSQL, rota: str) -> list[tuple[str, int]]:
+    """
+    Chamado ao fim da requisição: formas de SQL repetidas SQL_N_MAIS_1_LIMIAR
+    vezes ou mais (ex.: uma consulta por id dentro de um loop) são registradas
+    e logadas. Retorna [(sql, repetições)].
+    """
+    suspeitas = [(sql, total) for sql, total in estatisticas.formas.items() if total >= SQL_N_MAIS_1_LIMIAR]
+    for sql, total in suspeitas:
+        registro_instrumentacao.registrar_n_mais_1(rota, sql[:SQL_LOG_MAX_CARACTERES], total)
+        _log_estruturado("provavel_n_mais_1", rota=rota, requisicao=estatisticas.requisicao,
+                         repeticoes=total, consultas_na_requisicao=estatisticas.consultas,
+                         sql=sql[:SQL_LOG_MAX_CARACTERES])
+    return suspeitas
+
+
+def instrumentar_engine(engine: Engine):
+    """Registra os hooks de tempo/contagem (para AsyncEngine, passar engine.sync_engine)."""
+    if not event.contains(engine, "before_cursor_execute", _antes_de_executar):
+        event.listen(engine, "before_cursor_execute", _antes_de_executar)
+        event.listen(engine, "after_cursor_execute", _depois_de_executar)
+        event.listen(engine, "handle_error", _ao_falhar)
+
+
+class ContadorConsultas:
+    def __init__(self):
+        self.sqls: list[str] = []
+
+    @property
+    def total(self) -> int:
+        return len(self.sqls)
+
+
+@contextmanager
+def contar_consultas(engine: Engine | AsyncEngine | None = None):
+    """
+    Conta as consultas executadas durante o bloco, em qualquer thread (funciona
+    com TestClient). Sem engine, conta em todos (síncrono, AsyncEngine e réplica).
+    """
+    alvo = Engine if engine is None else getattr(engine, "sync_engine", engine)
+    contador = ContadorConsultas()
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        contador.sqls.append(statement)
+
+    event.listen(alvo, "before_cursor_execute", registrar)
+    try:
+        yield contador
+    finally:
+        event.remove(alvo, "before_cursor_execute", registrar)
+
+
+@contextmanager
+def limitar_consultas(maximo: int, engine: Engine | AsyncEngine | None = None):
+    """
+    Para testes: falha com AssertionError se o bloco executar mais que `maximo` consultas.
+
+        with limitar_consultas(3):
+            cliente.get(f"/projetos/dashboard/{projeto_id}/completo", headers=cabecalhos)
+    """
+    with contar_consultas(engine) as contador:
+        yield contador
+    if contador.total > maximo:
+        sqls = "\n".join(f"  {sql[:200]}" for sql in contador.sqls)
+        raise AssertionError(f"{contador.total} consultas executadas (máximo {maximo}):\n{sqls}")
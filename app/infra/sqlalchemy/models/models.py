@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Date, TEXT, CHAR, DECIMAL, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Date, DateTime, TEXT, CHAR, DECIMAL, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.infra.sqlalchemy.config.database import Base
 
@@ -10,10 +10,16 @@ class Usuario(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     telefone = Column(String(20))
     senha_hash = Column(String(255), nullable=False)
+    role_version = Column(Integer, nullable=False, default=0, server_default="0")
     
     aluno = relationship("Aluno", back_populates="usuario", uselist=False, cascade="all, delete-orphan")
     orientadores = relationship("Orientador", back_populates="usuario", cascade="all, delete-orphan")
 
+    # Índices FULLTEXT da busca só existem no MySQL (nos demais, índice em memória)
+    __table_args__ = (
+        Index("ft_usuario_nome", "nome", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
+
 
 class Empresa(Base):
     __tablename__ = "empresa"
@@ -25,6 +31,10 @@ class Empresa(Base):
 
     projetos = relationship("Projeto", back_populates="empresa")
 
+    __table_args__ = (
+        Index("ft_empresa_nome_descricao", "nome", "descricao", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
+
 class Aluno(Base):
     __tablename__ = "aluno"
 
@@ -48,6 +58,29 @@ class Projeto(Base):
 
     empresa = relationship("Empresa", back_populates="projetos")
 
+    __table_args__ = (
+        Index("idx_projeto_status", "status", "id_projeto"),
+        Index("ft_projeto_nome_descricao", "nome", "descricao", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
+
+class Projeto_Dashboard(Base):
+    """Resumo desnormalizado (uma linha por projeto) lido por /projetos/dashboard/all."""
+    __tablename__ = "projeto_dashboard"
+
+    id_projeto = Column(Integer, ForeignKey("projeto.id_projeto", ondelete="CASCADE"), primary_key=True)
+    nome_projeto = Column(String(100), nullable=False)
+    descricao = Column(TEXT)
+    status = Column(String(20), nullable=False)
+    fase = Column(CHAR(1))
+    orientador_tecnico = Column(String(255))
+    semestre_inicial = Column(String(7))
+    semestre_referencia = Column(Integer, nullable=False)  # semestre ao qual a fase se refere
+
+    __table_args__ = (
+        Index("idx_projeto_dashboard_semestre", "semestre_referencia"),
+        Index("idx_projeto_dashboard_status", "status", "id_projeto"),
+    )
+
 class Tipo_Orientador(Base):
     __tablename__ = "tipo_orientador"
 
@@ -78,6 +111,11 @@ class Membro_Equipe(Base):
     id_equipe = Column(Integer, ForeignKey("equipe.id_equipe"), primary_key=True)
     id_usuario = Column(Integer, ForeignKey("usuario.id_usuario"), primary_key=True)
 
+    # check_projeto_acesso parte do usuário; a PK começa por id_equipe
+    __table_args__ = (
+        Index("idx_membro_equipe_usuario", "id_usuario", "id_equipe"),
+    )
+
 class Equipe_Projeto(Base):
     __tablename__ = "equipe_projeto"
 
@@ -86,6 +124,11 @@ class Equipe_Projeto(Base):
     semestre = Column(Integer, primary_key=True)
     fase = Column(CHAR(1))
 
+    # Filtro (id_projeto, semestre) do dashboard; cobre id_equipe e fase sem ler a tabela
+    __table_args__ = (
+        Index("idx_equipe_projeto_projeto_semestre", "id_projeto", "semestre", "id_equipe", "fase"),
+    )
+
 class Lideranca(Base):
     __tablename__ = "lideranca"
 
@@ -93,6 +136,10 @@ class Lideranca(Base):
     id_usuario = Column(Integer, ForeignKey("usuario.id_usuario"), primary_key=True)
     semestre = Column(Integer, primary_key=True)
 
+    __table_args__ = (
+        Index("idx_lideranca_projeto_semestre", "id_projeto", "semestre", "id_usuario"),
+    )
+
 class Orientador_Projeto(Base):
     __tablename__ = "orientador_projeto"
 
@@ -100,3 +147,30 @@ class Orientador_Projeto(Base):
     id_usuario = Column(Integer, ForeignKey("usuario.id_usuario"), primary_key=True)
     id_tipo_orientador = Column(Integer, ForeignKey("tipo_orientador.id_tipo_orientador"), primary_key=True)
 
+class Email_Outbox(Base):
+    """Fila persistente de e-mails, consumida em segundo plano por app.utils.email_handler."""
+    __tablename__ = "email_outbox"
+
+    id_email = Column(Integer, primary_key=True)
+    destinatario = Column(String(255), nullable=False)
+    assunto = Column(String(255), nullable=False)
+    corpo = Column(TEXT, nullable=False)
+    status = Column(Enum('pendente', 'enviando', 'enviado', 'falhou'), nullable=False, default='pendente')
+    tentativas = Column(Integer, nullable=False, default=0)
+    proxima_tentativa = Column(DateTime, nullable=False)
+    reservado_em = Column(DateTime)
+    lote = Column(String(32))
+    ultimo_erro = Column(String(500))
+    criado_em = Column(DateTime, nullable=False)
+    enviado_em = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_email_outbox_status_proxima", "status", "proxima_tentativa"),
+    )
+
+class Versao_Recurso(Base):
+    """Versões usadas nos ETags do dashboard; incrementadas pelos repositórios a cada escrita."""
+    __tablename__ = "versao_recurso"
+
+    chave = Column(String(64), primary_key=True)  # "dashboard:<n>" (n = id do projeto % 16) ou "projeto:<id>"
+    versao = Column(Integer, nullable=False, default=0)
@@ -1,8 +1,21 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, insert
+from sqlalchemy.exc import SQLAlchemyError
+from pydantic import ValidationError
 from fastapi import HTTPException, status
 from app.schemas import schemas
 from app.infra.sqlalchemy.models import models
-from app.utils.security import hash_senha
+from app.utils.security import hash_senha, hash_senhas
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+
+SENHA_PADRAO = "123mudar"
+TAMANHO_LOTE_IMPORTACAO = 500
+
+# Colunas de ordenação (keyset) sobre Usuario; a chave usa os campos do dict de resposta
+ORDENACOES_ALUNO = {
+    "id": ([models.Usuario.id_usuario], lambda a: [a["id_usuario"]]),
+    "nome": ([models.Usuario.nome, models.Usuario.id_usuario], lambda a: [a["nome"], a["id_usuario"]]),
+}
 
 def criar_aluno(db: Session, aluno: schemas.AlunoCreate):
     # 1. Verifica se e-mail já existe na tabela Usuario
@@ -13,9 +26,13 @@ def criar_aluno(db: Session, aluno: schemas.AlunoCreate):
             detail="Email já cadastrado."
         )
 
-    # 2. Cria o Usuario
-    senha_padrao = "123mudar" 
-    senha_hash = hash_senha(senha_padrao)
+    # 2. Verifica o RA antes de criar qualquer registro
+    aluno_existente = db.query(models.Aluno).filter(models.Aluno.ra == aluno.ra).first()
+    if aluno_existente:
+         raise HTTPException(status_code=400, detail="RA já cadastrado.")
+
+    # 3. Cria o Usuario
+    senha_hash = hash_senha(SENHA_PADRAO)
 
     db_usuario = models.Usuario(
         nome=aluno.nome,
@@ -24,14 +41,9 @@ def criar_aluno(db: Session, aluno: schemas.AlunoCreate):
         senha_hash=senha_hash
     )
     db.add(db_usuario)
-    db.commit()
-    db.refresh(db_usuario)
-
-    # 3. Cria o registro na tabela Aluno
-    aluno_existente = db.query(models.Aluno).filter(models.Aluno.ra == aluno.ra).first()
-    if aluno_existente:
-         raise HTTPException(status_code=400, detail="RA já cadastrado.")
+    db.flush()
 
+    # 4. Cria o registro na tabela Aluno (mesma transação do Usuario)
     db_aluno = models.Aluno(
         id_usuario=db_usuario.id_usuario,
         ra=aluno.ra,
@@ -39,7 +51,6 @@ def criar_aluno(db: Session, aluno: schemas.AlunoCreate):
     )
     db.add(db_aluno)
     db.commit()
-    db.refresh(db_aluno)
 
     return {
         "id_usuario": db_usuario.id_usuario,
@@ -50,18 +61,127 @@ def criar_aluno(db: Session, aluno: schemas.AlunoCreate):
         "curso": db_aluno.curso
     }
 
-def listar_alunos(db: Session):
-    alunos_db = db.query(models.Aluno).all()
-    
-    resultados = []
-    for al in alunos_db:
-        resultados.append({
-            "id_usuario": al.usuario.id_usuario,
-            "nome": al.usuario.nome,
-            "email": al.usuario.email,
-            "telefone": al.usuario.telefone,
-            "ra": al.ra,
-            "curso": al.curso
-        })
-        
-    return resultados
\ No newline at end of file
+def validar_registros(registros: list[dict], inicio: int, tamanho_lote: int, erros: list[dict]):
+    """Valida as linhas do lote; as inválidas vão para `erros`. Retorna [(linha, AlunoCreate)]."""
+    validos: list[tuple[int, schemas.AlunoCreate]] = []
+    for indice, registro in enumerate(registros[inicio:inicio + tamanho_lote], start=inicio + 1):
+        try:
+            validos.append((indice, schemas.AlunoCreate.model_validate(registro)))
+        except ValidationError as e:
+            erros.append({"linha": indice, "email": registro.get("email") if isinstance(registro, dict) else None,
+                          "erro": "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())})
+    return validos
+
+def filtrar_conflitos(db: Session, validos: list[tuple[int, schemas.AlunoCreate]], erros: list[dict]):
+    """Separa e-mails e RAs já cadastrados (duas consultas IN) ou repetidos no arquivo. Retorna o lote a gravar."""
+    if not validos:
+        return []
+    emails_existentes = set(db.scalars(
+        select(models.Usuario.email).where(models.Usuario.email.in_([a.email for _, a in validos]))
+    ).all())
+    ras_existentes = set(db.scalars(
+        select(models.Aluno.ra).where(models.Aluno.ra.in_([a.ra for _, a in validos]))
+    ).all())
+
+    lote: list[tuple[int, schemas.AlunoCreate]] = []
+    for indice, aluno in validos:
+        if aluno.email in emails_existentes:
+            erros.append({"linha": indice, "email": aluno.email, "erro": "Email já cadastrado."})
+        elif aluno.ra in ras_existentes:
+            erros.append({"linha": indice, "email": aluno.email, "erro": "RA já cadastrado."})
+        else:
+            # Também evita duplicatas dentro do próprio arquivo
+            emails_existentes.add(aluno.email)
+            ras_existentes.add(aluno.ra)
+            lote.append((indice, aluno))
+    return lote
+
+def gravar_lote_alunos(db: Session, lote: list[tuple[int, schemas.AlunoCreate]], senhas_hash: list[str]):
+    """Insere os pares Usuario+Aluno do lote com executemany. Não faz commit."""
+    db.execute(insert(models.Usuario), [
+        {"nome": aluno.nome, "email": aluno.email, "telefone": aluno.telefone, "senha_hash": senha_hash}
+        for (_, aluno), senha_hash in zip(lote, senhas_hash)
+    ])
+    ids_por_email = dict(db.execute(
+        select(models.Usuario.email, models.Usuario.id_usuario)
+        .where(models.Usuario.email.in_([aluno.email for _, aluno in lote]))
+    ).all())
+    db.execute(insert(models.Aluno), [
+        {"id_usuario": ids_por_email[aluno.email], "ra": aluno.ra, "curso": aluno.curso}
+        for _, aluno in lote
+    ])
+
+def erros_interrupcao(registros: list[dict], inicio: int, tamanho_lote: int,
+                      lote: list[tuple[int, schemas.AlunoCreate]], erro: str) -> list[dict]:
+    """Linhas não importadas quando a importação para no lote que começa em `inicio`."""
+    erros = [{"linha": indice, "email": aluno.email, "erro": erro} for indice, aluno in lote]
+    erros.extend(
+        {"linha": indice, "email": registro.get("email") if isinstance(registro, dict) else None, "erro": erro}
+        for indice, registro in enumerate(registros[inicio + tamanho_lote:], start=inicio + tamanho_lote + 1)
+    )
+    return erros
+
+def erros_gravacao(lote: list[tuple[int, schemas.AlunoCreate]], e: SQLAlchemyError) -> list[dict]:
+    return [{"linha": indice, "email": aluno.email, "erro": f"Falha ao gravar o lote: {e.__class__.__name__}"}
+            for indice, aluno in lote]
+
+def importar_alunos(db: Session, registros: list[dict], tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO):
+    """
+    Importação em massa. Valida cada linha, confere e-mails e RAs contra o banco
+    em consultas IN por lote, gera os hashes em paralelo e insere os pares
+    Usuario+Aluno com executemany, um commit por lote. Erros são reportados
+    por linha (1 = primeiro registro) e não interrompem os demais. Se o pool de
+    senhas estiver cheio (503), a importação para ali: os lotes já gravados ficam
+    em `importados` e as linhas restantes voltam em `erros` para serem reenviadas.
+    """
+    erros = []
+    importados = 0
+
+    for inicio in range(0, len(registros), tamanho_lote):
+        lote = filtrar_conflitos(db, validar_registros(registros, inicio, tamanho_lote, erros), erros)
+        if not lote:
+            continue
+
+        try:
+            senhas_hash = hash_senhas([SENHA_PADRAO] * len(lote))
+        except HTTPException as e:
+            if e.status_code != status.HTTP_503_SERVICE_UNAVAILABLE:
+                raise
+            erros.extend(erros_interrupcao(registros, inicio, tamanho_lote, lote, e.detail))
+            break
+
+        try:
+            gravar_lote_alunos(db, lote, senhas_hash)
+            db.commit()
+            importados += len(lote)
+        except SQLAlchemyError as e:
+            db.rollback()
+            erros.extend(erros_gravacao(lote, e))
+
+    erros.sort(key=lambda erro: erro["linha"])
+    return {"total": len(registros), "importados": importados, "erros": erros}
+
+def select_alunos_response():
+    """
+    Projeção única Usuario ⋈ Aluno, já com os campos de AlunoResponse.
+    Evita carregar entidades e o lazy-load de `al.usuario` (1 SELECT por aluno).
+    """
+    return select(
+        models.Usuario.id_usuario,
+        models.Usuario.nome,
+        models.Usuario.email,
+        models.Usuario.telefone,
+        models.Aluno.ra,
+        models.Aluno.curso
+    ).join(models.Aluno, models.Aluno.id_usuario == models.Usuario.id_usuario)
+
+def listar_alunos(db: Session, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+                  curso: str | None = None):
+    """Lista paginada (keyset). Retorna (alunos, cursor da próxima página)."""
+    colunas, chave = ORDENACOES_ALUNO[ordenar]
+    query = select_alunos_response()
+    if curso is not None:
+        query = query.filter(models.Aluno.curso == curso)
+    alunos_db = db.execute(paginar(query, colunas, cursor, ordenar, limite)).mappings()
+
+    return fechar_pagina([dict(al) for al in alunos_db], chave, ordenar, limite)
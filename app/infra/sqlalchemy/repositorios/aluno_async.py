@@ -0,0 +1,102 @@
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+from app.schemas import schemas
+from app.infra.sqlalchemy.models import models
+from app.utils.security import hash_senha_async, hash_senhas_async
+from app.infra.sqlalchemy.repositorios.aluno import (
+    ORDENACOES_ALUNO, SENHA_PADRAO, TAMANHO_LOTE_IMPORTACAO, select_alunos_response, validar_registros,
+    filtrar_conflitos, gravar_lote_alunos, erros_interrupcao, erros_gravacao
+)
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+
+async def criar_aluno(db: AsyncSession, aluno: schemas.AlunoCreate):
+    # 1. Verifica se e-mail já existe na tabela Usuario
+    usuario_existente = await db.scalar(
+        select(models.Usuario.id_usuario).where(models.Usuario.email == aluno.email).limit(1))
+    if usuario_existente:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email já cadastrado."
+        )
+
+    # 2. Verifica o RA antes de criar qualquer registro
+    aluno_existente = await db.scalar(
+        select(models.Aluno.id_usuario).where(models.Aluno.ra == aluno.ra).limit(1))
+    if aluno_existente:
+        raise HTTPException(status_code=400, detail="RA já cadastrado.")
+
+    # 3. Cria Usuario + Aluno na mesma transação
+    senha_hash = await hash_senha_async(SENHA_PADRAO)
+
+    db_usuario = models.Usuario(
+        nome=aluno.nome,
+        email=aluno.email,
+        telefone=aluno.telefone,
+        senha_hash=senha_hash
+    )
+    db.add(db_usuario)
+    await db.flush()
+
+    db_aluno = models.Aluno(
+        id_usuario=db_usuario.id_usuario,
+        ra=aluno.ra,
+        curso=aluno.curso
+    )
+    db.add(db_aluno)
+    await db.commit()
+
+    return {
+        "id_usuario": db_usuario.id_usuario,
+        "nome": db_usuario.nome,
+        "email": db_usuario.email,
+        "telefone": db_usuario.telefone,
+        "ra": db_aluno.ra,
+        "curso": db_aluno.curso
+    }
+
+async def importar_alunos(db: AsyncSession, registros: list[dict], tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO):
+    """
+    Versão async de aluno.importar_alunos (mesmo relatório): as consultas vão
+    pelo AsyncSession e os hashes pelo pool de senhas, sem bloquear o event loop.
+    """
+    erros = []
+    importados = 0
+
+    for inicio in range(0, len(registros), tamanho_lote):
+        validos = validar_registros(registros, inicio, tamanho_lote, erros)
+        lote = await db.run_sync(lambda s: filtrar_conflitos(s, validos, erros))
+        if not lote:
+            continue
+
+        try:
+            senhas_hash = await hash_senhas_async([SENHA_PADRAO] * len(lote))
+        except HTTPException as e:
+            if e.status_code != status.HTTP_503_SERVICE_UNAVAILABLE:
+                raise
+            erros.extend(erros_interrupcao(registros, inicio, tamanho_lote, lote, e.detail))
+            break
+
+        try:
+            await db.run_sync(lambda s: gravar_lote_alunos(s, lote, senhas_hash))
+            await db.commit()
+            importados += len(lote)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            erros.extend(erros_gravacao(lote, e))
+
+    erros.sort(key=lambda erro: erro["linha"])
+    return {"total": len(registros), "importados": importados, "erros": erros}
+
+async def listar_alunos(db: AsyncSession, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+                        curso: str | None = None):
+    """Lista paginada (keyset). Retorna (alunos, cursor da próxima página)."""
+    colunas, chave = ORDENACOES_ALUNO[ordenar]
+    # Lazy-load não é permitido em AsyncSession: mesma projeção da versão síncrona
+    query = select_alunos_response()
+    if curso is not None:
+        query = query.filter(models.Aluno.curso == curso)
+    alunos_db = await db.execute(paginar(query, colunas, cursor, ordenar, limite))
+
+    return fechar_pagina([dict(al) for al in alunos_db.mappings()], chave, ordenar, limite)
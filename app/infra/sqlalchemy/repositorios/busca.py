@@ -0,0 +1,294 @@
+import heapq
+import os
+import threading
+import time
+from itertools import chain
+from typing import NamedTuple
+from sqlalchemy import select, func, literal, union_all, event
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter
+from app.infra.sqlalchemy.config.database import SessionLocal
+from app.infra.sqlalchemy.models import models
+from app.utils.indice_invertido import IndiceInvertido, PREFIXO_MIN, tokenizar
+
+# Reconstrução periódica do índice em memória, para ver escritas de outros processos (0 desliga)
+BUSCA_INDICE_TTL = float(os.getenv("BUSCA_INDICE_TTL", 300))
+# Caracteres da descrição devolvidos em cada resultado
+BUSCA_TRECHO = 200
+TAMANHO_LOTE = 500
+
+
+class Fonte(NamedTuple):
+    id: object
+    nome: object
+    # Coluna indexada além do nome (None = só o nome)
+    texto: object
+    # Coluna devolvida como "descricao" no resultado
+    descricao: object
+    juncao: tuple | None = None
+
+
+FONTES = {
+    "projeto": Fonte(models.Projeto.id_projeto, models.Projeto.nome, models.Projeto.descricao,
+                     models.Projeto.descricao),
+    "empresa": Fonte(models.Empresa.id_empresa, models.Empresa.nome, models.Empresa.descricao,
+                     models.Empresa.descricao),
+    "aluno": Fonte(models.Usuario.id_usuario, models.Usuario.nome, None, models.Aluno.curso,
+                   (models.Aluno, models.Aluno.id_usuario == models.Usuario.id_usuario)),
+}
+
+
+def select_documentos(fonte: Fonte, *colunas):
+    query = select(fonte.id.label("id"), fonte.nome.label("nome"), *colunas)
+    if fonte.juncao is not None:
+        query = query.join(*fonte.juncao)
+    return query
+
+
+class IndiceBusca:
+    """
+    Fallback da busca para bancos sem FULLTEXT (SQLite): um IndiceInvertido
+    por tipo, construído na primeira busca. Commits que alteram projetos,
+    empresas ou alunos neste processo marcam os documentos para recarga na
+    próxima busca (inclusive update/delete de Core filtrados pela chave
+    primária); as demais escritas em massa e o TTL reconstroem o índice inteiro.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._lock_pendentes = threading.Lock()
+        self._indices: dict[str, IndiceInvertido] | None = None
+        self._construido_em = 0.0
+        self._pendentes: set[tuple[str, int]] = set()
+        self._invalido = False
+        self.reconstrucoes = 0
+        self.recargas = 0
+
+    def marcar(self, alterados: set[tuple[str, int]]):
+        with self._lock_pendentes:
+            self._pendentes |= alterados
+
+    def invalidar(self):
+        with self._lock_pendentes:
+            self._invalido = True
+
+    def limpar(self):
+        with self._lock:
+            self._indices = None
+        with self._lock_pendentes:
+            self._pendentes = set()
+            self._invalido = False
+
+    def _construir(self, db: Session):
+        indices = {}
+        for tipo, fonte in FONTES.items():
+            indice = indices[tipo] = IndiceInvertido()
+            texto = fonte.texto.label("texto") if fonte.texto is not None else literal(None).label("texto")
+            for row in db.execute(select_documentos(fonte, texto).execution_options(yield_per=5000)):
+                indice.adicionar(row.id, row.nome, row.texto)
+        return indices
+
+    def _recarregar(self, db: Session, pendentes: set[tuple[str, int]]):
+        for tipo, fonte in FONTES.items():
+            ids = sorted(id_documento for t, id_documento in pendentes if t == tipo)
+            indice = self._indices[tipo]
+            texto = fonte.texto.label("texto") if fonte.texto is not None else literal(None).label("texto")
+            for inicio in range(0, len(ids), TAMANHO_LOTE):
+                lote = ids[inicio:inicio + TAMANHO_LOTE]
+                for id_documento in lote:
+                    indice.remover(id_documento)
+                for row in db.execute(select_documentos(fonte, texto).where(fonte.id.in_(lote))):
+                    indice.adicionar(row.id, row.nome, row.texto)
+
+    def _preparar(self, db: Session):
+        with self._lock_pendentes:
+            pendentes, self._pendentes = self._pendentes, set()
+            invalido, self._invalido = self._invalido, False
+        agora = time.monotonic()
+        reconstruir = self._indices is None or invalido or (self.ttl and agora - self._construido_em >= self.ttl)
+        if not (reconstruir or pendentes):
+            return
+        # A réplica pode ainda não ter os commits que marcaram os pendentes: lê do primário
+        primario = SessionLocal() if db.info.get("leitura") else None
+        try:
+            if reconstruir:
+                _registrar_eventos()
+                self._indices = self._construir(primario or db)
+                self._construido_em = agora
+                self.reconstrucoes += 1
+            else:
+                self._recarregar(primario or db, pendentes)
+                self.recargas += 1
+        except Exception:
+            self.marcar(pendentes)
+            if invalido:
+                self.invalidar()
+            raise
+        finally:
+            if primario is not None:
+                primario.close()
+
+    def buscar(self, db: Session, termos: list[str], tipos: list[str], quantidade: int) -> list[tuple[str, int, float]]:
+        """Os `quantidade` melhores (tipo, id, relevância), na ordem do ORDER BY do MySQL."""
+        with self._lock:
+            self._preparar(db)
+            candidatos = []
+            for tipo in tipos:
+                pontos = self._indices[tipo].buscar(termos)
+                candidatos += [(tipo, id_documento, relevancia)
+                               for id_documento, relevancia in IndiceInvertido.melhores(pontos, quantidade)]
+        return heapq.nsmallest(quantidade, candidatos, key=lambda c: (-c[2], c[0], c[1]))
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            indices = self._indices or {}
+            return {
+                "documentos": {tipo: len(indice) for tipo, indice in indices.items()},
+                "reconstrucoes": self.reconstrucoes,
+                "recargas": self.recargas,
+                "idade_s": round(time.monotonic() - self._construido_em, 1) if indices else None,
+                "ttl_s": self.ttl,
+            }
+
+
+indice_busca = IndiceBusca(BUSCA_INDICE_TTL)
+
+# Classes/tabelas cujas escritas mudam o resultado da busca -> (tipo, atributo do id)
+_CLASSES_BUSCA = {
+    models.Projeto: ("projeto", "id_projeto"),
+    models.Empresa: ("empresa", "id_empresa"),
+    models.Usuario: ("aluno", "id_usuario"),
+    models.Aluno: ("aluno", "id_usuario"),
+}
+_TABELAS_BUSCA = {classe.__table__: fonte for classe, fonte in _CLASSES_BUSCA.items()}
+_eventos_registrados = False
+
+
+def _apos_flush(session, contexto):
+    for objeto in chain(session.new, session.dirty, session.deleted):
+        fonte = _CLASSES_BUSCA.get(type(objeto))
+        if fonte is not None:
+            session.info.setdefault("busca_alterados", set()).add((fonte[0], getattr(objeto, fonte[1])))
+
+
+def _ids_do_criterio(tabela, criterio) -> set[tuple[str, int]] | None:
+    """Documentos de um update/delete filtrado por `pk == x` ou `pk IN (...)`; None se não der para saber."""
+    tipo, atributo = _TABELAS_BUSCA[tabela]
+    if not (isinstance(criterio, BinaryExpression) and isinstance(criterio.right, BindParameter)
+            and getattr(criterio.left, "table", None) == tabela and criterio.left.key == atributo):
+        return None
+    if criterio.operator is operators.eq:
+        return {(tipo, criterio.right.value)}
+    if criterio.operator is operators.in_op:
+        return {(tipo, valor) for valor in criterio.right.value}
+    return None
+
+
+def _ao_executar(estado):
+    if not (estado.is_insert or estado.is_update or estado.is_delete):
+        return
+    tabela = getattr(estado.statement, "table", None)
+    if tabela not in _TABELAS_BUSCA:
+        return
+    ids = None if estado.is_insert else _ids_do_criterio(tabela, estado.statement.whereclause)
+    if ids is None:
+        estado.session.info["busca_invalidar"] = True
+    else:
+        estado.session.info.setdefault("busca_alterados", set()).update(ids)
+
+
+def _apos_commit(session):
+    alterados = session.info.pop("busca_alterados", None)
+    if session.info.pop("busca_invalidar", False):
+        indice_busca.invalidar()
+    elif alterados:
+        indice_busca.marcar(alterados)
+
+
+def _apos_rollback(session):
+    session.info.pop("busca_alterados", None)
+    session.info.pop("busca_invalidar", None)
+
+
+def _registrar_eventos():
+    """Só quando o fallback é usado: com FULLTEXT não há custo extra nas escritas."""
+    global _eventos_registrados
+    if _eventos_registrados:
+        return
+    event.listen(Session, "after_flush", _apos_flush)
+    event.listen(Session, "do_orm_execute", _ao_executar)
+    event.listen(Session, "after_commit", _apos_commit)
+    event.listen(Session, "after_rollback", _apos_rollback)
+    _eventos_registrados = True
+
+
+class RepositorioBusca():
+    """
+    Busca em projetos (nome e descrição), empresas (nome e descrição) e nomes
+    de alunos. Todos os termos precisam casar; termos com PREFIXO_MIN ou mais
+    caracteres casam por prefixo. No MySQL usa os índices FULLTEXT (modo
+    booleano, termos curtos ignorados); nos demais bancos, o índice
+    invertido em memória.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def buscar(self, texto: str, tipos: list[str], limite: int, deslocamento: int = 0) -> tuple[list[dict], bool]:
+        """Retorna (resultados da página, se há próxima página)."""
+        termos = tokenizar(texto)
+        if not termos:
+            return [], False
+        if self.db.get_bind().dialect.name == "mysql":
+            resultados = self._buscar_fulltext(termos, tipos, limite + 1, deslocamento)
+        else:
+            resultados = self._buscar_indice(termos, tipos, limite + 1, deslocamento)
+        return resultados[:limite], len(resultados) > limite
+
+    def _buscar_fulltext(self, termos: list[str], tipos: list[str], quantidade: int, deslocamento: int) -> list[dict]:
+        # Termos curtos não entram no índice (innodb_ft_min_token_size) e, obrigatórios, zerariam a busca
+        consulta = " ".join(f"+{termo}*" for termo in termos if len(termo) >= PREFIXO_MIN)
+        if not consulta:
+            return []
+        partes = []
+        for tipo in tipos:
+            fonte = FONTES[tipo]
+            colunas = (fonte.nome,) if fonte.texto is None else (fonte.nome, fonte.texto)
+            relevancia = match(*colunas, against=consulta).in_boolean_mode()
+            partes.append(select_documentos(
+                fonte,
+                literal(tipo).label("tipo"),
+                func.left(fonte.descricao, BUSCA_TRECHO).label("descricao"),
+                relevancia.label("relevancia"),
+            ).where(relevancia))
+        sq = union_all(*partes).subquery()
+        query = select(sq).order_by(sq.c.relevancia.desc(), sq.c.tipo, sq.c.id).limit(quantidade).offset(deslocamento)
+        return [dict(row._mapping) for row in self.db.execute(query)]
+
+    def _buscar_indice(self, termos: list[str], tipos: list[str], quantidade: int, deslocamento: int) -> list[dict]:
+        melhores = indice_busca.buscar(self.db, termos, tipos, deslocamento + quantidade)[deslocamento:]
+        linhas = {}
+        for tipo in tipos:
+            ids = [id_documento for t, id_documento, _ in melhores if t == tipo]
+            if ids:
+                fonte = FONTES[tipo]
+                for row in self.db.execute(select_documentos(fonte, fonte.descricao.label("descricao"))
+                                           .where(fonte.id.in_(ids))):
+                    linhas[(tipo, row.id)] = row
+        resultados = []
+        for tipo, id_documento, relevancia in melhores:
+            row = linhas.get((tipo, id_documento))
+            if row is None:
+                # Removido depois da última recarga do índice
+                continue
+            resultados.append({
+                "tipo": tipo,
+                "id": id_documento,
+                "nome": row.nome,
+                "descricao": row.descricao[:BUSCA_TRECHO] if row.descricao else row.descricao,
+                "relevancia": round(relevancia, 4),
+            })
+        return resultados
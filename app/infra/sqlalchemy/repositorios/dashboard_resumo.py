@@ -0,0 +1,163 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, insert, func, exists
+from app.infra.sqlalchemy.config.database import SessionLocal
+from app.infra.sqlalchemy.models import models
+from app.utils.semestre import get_current_semester, formatar_semestre_inicial
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+from app.utils.versao_recurso import incrementar_versoes_projetos
+
+# Último semestre para o qual este processo já garantiu o resumo atualizado
+_semestre_sincronizado: int | None = None
+
+TAMANHO_LOTE = 1000
+
+ORDENACOES_DASHBOARD = {
+    "id": ([models.Projeto_Dashboard.id_projeto], lambda r: [r.id_projeto]),
+    "nome": ([models.Projeto_Dashboard.nome_projeto, models.Projeto_Dashboard.id_projeto],
+             lambda r: [r.nome_projeto, r.id_projeto]),
+}
+
+
+def resumo_sincronizado(semestre: int) -> bool:
+    return _semestre_sincronizado == semestre
+
+
+def marcar_resumo_sincronizado(semestre: int):
+    global _semestre_sincronizado
+    _semestre_sincronizado = semestre
+
+
+def select_estado_resumo(semestre: int):
+    """Uma consulta: (há linhas de outro semestre, linhas no resumo, projetos)."""
+    return select(
+        exists().where(models.Projeto_Dashboard.semestre_referencia != semestre).label("desatualizado"),
+        select(func.count()).select_from(models.Projeto_Dashboard).scalar_subquery().label("total_resumo"),
+        select(func.count()).select_from(models.Projeto).scalar_subquery().label("total_projetos"),
+    )
+
+
+def precisa_reconstruir(estado) -> bool:
+    return bool(estado.desatualizado) or estado.total_resumo != estado.total_projetos
+
+
+class RepositorioDashboardResumo():
+    """
+    Mantém a tabela projeto_dashboard, uma linha por projeto com os dados
+    já calculados para o semestre atual. Os repositórios chamam `atualizar`
+    na mesma transação da escrita, o que também incrementa as versões usadas
+    nos ETags; a virada de semestre é tratada em `garantir_sincronizado`,
+    chamado pela leitura.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def atualizar(self, projeto_ids: list[int] | None = None, semestre: int | None = None):
+        """Recalcula o resumo dos projetos informados (ou de todos). Não faz commit."""
+        semestre = semestre or get_current_semester()
+        self.db.flush()
+
+        sq_fase = select(
+            models.Equipe_Projeto.id_projeto,
+            func.min(models.Equipe_Projeto.fase).label("fase")
+        ).filter(
+            models.Equipe_Projeto.semestre == semestre
+        ).group_by(models.Equipe_Projeto.id_projeto).subquery()
+
+        query = select(
+            models.Projeto.id_projeto,
+            models.Projeto.nome,
+            models.Projeto.descricao,
+            models.Projeto.status,
+            models.Projeto.data_ini,
+            models.Projeto.nome_orientador,
+            sq_fase.c.fase
+        ).outerjoin(sq_fase, models.Projeto.id_projeto == sq_fase.c.id_projeto)
+
+        remover = delete(models.Projeto_Dashboard)
+        if projeto_ids is not None:
+            if not projeto_ids:
+                return
+            query = query.filter(models.Projeto.id_projeto.in_(projeto_ids))
+            remover = remover.filter(models.Projeto_Dashboard.id_projeto.in_(projeto_ids))
+
+        self.db.execute(remover)
+        incrementar_versoes_projetos(self.db, projeto_ids)
+
+        # Insert de Core: um executemany por lote. O bulk insert do ORM omite as
+        # chaves None de cada linha (ex.: fase) e quebraria o lote em vários INSERTs
+        insert_resumo = insert(models.Projeto_Dashboard.__table__)
+        lote = []
+        for row in self.db.execute(query):
+            lote.append({
+                "id_projeto": row.id_projeto,
+                "nome_projeto": row.nome,
+                "descricao": row.descricao,
+                "status": row.status,
+                "fase": row.fase,
+                "orientador_tecnico": row.nome_orientador,
+                "semestre_inicial": formatar_semestre_inicial(row.data_ini),
+                "semestre_referencia": semestre
+            })
+            if len(lote) >= TAMANHO_LOTE:
+                self.db.execute(insert_resumo, lote)
+                lote = []
+        if lote:
+            self.db.execute(insert_resumo, lote)
+
+    def remover(self, projeto_id: int):
+        self.db.execute(
+            delete(models.Projeto_Dashboard).filter(models.Projeto_Dashboard.id_projeto == projeto_id))
+        incrementar_versoes_projetos(self.db, [projeto_id])
+
+    def garantir_sincronizado(self):
+        """
+        Na primeira leitura do processo em cada semestre, reconstrói o resumo
+        se ele estiver incompleto ou referir-se a outro semestre (virada).
+        Numa sessão da réplica a reconstrução é feita no primário.
+        """
+        semestre = get_current_semester()
+        if resumo_sincronizado(semestre):
+            return
+
+        if precisa_reconstruir(self.db.execute(select_estado_resumo(semestre)).one()):
+            if self.db.info.get("leitura"):
+                with SessionLocal() as primario:
+                    RepositorioDashboardResumo(primario).atualizar(semestre=semestre)
+                    primario.commit()
+            else:
+                self.atualizar(semestre=semestre)
+                self.db.commit()
+        marcar_resumo_sincronizado(semestre)
+
+    def listar(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+               status: str | None = None, id_empresa: int | None = None, semestre: int | None = None,
+               sincronizar: bool = True):
+        """
+        Página (keyset) do resumo. Retorna (linhas, cursor da próxima página).
+        sincronizar=False: quem chama já garantiu o resumo (caminho async).
+        """
+        if sincronizar:
+            self.garantir_sincronizado()
+        colunas, chave = ORDENACOES_DASHBOARD[ordenar]
+        query = select(
+            models.Projeto_Dashboard.id_projeto,
+            models.Projeto_Dashboard.nome_projeto,
+            models.Projeto_Dashboard.descricao,
+            models.Projeto_Dashboard.status,
+            models.Projeto_Dashboard.fase,
+            models.Projeto_Dashboard.orientador_tecnico,
+            models.Projeto_Dashboard.semestre_inicial
+        )
+        if status is not None:
+            query = query.filter(models.Projeto_Dashboard.status == status)
+        if id_empresa is not None:
+            query = query.filter(exists().where(
+                models.Projeto.id_projeto == models.Projeto_Dashboard.id_projeto,
+                models.Projeto.id_empresa == id_empresa))
+        if semestre is not None:
+            query = query.filter(exists().where(
+                models.Equipe_Projeto.id_projeto == models.Projeto_Dashboard.id_projeto,
+                models.Equipe_Projeto.semestre == semestre))
+        linhas = self.db.execute(paginar(query, colunas, cursor, ordenar, limite)).all()
+        return fechar_pagina(linhas, chave, ordenar, limite)
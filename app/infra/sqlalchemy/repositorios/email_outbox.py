@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func, or_, and_
+from app.infra.sqlalchemy.models import models
+
+
+def agora() -> datetime:
+    return datetime.now().replace(microsecond=0)
+
+
+class RepositorioEmailOutbox():
+    """
+    Acesso à tabela email_outbox. `enfileirar` não faz commit, para que o
+    e-mail seja gravado na mesma transação da alteração que o originou.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enfileirar(self, destinatario: str, assunto: str, corpo: str):
+        momento = agora()
+        email = models.Email_Outbox(destinatario=destinatario,
+                                    assunto=assunto,
+                                    corpo=corpo,
+                                    status="pendente",
+                                    tentativas=0,
+                                    proxima_tentativa=momento,
+                                    criado_em=momento)
+        self.db.add(email)
+        return email
+
+    def reservar_lote(self, limite: int, reserva_expira: int):
+        """
+        Reserva até `limite` e-mails prontos para envio e os retorna.
+        Reservas com mais de `reserva_expira` segundos (worker que caiu no
+        meio do envio) voltam a ser elegíveis. O UPDATE condicional garante
+        que dois processos não reservem o mesmo e-mail.
+        """
+        momento = agora()
+        elegiveis = or_(
+            and_(models.Email_Outbox.status == "pendente",
+                 models.Email_Outbox.proxima_tentativa <= momento),
+            and_(models.Email_Outbox.status == "enviando",
+                 models.Email_Outbox.reservado_em < momento - timedelta(seconds=reserva_expira))
+        )
+        ids = self.db.scalars(
+            select(models.Email_Outbox.id_email)
+            .where(elegiveis)
+            .order_by(models.Email_Outbox.id_email)
+            .limit(limite)
+        ).all()
+        if not ids:
+            return []
+
+        lote = uuid.uuid4().hex
+        self.db.execute(
+            update(models.Email_Outbox)
+            .where(models.Email_Outbox.id_email.in_(ids), elegiveis)
+            .values(status="enviando", reservado_em=momento, lote=lote)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return self.db.scalars(
+            select(models.Email_Outbox)
+            .where(models.Email_Outbox.lote == lote, models.Email_Outbox.status == "enviando")
+            .order_by(models.Email_Outbox.id_email)
+        ).all()
+
+    def marcar_enviado(self, email: models.Email_Outbox):
+        email.status = "enviado"
+        email.tentativas += 1
+        email.enviado_em = agora()
+        email.ultimo_erro = None
+
+    def marcar_falha(self, email: models.Email_Outbox, erro: str, max_tentativas: int, backoff_base: int):
+        """Reagenda com backoff exponencial ou desiste após `max_tentativas`."""
+        email.tentativas += 1
+        email.ultimo_erro = erro[:500]
+        if email.tentativas >= max_tentativas:
+            email.status = "falhou"
+        else:
+            email.status = "pendente"
+            email.proxima_tentativa = agora() + timedelta(seconds=backoff_base * 2 ** (email.tentativas - 1))
+
+    def estatisticas(self) -> dict:
+        """Contagem por status e idade (s) do e-mail pendente mais antigo."""
+        contagem = dict(self.db.execute(
+            select(models.Email_Outbox.status, func.count())
+            .group_by(models.Email_Outbox.status)
+        ).all())
+        mais_antigo = self.db.scalar(
+            select(func.min(models.Email_Outbox.criado_em))
+            .where(models.Email_Outbox.status.in_(["pendente", "enviando"]))
+        )
+        return {
+            "pendentes": contagem.get("pendente", 0),
+            "enviando": contagem.get("enviando", 0),
+            "enviados": contagem.get("enviado", 0),
+            "falhos": contagem.get("falhou", 0),
+            "idade_pendente_mais_antigo": int((agora() - mais_antigo).total_seconds()) if mais_antigo else 0,
+        }
@@ -1,6 +1,18 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.schemas import schemas
 from app.infra.sqlalchemy.models import models
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+from app.utils.resposta_json import colunas_resposta, como_dicts
+from app.utils.versao_recurso import incrementar_versoes_empresa
+
+# Colunas de ordenação (keyset) e a chave correspondente de cada linha
+ORDENACOES_EMPRESA = {
+    "id": ([models.Empresa.id_empresa], lambda e: [e.id_empresa]),
+    "nome": ([models.Empresa.nome, models.Empresa.id_empresa], lambda e: [e.nome, e.id_empresa]),
+}
+# Listagem só de leitura: as colunas de EmpresaResponse, como linhas de Core
+COLUNAS_LISTAGEM_EMPRESA = colunas_resposta(models.Empresa, schemas.EmpresaResponse)
 
 class RepositorioEmpresa():
     
@@ -18,9 +30,15 @@ class RepositorioEmpresa():
         
         return db_empresa
     
-    def listar(self):
-        empresas = self.db.query(models.Empresa).all()
-        return empresas
+    def listar(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id"):
+        """
+        Lista paginada (keyset). Retorna (empresas como dicts no formato de
+        EmpresaResponse, cursor da próxima página); sem entidades no identity map.
+        """
+        colunas, chave = ORDENACOES_EMPRESA[ordenar]
+        query = paginar(select(*COLUNAS_LISTAGEM_EMPRESA), colunas, cursor, ordenar, limite)
+        empresas, proximo_cursor = fechar_pagina(self.db.execute(query).all(), chave, ordenar, limite)
+        return como_dicts(empresas), proximo_cursor
     
     def obter(self, empresa_id: int):
         return self.db.query(models.Empresa).filter(models.Empresa.id_empresa == empresa_id).first()
@@ -34,6 +52,7 @@ class RepositorioEmpresa():
             self.db.query(models.Empresa)\
                 .filter(models.Empresa.id_empresa == empresa_id)\
                 .update(update_data)
+            incrementar_versoes_empresa(self.db, empresa_id)
             self.db.commit()
             
         return self.obter(empresa_id)
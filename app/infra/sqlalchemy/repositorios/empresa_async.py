@@ -0,0 +1,58 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import schemas
+from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.repositorios.empresa import ORDENACOES_EMPRESA, COLUNAS_LISTAGEM_EMPRESA
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+from app.utils.resposta_json import como_dicts
+from app.utils.versao_recurso import incrementar_versoes_empresa
+
+class RepositorioEmpresaAsync():
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def criar(self, empresa: schemas.EmpresaCreate):
+        db_empresa = models.Empresa(nome=empresa.nome,
+                                    cnpj=empresa.cnpj,
+                                    descricao=empresa.descricao)
+
+        self.db.add(db_empresa)
+        await self.db.commit()
+        await self.db.refresh(db_empresa)
+
+        return db_empresa
+
+    async def listar(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id"):
+        """Lista paginada (keyset). Retorna (empresas como dicts, cursor da próxima página)."""
+        colunas, chave = ORDENACOES_EMPRESA[ordenar]
+        linhas = await self.db.execute(paginar(select(*COLUNAS_LISTAGEM_EMPRESA), colunas, cursor, ordenar, limite))
+        empresas, proximo_cursor = fechar_pagina(linhas.all(), chave, ordenar, limite)
+        return como_dicts(empresas), proximo_cursor
+
+    async def obter(self, empresa_id: int):
+        return await self.db.get(models.Empresa, empresa_id)
+
+    async def editar(self, empresa_id: int, empresa: schemas.EmpresaUpdate):
+        """Atualiza os dados de uma empresa."""
+        update_data = empresa.model_dump(exclude_unset=True)
+
+        if update_data:
+            await self.db.execute(
+                update(models.Empresa)
+                .where(models.Empresa.id_empresa == empresa_id)
+                .values(**update_data)
+                .execution_options(synchronize_session="fetch")
+            )
+            await self.db.run_sync(lambda s: incrementar_versoes_empresa(s, empresa_id))
+            await self.db.commit()
+
+        return await self.obter(empresa_id)
+
+    async def remover(self, empresa_id: int):
+        empresa = await self.obter(empresa_id)
+        if empresa:
+            await self.db.delete(empresa)
+            await self.db.commit()
+            return True
+        return False
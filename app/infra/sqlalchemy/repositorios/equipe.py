@@ -1,6 +1,65 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, exists, insert
 from app.schemas import schemas
 from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.repositorios.dashboard_resumo import RepositorioDashboardResumo
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+from app.utils.versao_recurso import incrementar_versoes_equipe, incrementar_versoes, chave_projeto
+from app.utils.acesso_projeto import cache_acesso_projeto, invalidar_membros_equipe, select_membros_da_equipe
+from app.utils.resposta_json import colunas_resposta, como_dicts
+
+# Colunas de ordenação (keyset) e a chave correspondente de cada linha
+ORDENACOES_EQUIPE = {
+    "id": ([models.Equipe.id_equipe], lambda e: [e.id_equipe]),
+    "nome": ([models.Equipe.nome, models.Equipe.id_equipe], lambda e: [e.nome, e.id_equipe]),
+}
+# Listagem só de leitura: as colunas de EquipeResponse, como linhas de Core
+COLUNAS_LISTAGEM_EQUIPE = colunas_resposta(models.Equipe, schemas.EquipeResponse)
+
+
+def filtrar_equipes(query, id_projeto: int | None = None, semestre: int | None = None):
+    """Restringe às equipes relacionadas ao projeto e/ou semestre informados."""
+    if id_projeto is None and semestre is None:
+        return query
+    condicoes = [models.Equipe_Projeto.id_equipe == models.Equipe.id_equipe]
+    if id_projeto is not None:
+        condicoes.append(models.Equipe_Projeto.id_projeto == id_projeto)
+    if semestre is not None:
+        condicoes.append(models.Equipe_Projeto.semestre == semestre)
+    return query.filter(exists().where(*condicoes))
+
+
+def select_membros_por_equipe(equipe_id: int):
+    return select(
+        models.Membro_Equipe.id_equipe,
+        models.Membro_Equipe.id_usuario
+    ).where(models.Membro_Equipe.id_equipe == equipe_id).order_by(models.Membro_Equipe.id_usuario)
+
+
+def classificar_membros_lote(id_equipe: int, id_usuarios: list[int], alunos: set[int], membros: set[int]):
+    """Retorna (ids a inserir, relatório por id) a partir das validações em lote."""
+    resultados = []
+    a_inserir = []
+    vistos = set()
+    for user_id in id_usuarios:
+        if user_id in vistos:
+            situacao = schemas.StatusMembroLote.DUPLICADO
+        elif user_id not in alunos:
+            situacao = schemas.StatusMembroLote.NAO_ALUNO
+        elif user_id in membros:
+            situacao = schemas.StatusMembroLote.JA_MEMBRO
+        else:
+            situacao = schemas.StatusMembroLote.ADICIONADO
+            a_inserir.append(user_id)
+        vistos.add(user_id)
+        resultados.append({"id_usuario": user_id, "status": situacao})
+
+    return a_inserir, {
+        "id_equipe": id_equipe,
+        "adicionados": len(a_inserir),
+        "rejeitados": len(resultados) - len(a_inserir),
+        "resultados": resultados
+    }
 
 
 class RepositorioEquipe():
@@ -16,8 +75,17 @@ class RepositorioEquipe():
         self.db.refresh(db_equipe)
         return db_equipe
 
-    def listar_equipes(self):
-        return self.db.query(models.Equipe).all()
+    def listar_equipes(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+                       id_projeto: int | None = None, semestre: int | None = None):
+        """
+        Lista paginada (keyset). Retorna (equipes como dicts no formato de
+        EquipeResponse, cursor da próxima página); sem entidades no identity map.
+        """
+        colunas, chave = ORDENACOES_EQUIPE[ordenar]
+        query = filtrar_equipes(select(*COLUNAS_LISTAGEM_EQUIPE), id_projeto, semestre)
+        linhas = self.db.execute(paginar(query, colunas, cursor, ordenar, limite)).all()
+        equipes, proximo_cursor = fechar_pagina(linhas, chave, ordenar, limite)
+        return como_dicts(equipes), proximo_cursor
 
     def obter_equipe(self, equipe_id: int):
         return self.db.query(models.Equipe).filter(models.Equipe.id_equipe == equipe_id).first()
@@ -33,8 +101,11 @@ class RepositorioEquipe():
     def remover_equipe(self, equipe_id: int):
         equipe = self.obter_equipe(equipe_id)
         if equipe:
+            membros = self.db.scalars(select_membros_da_equipe(equipe_id)).all()
+            incrementar_versoes_equipe(self.db, equipe_id)
             self.db.delete(equipe)
             self.db.commit()
+            cache_acesso_projeto.invalidar(membros)
             return True
         return False
 
@@ -42,19 +113,27 @@ class RepositorioEquipe():
     def adicionar_membro(self, membro: schemas.MembroEquipeCreate):
         db_membro = models.Membro_Equipe(**membro.model_dump())
         self.db.add(db_membro)
+        incrementar_versoes_equipe(self.db, membro.id_equipe)
         self.db.commit()
+        cache_acesso_projeto.invalidar([membro.id_usuario])
         self.db.refresh(db_membro)
         return db_membro
 
     def listar_membros_por_equipe(self, equipe_id: int):
-        return self.db.query(models.Membro_Equipe).filter(models.Membro_Equipe.id_equipe == equipe_id).all()
+        # Projeção de colunas (sem entidades no identity map), no formato de MembroEquipeResponse
+        membros = self.db.execute(
+            select_membros_por_equipe(equipe_id)
+        ).mappings()
+        return [dict(m) for m in membros]
 
     def remover_membro(self, id_equipe: int, id_usuario: int):
         membro = self.db.query(models.Membro_Equipe).filter_by(
             id_equipe=id_equipe, id_usuario=id_usuario).first()
         if membro:
             self.db.delete(membro)
+            incrementar_versoes_equipe(self.db, id_equipe)
             self.db.commit()
+            cache_acesso_projeto.invalidar([id_usuario])
             return True
         return False
 
@@ -63,7 +142,9 @@ class RepositorioEquipe():
         db_equipe_projeto = models.Equipe_Projeto(
             **equipe_projeto.model_dump())
         self.db.add(db_equipe_projeto)
+        RepositorioDashboardResumo(self.db).atualizar([db_equipe_projeto.id_projeto])
         self.db.commit()
+        invalidar_membros_equipe(self.db, equipe_projeto.id_equipe)
         self.db.refresh(db_equipe_projeto)
         return db_equipe_projeto
 
@@ -73,6 +154,7 @@ class RepositorioEquipe():
             self.db.query(models.Equipe_Projeto).filter_by(
                 id_equipe=id_equipe, id_projeto=id_projeto
             ).update(update_data)
+            RepositorioDashboardResumo(self.db).atualizar([id_projeto])
             self.db.commit()
         return self.db.query(models.Equipe_Projeto).filter_by(id_equipe=id_equipe, id_projeto=id_projeto).first()
 
@@ -81,7 +163,9 @@ class RepositorioEquipe():
             id_equipe=id_equipe, id_projeto=id_projeto).first()
         if relacionamento:
             self.db.delete(relacionamento)
+            RepositorioDashboardResumo(self.db).atualizar([id_projeto])
             self.db.commit()
+            invalidar_membros_equipe(self.db, id_equipe)
             return True
         return False
     
@@ -89,6 +173,7 @@ class RepositorioEquipe():
     def definir_lider(self, lideranca: schemas.LiderancaCreate):
         db_lideranca = models.Lideranca(**lideranca.model_dump())
         self.db.add(db_lideranca)
+        incrementar_versoes(self.db, [chave_projeto(lideranca.id_projeto)])
         self.db.commit()
         self.db.refresh(db_lideranca)
         return db_lideranca
@@ -101,21 +186,50 @@ class RepositorioEquipe():
             id_projeto=id_projeto, id_usuario=id_usuario, semestre=semestre).first()
         if lider:
             self.db.delete(lider)
+            incrementar_versoes(self.db, [chave_projeto(id_projeto)])
             self.db.commit()
             return True
         return False
 
     # --- Orientador Projeto ---
+    def validar_membros(self, id_equipe: int, id_usuarios: list[int]) -> tuple[set[int], set[int]]:
+        """
+        Validação em lote: retorna (ids que são alunos, ids que já são membros
+        da equipe) com duas consultas IN, independente da quantidade de ids.
+        """
+        if not id_usuarios:
+            return set(), set()
+        alunos = set(self.db.scalars(
+            select(models.Aluno.id_usuario).where(models.Aluno.id_usuario.in_(id_usuarios))
+        ).all())
+        membros = set(self.db.scalars(
+            select(models.Membro_Equipe.id_usuario).where(
+                models.Membro_Equipe.id_equipe == id_equipe,
+                models.Membro_Equipe.id_usuario.in_(id_usuarios)
+            )
+        ).all())
+        return alunos, membros
+
     def adicionar_membros(self, id_equipe: int, id_usuarios: list[int]):
-        membros_adicionados = []
-        for user_id in id_usuarios:
-            db_membro = models.Membro_Equipe(id_equipe=id_equipe, id_usuario=user_id)
-            self.db.add(db_membro)
+        """Insere todos os membros com um único executemany e um commit."""
+        membros_adicionados = [{"id_equipe": id_equipe, "id_usuario": user_id} for user_id in id_usuarios]
+        if membros_adicionados:
+            self.db.execute(insert(models.Membro_Equipe), membros_adicionados)
+            incrementar_versoes_equipe(self.db, id_equipe)
             self.db.commit()
-            self.db.refresh(db_membro)
-            membros_adicionados.append(db_membro)
+            cache_acesso_projeto.invalidar(id_usuarios)
         return membros_adicionados
 
+    def adicionar_membros_em_lote(self, id_equipe: int, id_usuarios: list[int]):
+        """
+        Adiciona os ids válidos numa única transação e devolve o resultado por id
+        (adicionado, nao_aluno, ja_membro ou duplicado na própria requisição).
+        """
+        alunos, membros = self.validar_membros(id_equipe, id_usuarios)
+        a_inserir, relatorio = classificar_membros_lote(id_equipe, id_usuarios, alunos, membros)
+        self.adicionar_membros(id_equipe, a_inserir)
+        return relatorio
+
     def listar_orientadores_por_projeto(self, projeto_id: int):
         return self.db.query(models.Orientador_Projeto).filter(models.Orientador_Projeto.id_projeto == projeto_id).all()
 
@@ -0,0 +1,200 @@
+from sqlalchemy import select, update, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import schemas
+from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.repositorios.dashboard_resumo import RepositorioDashboardResumo
+from app.infra.sqlalchemy.repositorios.equipe import (
+    ORDENACOES_EQUIPE, COLUNAS_LISTAGEM_EQUIPE, filtrar_equipes, select_membros_por_equipe,
+    classificar_membros_lote
+)
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+from app.utils.resposta_json import como_dicts
+from app.utils.versao_recurso import incrementar_versoes_equipe, incrementar_versoes, chave_projeto
+from app.utils.acesso_projeto import cache_acesso_projeto, select_membros_da_equipe
+
+
+class RepositorioEquipeAsync():
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # --- Equipe ---
+    async def criar_equipe(self, equipe: schemas.EquipeCreate):
+        db_equipe = models.Equipe(nome=equipe.nome)
+        self.db.add(db_equipe)
+        await self.db.commit()
+        await self.db.refresh(db_equipe)
+        return db_equipe
+
+    async def listar_equipes(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+                             id_projeto: int | None = None, semestre: int | None = None):
+        """Lista paginada (keyset). Retorna (equipes como dicts, cursor da próxima página)."""
+        colunas, chave = ORDENACOES_EQUIPE[ordenar]
+        query = filtrar_equipes(select(*COLUNAS_LISTAGEM_EQUIPE), id_projeto, semestre)
+        linhas = await self.db.execute(paginar(query, colunas, cursor, ordenar, limite))
+        equipes, proximo_cursor = fechar_pagina(linhas.all(), chave, ordenar, limite)
+        return como_dicts(equipes), proximo_cursor
+
+    async def obter_equipe(self, equipe_id: int):
+        return await self.db.get(models.Equipe, equipe_id)
+
+    async def editar_equipe(self, equipe_id: int, equipe: schemas.EquipeUpdate):
+        update_data = equipe.model_dump(exclude_unset=True)
+        if update_data:
+            await self.db.execute(
+                update(models.Equipe)
+                .where(models.Equipe.id_equipe == equipe_id)
+                .values(**update_data)
+                .execution_options(synchronize_session="fetch")
+            )
+            await self.db.commit()
+        return await self.obter_equipe(equipe_id)
+
+    async def remover_equipe(self, equipe_id: int):
+        equipe = await self.obter_equipe(equipe_id)
+        if equipe:
+            membros = (await self.db.scalars(select_membros_da_equipe(equipe_id))).all()
+            await self.db.run_sync(lambda s: incrementar_versoes_equipe(s, equipe_id))
+            await self.db.delete(equipe)
+            await self.db.commit()
+            cache_acesso_projeto.invalidar(membros)
+            return True
+        return False
+
+    async def invalidar_membros_equipe(self, id_equipe: int):
+        cache_acesso_projeto.invalidar((await self.db.scalars(select_membros_da_equipe(id_equipe))).all())
+
+    # --- Membro Equipe ---
+    async def adicionar_membro(self, membro: schemas.MembroEquipeCreate):
+        db_membro = models.Membro_Equipe(**membro.model_dump())
+        self.db.add(db_membro)
+        await self.db.run_sync(lambda s: incrementar_versoes_equipe(s, membro.id_equipe))
+        await self.db.commit()
+        cache_acesso_projeto.invalidar([membro.id_usuario])
+        await self.db.refresh(db_membro)
+        return db_membro
+
+    async def listar_membros_por_equipe(self, equipe_id: int):
+        membros = await self.db.execute(select_membros_por_equipe(equipe_id))
+        return [dict(m) for m in membros.mappings()]
+
+    async def remover_membro(self, id_equipe: int, id_usuario: int):
+        membro = await self.db.get(models.Membro_Equipe, (id_equipe, id_usuario))
+        if membro:
+            await self.db.delete(membro)
+            await self.db.run_sync(lambda s: incrementar_versoes_equipe(s, id_equipe))
+            await self.db.commit()
+            cache_acesso_projeto.invalidar([id_usuario])
+            return True
+        return False
+
+    # --- Equipe Projeto ---
+    async def relacionar_projeto(self, equipe_projeto: schemas.EquipeProjetoCreate):
+        db_equipe_projeto = models.Equipe_Projeto(
+            **equipe_projeto.model_dump())
+        self.db.add(db_equipe_projeto)
+        id_projeto = db_equipe_projeto.id_projeto
+        await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).atualizar([id_projeto]))
+        await self.db.commit()
+        await self.invalidar_membros_equipe(equipe_projeto.id_equipe)
+        await self.db.refresh(db_equipe_projeto)
+        return db_equipe_projeto
+
+    async def editar_relacionamento_projeto(self, id_equipe: int, id_projeto: int, equipe_projeto: schemas.EquipeProjetoUpdate):
+        update_data = equipe_projeto.model_dump(exclude_unset=True)
+        if update_data:
+            await self.db.execute(
+                update(models.Equipe_Projeto)
+                .filter_by(id_equipe=id_equipe, id_projeto=id_projeto)
+                .values(**update_data)
+                .execution_options(synchronize_session="fetch")
+            )
+            await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).atualizar([id_projeto]))
+            await self.db.commit()
+        return await self.db.scalar(
+            select(models.Equipe_Projeto).filter_by(id_equipe=id_equipe, id_projeto=id_projeto).limit(1))
+
+    async def remover_relacionamento_projeto(self, id_equipe: int, id_projeto: int):
+        relacionamento = await self.db.scalar(
+            select(models.Equipe_Projeto).filter_by(id_equipe=id_equipe, id_projeto=id_projeto).limit(1))
+        if relacionamento:
+            await self.db.delete(relacionamento)
+            await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).atualizar([id_projeto]))
+            await self.db.commit()
+            await self.invalidar_membros_equipe(id_equipe)
+            return True
+        return False
+
+    # --- Liderança ---
+    async def definir_lider(self, lideranca: schemas.LiderancaCreate):
+        db_lideranca = models.Lideranca(**lideranca.model_dump())
+        self.db.add(db_lideranca)
+        await self.db.run_sync(lambda s: incrementar_versoes(s, [chave_projeto(lideranca.id_projeto)]))
+        await self.db.commit()
+        await self.db.refresh(db_lideranca)
+        return db_lideranca
+
+    async def listar_lideres_por_projeto(self, projeto_id: int):
+        lideres = await self.db.scalars(
+            select(models.Lideranca).where(models.Lideranca.id_projeto == projeto_id))
+        return lideres.all()
+
+    async def remover_lider(self, id_projeto: int, id_usuario: int, semestre: int):
+        lider = await self.db.get(models.Lideranca, (id_projeto, id_usuario, semestre))
+        if lider:
+            await self.db.delete(lider)
+            await self.db.run_sync(lambda s: incrementar_versoes(s, [chave_projeto(id_projeto)]))
+            await self.db.commit()
+            return True
+        return False
+
+    # --- Orientador Projeto ---
+    async def validar_membros(self, id_equipe: int, id_usuarios: list[int]) -> tuple[set[int], set[int]]:
+        """Versão async de RepositorioEquipe.validar_membros (duas consultas IN)."""
+        if not id_usuarios:
+            return set(), set()
+        alunos = set((await self.db.scalars(
+            select(models.Aluno.id_usuario).where(models.Aluno.id_usuario.in_(id_usuarios))
+        )).all())
+        membros = set((await self.db.scalars(
+            select(models.Membro_Equipe.id_usuario).where(
+                models.Membro_Equipe.id_equipe == id_equipe,
+                models.Membro_Equipe.id_usuario.in_(id_usuarios)
+            )
+        )).all())
+        return alunos, membros
+
+    async def adicionar_membros(self, id_equipe: int, id_usuarios: list[int]):
+        membros_adicionados = [{"id_equipe": id_equipe, "id_usuario": user_id} for user_id in id_usuarios]
+        if membros_adicionados:
+            await self.db.execute(insert(models.Membro_Equipe), membros_adicionados)
+            await self.db.run_sync(lambda s: incrementar_versoes_equipe(s, id_equipe))
+            await self.db.commit()
+            cache_acesso_projeto.invalidar(id_usuarios)
+        return membros_adicionados
+
+    async def adicionar_membros_em_lote(self, id_equipe: int, id_usuarios: list[int]):
+        alunos, membros = await self.validar_membros(id_equipe, id_usuarios)
+        a_inserir, relatorio = classificar_membros_lote(id_equipe, id_usuarios, alunos, membros)
+        await self.adicionar_membros(id_equipe, a_inserir)
+        return relatorio
+
+    async def adicionar_orientador_projeto(self, orientador: schemas.OrientadorProjetoCreate):
+        db_orientador = models.Orientador_Projeto(**orientador.model_dump())
+        self.db.add(db_orientador)
+        await self.db.commit()
+        await self.db.refresh(db_orientador)
+        return db_orientador
+
+    async def listar_orientadores_por_projeto(self, projeto_id: int):
+        orientadores = await self.db.scalars(
+            select(models.Orientador_Projeto).where(models.Orientador_Projeto.id_projeto == projeto_id))
+        return orientadores.all()
+
+    async def remover_orientador_projeto(self, id_projeto: int, id_usuario: int, id_tipo_orientador: int):
+        orientador = await self.db.get(models.Orientador_Projeto, (id_projeto, id_usuario, id_tipo_orientador))
+        if orientador:
+            await self.db.delete(orientador)
+            await self.db.commit()
+            return True
+        return False
@@ -1,18 +1,155 @@
 from sqlalchemy.orm import Session, aliased
 from app.schemas import schemas
 from app.infra.sqlalchemy.models import models
-from sqlalchemy import select, func
+from app.infra.sqlalchemy.repositorios.dashboard_resumo import RepositorioDashboardResumo
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+from app.utils.acesso_projeto import cache_acesso_projeto
+from app.utils.resposta_json import colunas_resposta, como_dicts
+from app.utils.semestre import formatar_semestre_inicial
+from sqlalchemy import select, func, exists, insert
+from fastapi import HTTPException, status
 from datetime import datetime
 
+# Colunas de ordenação (keyset) e a chave correspondente de cada linha
+ORDENACOES_PROJETO = {
+    "id": ([models.Projeto.id_projeto], lambda p: [p.id_projeto]),
+    "nome": ([models.Projeto.nome, models.Projeto.id_projeto], lambda p: [p.nome, p.id_projeto]),
+}
+# Listagem só de leitura: as colunas de ProjetoResponse, como linhas de Core
+COLUNAS_LISTAGEM_PROJETO = colunas_resposta(models.Projeto, schemas.ProjetoResponse)
+
+
+def ids_alunos_invalidos(ids_validos, ids_informados: list[int]) -> list[int]:
+    """Ids informados que não correspondem a um Aluno, na ordem recebida."""
+    validos = set(ids_validos)
+    return [a_id for a_id in ids_informados if a_id not in validos]
+
+
+def filtrar_projetos(query, status: str | None = None, id_empresa: int | None = None, semestre: int | None = None):
+    """Filtros comuns das listagens de projeto (semestre = teve equipe naquele semestre)."""
+    if status is not None:
+        query = query.filter(models.Projeto.status == status)
+    if id_empresa is not None:
+        query = query.filter(models.Projeto.id_empresa == id_empresa)
+    if semestre is not None:
+        query = query.filter(exists().where(
+            models.Equipe_Projeto.id_projeto == models.Projeto.id_projeto,
+            models.Equipe_Projeto.semestre == semestre))
+    return query
+
+
+def select_projeto_completo(projeto_id: int, semestre: int):
+    """Projeto + empresa + fase e equipe do semestre, em uma única linha."""
+    sq_equipe = select(
+        models.Equipe_Projeto.id_equipe
+    ).filter(
+        models.Equipe_Projeto.id_projeto == projeto_id,
+        models.Equipe_Projeto.semestre == semestre
+    ).order_by(models.Equipe_Projeto.id_equipe).limit(1).scalar_subquery()
+
+    sq_fase = select(
+        models.Equipe_Projeto.fase
+    ).filter(
+        models.Equipe_Projeto.id_projeto == projeto_id,
+        models.Equipe_Projeto.semestre == semestre
+    ).order_by(models.Equipe_Projeto.id_equipe).limit(1).scalar_subquery()
+
+    return select(
+        models.Projeto.id_projeto,
+        models.Projeto.nome.label("nome_projeto"),
+        models.Projeto.descricao,
+        models.Projeto.status,
+        models.Projeto.data_ini,
+        models.Empresa.nome.label("empresa_demandante"),
+        models.Projeto.nome_orientador.label("orientador_tecnico"),
+        sq_fase.label("fase"),
+        sq_equipe.label("id_equipe")
+    ).join(
+        models.Empresa, models.Projeto.id_empresa == models.Empresa.id_empresa
+    ).filter(models.Projeto.id_projeto == projeto_id).limit(1)
+
+
+def select_membros_projeto(projeto_id: int, semestre: int):
+    """
+    Membros de todas as equipes do projeto no semestre. A liderança é
+    resolvida no próprio SQL (outer join pela chave primária de Lideranca).
+    """
+    return select(
+        models.Membro_Equipe.id_equipe,
+        models.Usuario.id_usuario,
+        models.Usuario.nome,
+        models.Usuario.email,
+        models.Usuario.telefone,
+        models.Aluno.curso,
+        models.Lideranca.id_usuario.is_not(None).label("is_lider")
+    ).join(
+        models.Membro_Equipe, models.Usuario.id_usuario == models.Membro_Equipe.id_usuario
+    ).join(
+        models.Equipe_Projeto, models.Equipe_Projeto.id_equipe == models.Membro_Equipe.id_equipe
+    ).outerjoin(
+        models.Aluno, models.Usuario.id_usuario == models.Aluno.id_usuario
+    ).outerjoin(
+        models.Lideranca,
+        (models.Lideranca.id_projeto == projeto_id)
+        & (models.Lideranca.id_usuario == models.Usuario.id_usuario)
+        & (models.Lideranca.semestre == semestre)
+    ).filter(
+        models.Equipe_Projeto.id_projeto == projeto_id,
+        models.Equipe_Projeto.semestre == semestre
+    ).order_by(models.Membro_Equipe.id_equipe, models.Usuario.nome, models.Usuario.id_usuario)
+
+
+def montar_dashboard_completo(projeto, membros, semestre: int) -> dict:
+    """
+    Mesmo conteúdo de get_dashboard_details (alunos de todas as equipes do
+    semestre) mais os membros da equipe do projeto com o indicador de líder.
+    """
+    return {
+        "id_projeto": projeto.id_projeto,
+        "nome_projeto": projeto.nome_projeto,
+        "descricao": projeto.descricao,
+        "status": projeto.status,
+        "orientador_tecnico": projeto.orientador_tecnico,
+        "empresa_demandante": projeto.empresa_demandante,
+        "fase": projeto.fase,
+        "semestre_inicial": formatar_semestre_inicial(projeto.data_ini),
+        "alunos": [membro.nome for membro in membros],
+        "semestre": semestre,
+        "equipe": [
+            {
+                "id_usuario": membro.id_usuario,
+                "nome": membro.nome,
+                "email": membro.email,
+                "telefone": membro.telefone,
+                "curso": membro.curso,
+                "is_lider": bool(membro.is_lider)
+            }
+            for membro in membros if membro.id_equipe == projeto.id_equipe
+        ]
+    }
+
 class RepositorioProjeto():
     
     def __init__(self, db: Session):
         self.db = db    
        
     def criar_projeto_completo(self, projeto_data: schemas.ProjetoCreate):
-        
-        if not all(self.db.query(models.Aluno).filter(models.Aluno.id_usuario == a_id).first() for a_id in projeto_data.id_alunos_participantes):
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Alguns IDs de alunos são inválidos ou não são alunos.")
+        """
+        Cria Projeto + Equipe + Equipe_Projeto + membros numa única transação,
+        com número fixo de round trips independente do tamanho da equipe.
+        """
+        # Ids únicos, preservando a ordem informada
+        ids_alunos = list(dict.fromkeys(projeto_data.id_alunos_participantes))
+
+        # Uma única consulta IN para validar todos os alunos
+        ids_invalidos = ids_alunos_invalidos(self.db.scalars(
+            select(models.Aluno.id_usuario).where(models.Aluno.id_usuario.in_(ids_alunos))
+        ).all() if ids_alunos else [], ids_alunos)
+        if ids_invalidos:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Alguns IDs de alunos são inválidos ou não são alunos: {ids_invalidos}"
+            )
         
         db_projeto = models.Projeto(
             nome=projeto_data.nome,
@@ -43,18 +180,31 @@ class RepositorioProjeto():
         )
         self.db.add(db_equipe_projeto)
         
-        for aluno_id in projeto_data.id_alunos_participantes:
-            db_membro = models.Membro_Equipe(id_equipe=db_equipe.id_equipe, id_usuario=aluno_id)
-            self.db.add(db_membro)
-    
+        # Inserção em lote (executemany) de todos os membros
+        if ids_alunos:
+            self.db.execute(
+                insert(models.Membro_Equipe),
+                [{"id_equipe": db_equipe.id_equipe, "id_usuario": aluno_id} for aluno_id in ids_alunos]
+            )
+
+        RepositorioDashboardResumo(self.db).atualizar([db_projeto.id_projeto])
         self.db.commit()
+        cache_acesso_projeto.invalidar(ids_alunos)
         self.db.refresh(db_projeto)
         
         return db_projeto
     
-    def listar(self):
-        projetos = self.db.query(models.Projeto).all()
-        return projetos
+    def listar(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+               status: str | None = None, id_empresa: int | None = None, semestre: int | None = None):
+        """
+        Lista paginada (keyset). Retorna (projetos como dicts no formato de
+        ProjetoResponse, cursor da próxima página); sem entidades no identity map.
+        """
+        colunas, chave = ORDENACOES_PROJETO[ordenar]
+        query = filtrar_projetos(select(*COLUNAS_LISTAGEM_PROJETO), status, id_empresa, semestre)
+        linhas = self.db.execute(paginar(query, colunas, cursor, ordenar, limite)).all()
+        projetos, proximo_cursor = fechar_pagina(linhas, chave, ordenar, limite)
+        return como_dicts(projetos), proximo_cursor
     
     def obter(self, projeto_id: int):
         return self.db.query(models.Projeto).filter(models.Projeto.id_projeto == projeto_id).first()
@@ -66,6 +216,7 @@ class RepositorioProjeto():
             self.db.query(models.Projeto)\
                 .filter(models.Projeto.id_projeto == projeto_id)\
                 .update(update_data)
+            RepositorioDashboardResumo(self.db).atualizar([projeto_id])
             self.db.commit()
             
         return self.obter(projeto_id)
@@ -73,64 +224,98 @@ class RepositorioProjeto():
     def remover(self, projeto_id: int):
         projeto = self.db.query(models.Projeto).filter(models.Projeto.id_projeto == projeto_id).first()
         if projeto:
+            RepositorioDashboardResumo(self.db).remover(projeto_id)
             self.db.delete(projeto)
             self.db.commit()
             return True
         return False
 
-    def listar_projetos_dashboard(self):
+    def listar_projetos_dashboard(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+                                  status: str | None = None, id_empresa: int | None = None, semestre: int | None = None):
         """
         Lista para o dashboard (VISÃO GERAL).
         Removemos Empresa e Alunos desta lista conforme solicitado.
+        Lê da tabela de resumo projeto_dashboard (uma linha por projeto),
+        mantida pelas escritas dos repositórios e pela virada de semestre.
+        Retorna (itens, cursor da próxima página).
         """
-        
-        # 1. Calcula o semestre atual (YYYY1 ou YYYY2)
-        now = datetime.now()
-        year = now.year
-        month = now.month
-        semestre_atual = int(f"{year}{1 if 1 <= month <= 6 else 2}")
+        linhas, proximo_cursor = RepositorioDashboardResumo(self.db).listar(
+            cursor, limite, ordenar, status, id_empresa, semestre)
+        return [
+            {
+                "id_projeto": row.id_projeto,
+                "nome_projeto": row.nome_projeto,
+                "descricao": row.descricao,
+                "status": row.status,
+                "fase": row.fase,
+                "orientador_tecnico": row.orientador_tecnico,
+                "semestre_inicial": row.semestre_inicial
+            }
+            for row in linhas
+        ], proximo_cursor
+    
 
-        # 5. Subquery para buscar a Fase do semestre atual
+    def exportar_dashboard(self, semestre_atual: int, tamanho_lote: int = 1000):
+        """
+        Gera (um dict por projeto) os dados do dashboard detalhado: empresa,
+        fase do semestre e nomes dos alunos. Lê com cursor do lado do servidor
+        (stream_results + yield_per), então a memória não cresce com o total.
+        """
         sq_fase = select(
             models.Equipe_Projeto.id_projeto,
-            models.Equipe_Projeto.fase
+            func.min(models.Equipe_Projeto.fase).label("fase")
         ).filter(
             models.Equipe_Projeto.semestre == semestre_atual
-        ).distinct(models.Equipe_Projeto.id_projeto).subquery()
+        ).group_by(models.Equipe_Projeto.id_projeto).subquery()
 
-        # 6. Query Principal (SEM EMPRESA)
-        query_results = self.db.query(
+        query = select(
             models.Projeto.id_projeto,
             models.Projeto.nome.label("nome_projeto"),
             models.Projeto.descricao,
             models.Projeto.status,
             models.Projeto.data_ini,
+            models.Projeto.nome_orientador.label("orientador_tecnico"),
+            models.Empresa.nome.label("empresa_demandante"),
             sq_fase.c.fase,
-            models.Projeto.nome_orientador.label("orientador_tecnico")
-        ).outerjoin( 
+            models.Usuario.nome.label("nome_aluno")
+        ).outerjoin(
+            models.Empresa, models.Projeto.id_empresa == models.Empresa.id_empresa
+        ).outerjoin(
             sq_fase, models.Projeto.id_projeto == sq_fase.c.id_projeto
-        ).distinct(models.Projeto.id_projeto).all()
+        ).outerjoin(
+            models.Equipe_Projeto,
+            (models.Equipe_Projeto.id_projeto == models.Projeto.id_projeto)
+            & (models.Equipe_Projeto.semestre == semestre_atual)
+        ).outerjoin(
+            models.Membro_Equipe, models.Membro_Equipe.id_equipe == models.Equipe_Projeto.id_equipe
+        ).outerjoin(
+            models.Usuario, models.Usuario.id_usuario == models.Membro_Equipe.id_usuario
+        ).order_by(models.Projeto.id_projeto, models.Usuario.nome)
 
-        # 7. Processa os resultados
-        response_list = []
-        for row in query_results:
-            semestre_inicial_str = None
-            if row.data_ini:
-                sem = 1 if 1 <= row.data_ini.month <= 6 else 2
-                semestre_inicial_str = f"{row.data_ini.year}.{sem}"
-            
-            response_list.append({
-                "id_projeto": row.id_projeto,
-                "nome_projeto": row.nome_projeto,
-                "descricao": row.descricao,
-                "status": row.status,
-                "fase": row.fase,
-                "orientador_tecnico": row.orientador_tecnico,
-                "semestre_inicial": semestre_inicial_str
-            })
+        resultado = self.db.execute(
+            query.execution_options(stream_results=True, yield_per=tamanho_lote))
 
-        return response_list
-    
+        # As linhas vêm ordenadas por projeto: agrupa as consecutivas
+        atual = None
+        for row in resultado:
+            if atual is None or atual["id_projeto"] != row.id_projeto:
+                if atual is not None:
+                    yield atual
+                atual = {
+                    "id_projeto": row.id_projeto,
+                    "nome_projeto": row.nome_projeto,
+                    "descricao": row.descricao,
+                    "status": row.status,
+                    "orientador_tecnico": row.orientador_tecnico,
+                    "empresa_demandante": row.empresa_demandante,
+                    "fase": row.fase,
+                    "semestre_inicial": formatar_semestre_inicial(row.data_ini),
+                    "alunos": []
+                }
+            if row.nome_aluno is not None:
+                atual["alunos"].append(row.nome_aluno)
+        if atual is not None:
+            yield atual
 
     def get_dashboard_details(self, projeto_id: int, semestre_atual: int):
         """
@@ -195,7 +380,15 @@ class RepositorioProjeto():
         
         return response_data
 
-    
+
+    def get_dashboard_completo(self, projeto_id: int, semestre: int):
+        """Detalhes + equipe (com líderes) + fase do semestre em duas consultas."""
+        projeto = self.db.execute(select_projeto_completo(projeto_id, semestre)).first()
+        if not projeto:
+            return None
+        membros = self.db.execute(select_membros_projeto(projeto_id, semestre)).all()
+        return montar_dashboard_completo(projeto, membros, semestre)
+
     def get_dashboard_team(self, projeto_id: int, semestre_atual: int):
         sq_equipe_id = select(models.Equipe_Projeto.id_equipe).filter(
             models.Equipe_Projeto.id_projeto == projeto_id,
@@ -207,13 +400,13 @@ class RepositorioProjeto():
         if not equipe_id:
             return []
         
-        lideres_ids = self.db.scalars(
+        lideres_ids = set(self.db.scalars(
             select(models.Lideranca.id_usuario)
             .filter(
                 models.Lideranca.id_projeto == projeto_id,
                 models.Lideranca.semestre == semestre_atual
             )
-        ).all()
+        ).all())
 
         membros_query = self.db.query(
             models.Usuario.id_usuario,
@@ -0,0 +1,258 @@
+from sqlalchemy import select, update, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+from app.schemas import schemas
+from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.config.database_async import AsyncSessionLocal
+from app.infra.sqlalchemy.repositorios.dashboard_resumo import (
+    RepositorioDashboardResumo, resumo_sincronizado, marcar_resumo_sincronizado, select_estado_resumo,
+    precisa_reconstruir
+)
+from app.infra.sqlalchemy.repositorios.projeto import (
+    ORDENACOES_PROJETO, COLUNAS_LISTAGEM_PROJETO, filtrar_projetos, ids_alunos_invalidos,
+    select_projeto_completo, select_membros_projeto, montar_dashboard_completo
+)
+from app.utils.paginacao import LIMITE_PADRAO, paginar, fechar_pagina
+from app.utils.resposta_json import como_dicts
+from app.utils.acesso_projeto import cache_acesso_projeto
+from app.utils.semestre import get_current_semester, formatar_semestre_inicial
+from datetime import datetime
+
+
+class RepositorioProjetoAsync():
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def criar_projeto_completo(self, projeto_data: schemas.ProjetoCreate):
+        ids_alunos = list(dict.fromkeys(projeto_data.id_alunos_participantes))
+
+        ids_invalidos = ids_alunos_invalidos((await self.db.scalars(
+            select(models.Aluno.id_usuario).where(models.Aluno.id_usuario.in_(ids_alunos))
+        )).all() if ids_alunos else [], ids_alunos)
+        if ids_invalidos:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Alguns IDs de alunos são inválidos ou não são alunos: {ids_invalidos}"
+            )
+
+        db_projeto = models.Projeto(
+            nome=projeto_data.nome,
+            descricao=projeto_data.descricao,
+            data_ini=projeto_data.data_ini,
+            data_fim=projeto_data.data_fim,
+            status=projeto_data.status,
+            id_empresa=projeto_data.id_empresa,
+            nome_orientador=projeto_data.nome_orientador
+        )
+        self.db.add(db_projeto)
+        await self.db.flush()
+
+        db_equipe = models.Equipe(nome=f"Equipe - {db_projeto.nome} - {datetime.now().year}")
+        self.db.add(db_equipe)
+        await self.db.flush()
+
+        db_equipe_projeto = models.Equipe_Projeto(
+            id_equipe=db_equipe.id_equipe,
+            id_projeto=db_projeto.id_projeto,
+            semestre=get_current_semester(),
+            fase='1' # Padrão
+        )
+        self.db.add(db_equipe_projeto)
+
+        if ids_alunos:
+            await self.db.execute(
+                insert(models.Membro_Equipe),
+                [{"id_equipe": db_equipe.id_equipe, "id_usuario": aluno_id} for aluno_id in ids_alunos]
+            )
+
+        id_projeto = db_projeto.id_projeto
+        await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).atualizar([id_projeto]))
+        await self.db.commit()
+        cache_acesso_projeto.invalidar(ids_alunos)
+        await self.db.refresh(db_projeto)
+
+        return db_projeto
+
+    async def listar(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+                     status: str | None = None, id_empresa: int | None = None, semestre: int | None = None):
+        """Lista paginada (keyset). Retorna (projetos como dicts, cursor da próxima página)."""
+        colunas, chave = ORDENACOES_PROJETO[ordenar]
+        query = filtrar_projetos(select(*COLUNAS_LISTAGEM_PROJETO), status, id_empresa, semestre)
+        linhas = await self.db.execute(paginar(query, colunas, cursor, ordenar, limite))
+        projetos, proximo_cursor = fechar_pagina(linhas.all(), chave, ordenar, limite)
+        return como_dicts(projetos), proximo_cursor
+
+    async def obter(self, projeto_id: int):
+        return await self.db.get(models.Projeto, projeto_id)
+
+    async def editar(self, projeto_id: int, projeto: schemas.ProjetoUpdate):
+        update_data = projeto.model_dump(exclude_unset=True)
+
+        if update_data:
+            await self.db.execute(
+                update(models.Projeto)
+                .where(models.Projeto.id_projeto == projeto_id)
+                .values(**update_data)
+                .execution_options(synchronize_session="fetch")
+            )
+            await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).atualizar([projeto_id]))
+            await self.db.commit()
+
+        return await self.obter(projeto_id)
+
+    async def remover(self, projeto_id: int):
+        projeto = await self.obter(projeto_id)
+        if projeto:
+            await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).remover(projeto_id))
+            await self.db.delete(projeto)
+            await self.db.commit()
+            return True
+        return False
+
+    async def garantir_resumo_sincronizado(self):
+        """
+        Versão async de RepositorioDashboardResumo.garantir_sincronizado: numa
+        sessão da réplica, reconstrói pelo AsyncSession do primário (a sessão
+        síncrona bloquearia o event loop).
+        """
+        semestre = get_current_semester()
+        if resumo_sincronizado(semestre):
+            return
+
+        if precisa_reconstruir((await self.db.execute(select_estado_resumo(semestre))).one()):
+            if self.db.info.get("leitura"):
+                async with AsyncSessionLocal() as primario:
+                    await primario.run_sync(lambda s: RepositorioDashboardResumo(s).atualizar(semestre=semestre))
+                    await primario.commit()
+            else:
+                await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).atualizar(semestre=semestre))
+                await self.db.commit()
+        marcar_resumo_sincronizado(semestre)
+
+    async def listar_projetos_dashboard(self, cursor: str | None = None, limite: int = LIMITE_PADRAO, ordenar: str = "id",
+                                        status: str | None = None, id_empresa: int | None = None, semestre: int | None = None):
+        """
+        Lista para o dashboard (VISÃO GERAL), versão async de
+        RepositorioProjeto.listar_projetos_dashboard (lê o resumo projeto_dashboard).
+        """
+        await self.garantir_resumo_sincronizado()
+        linhas, proximo_cursor = await self.db.run_sync(lambda s: RepositorioDashboardResumo(s).listar(
+            cursor, limite, ordenar, status, id_empresa, semestre, sincronizar=False))
+        return [
+            {
+                "id_projeto": row.id_projeto,
+                "nome_projeto": row.nome_projeto,
+                "descricao": row.descricao,
+                "status": row.status,
+                "fase": row.fase,
+                "orientador_tecnico": row.orientador_tecnico,
+                "semestre_inicial": row.semestre_inicial
+            }
+            for row in linhas
+        ], proximo_cursor
+
+    async def get_dashboard_details(self, projeto_id: int, semestre_atual: int):
+        """
+        Detalhes do projeto (VISÃO DETALHADA), com Empresa e lista de Alunos.
+        """
+        sq_fase = select(
+            models.Equipe_Projeto.fase
+        ).filter(
+            models.Equipe_Projeto.id_projeto == projeto_id,
+            models.Equipe_Projeto.semestre == semestre_atual
+        ).limit(1).scalar_subquery()
+
+        resultado = await self.db.execute(
+            select(
+                models.Projeto.id_projeto,
+                models.Projeto.nome.label("nome_projeto"),
+                models.Projeto.descricao,
+                models.Projeto.status,
+                models.Projeto.data_ini,
+                models.Empresa.nome.label("empresa_demandante"),
+                models.Projeto.nome_orientador.label("orientador_tecnico"),
+                sq_fase.label("fase")
+            ).join(
+                models.Empresa, models.Projeto.id_empresa == models.Empresa.id_empresa
+            ).filter(models.Projeto.id_projeto == projeto_id).limit(1)
+        )
+        projeto = resultado.first()
+
+        if not projeto:
+            return None
+
+        lista_alunos = (await self.db.scalars(
+            select(models.Usuario.nome)
+            .join(models.Membro_Equipe, models.Membro_Equipe.id_usuario == models.Usuario.id_usuario)
+            .join(models.Equipe_Projeto, models.Equipe_Projeto.id_equipe == models.Membro_Equipe.id_equipe)
+            .filter(models.Equipe_Projeto.id_projeto == projeto_id)
+            .filter(models.Equipe_Projeto.semestre == semestre_atual)
+        )).all()
+
+        return {
+            "id_projeto": projeto.id_projeto,
+            "nome_projeto": projeto.nome_projeto,
+            "descricao": projeto.descricao,
+            "status": projeto.status,
+            "orientador_tecnico": projeto.orientador_tecnico,
+            "empresa_demandante": projeto.empresa_demandante,
+            "fase": projeto.fase,
+            "semestre_inicial": formatar_semestre_inicial(projeto.data_ini),
+            "alunos": list(lista_alunos)
+        }
+
+    async def get_dashboard_completo(self, projeto_id: int, semestre: int):
+        """Detalhes + equipe (com líderes) + fase do semestre em duas consultas."""
+        projeto = (await self.db.execute(select_projeto_completo(projeto_id, semestre))).first()
+        if not projeto:
+            return None
+        membros = (await self.db.execute(select_membros_projeto(projeto_id, semestre))).all()
+        return montar_dashboard_completo(projeto, membros, semestre)
+
+    async def get_dashboard_team(self, projeto_id: int, semestre_atual: int):
+        equipe_id = await self.db.scalar(
+            select(models.Equipe_Projeto.id_equipe).filter(
+                models.Equipe_Projeto.id_projeto == projeto_id,
+                models.Equipe_Projeto.semestre == semestre_atual
+            ).limit(1)
+        )
+
+        if not equipe_id:
+            return []
+
+        lideres_ids = set((await self.db.scalars(
+            select(models.Lideranca.id_usuario)
+            .filter(
+                models.Lideranca.id_projeto == projeto_id,
+                models.Lideranca.semestre == semestre_atual
+            )
+        )).all())
+
+        membros_query = await self.db.execute(
+            select(
+                models.Usuario.id_usuario,
+                models.Usuario.nome,
+                models.Usuario.email,
+                models.Usuario.telefone,
+                models.Aluno.curso,
+            ).join(
+                models.Membro_Equipe, models.Usuario.id_usuario == models.Membro_Equipe.id_usuario
+            ).outerjoin(
+                models.Aluno, models.Usuario.id_usuario == models.Aluno.id_usuario
+            ).filter(
+                models.Membro_Equipe.id_equipe == equipe_id
+            )
+        )
+
+        return [
+            {
+                "id_usuario": membro.id_usuario,
+                "nome": membro.nome,
+                "email": membro.email,
+                "telefone": membro.telefone,
+                "curso": membro.curso,
+                "is_lider": membro.id_usuario in lideres_ids
+            }
+            for membro in membros_query
+        ]
@@ -0,0 +1,88 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.infra.sqlalchemy.config.database import get_db, get_pool_metrics
+from app.infra.sqlalchemy.config.instrumentacao import registro_instrumentacao
+from app.infra.sqlalchemy.models import models
+from app.utils.role_version import incrementar_role_version
+from app.utils.jwt_bearer import get_current_user
+from app.utils.jwt_handler import cache_tokens
+from app.utils.acesso_projeto import cache_acesso_projeto
+from app.utils.security import pool_senhas
+from app.utils.email_handler import worker_email
+from app.infra.sqlalchemy.repositorios.email_outbox import RepositorioEmailOutbox
+from app.infra.sqlalchemy.repositorios.busca import indice_busca
+from app.utils.role_checker import role_required
+from app.utils.roteamento_leitura import fixacao_primario
+
+
+router = APIRouter(prefix="/admin",
+                   tags=["Admin"],
+                   dependencies=[Depends(get_current_user), Depends(role_required("adm"))]
+                   )
+
+
+@router.get("/db/pool", status_code=status.HTTP_200_OK)
+def obter_metricas_pool():
+    """
+    Retorna as métricas do pool de conexões (checked-out, overflow, tempo de espera).
+    Usado para dimensionar DB_POOL_SIZE/DB_MAX_OVERFLOW por número de workers.
+    """
+    return get_pool_metrics()
+
+
+@router.get("/db/consultas", status_code=status.HTTP_200_OK)
+def obter_metricas_consultas():
+    """Total de consultas lentas e as suspeitas de N+1 (rota, SQL, repetições)."""
+    return registro_instrumentacao.estatisticas()
+
+
+@router.get("/db/leitura", status_code=status.HTTP_200_OK)
+def obter_metricas_leitura():
+    """Leituras servidas pela réplica e pelo primário, e clientes fixados no primário após escrever."""
+    return fixacao_primario.estatisticas()
+
+
+@router.get("/cache/tokens", status_code=status.HTTP_200_OK)
+def obter_metricas_cache_tokens():
+    """Retorna hits/misses do cache de JWTs verificados."""
+    return cache_tokens.estatisticas()
+
+
+@router.get("/cache/acesso-projetos", status_code=status.HTTP_200_OK)
+def obter_metricas_cache_acesso_projetos():
+    """Retorna hits/misses/invalidações do cache de participação em projetos."""
+    return cache_acesso_projeto.estatisticas()
+
+
+@router.get("/busca/indice", status_code=status.HTTP_200_OK)
+def obter_metricas_indice_busca():
+    """Documentos e reconstruções do índice de busca em memória (bancos sem FULLTEXT)."""
+    return indice_busca.estatisticas()
+
+
+@router.get("/senhas/pool", status_code=status.HTTP_200_OK)
+def obter_metricas_pool_senhas():
+    """Retorna a profundidade da fila e os contadores do pool de bcrypt."""
+    return pool_senhas.estatisticas()
+
+
+@router.get("/email/outbox", status_code=status.HTTP_200_OK)
+def obter_metricas_outbox(db: Session = Depends(get_db)):
+    """Profundidade da fila de e-mails (por status) e contadores do worker."""
+    return {**RepositorioEmailOutbox(db).estatisticas(), "worker": worker_email.estatisticas()}
+
+
+@router.post("/usuarios/{usuario_id}/revogar-tokens", status_code=status.HTTP_200_OK)
+def revogar_tokens_usuario(usuario_id: int, db: Session = Depends(get_db)):
+    """
+    Incrementa a versão de role do usuário, invalidando os tokens já emitidos.
+    Alterar Aluno/Orientador pelo ORM já faz isso na mesma transação; use
+    para revogar os tokens sem mudar a role, ou após escritas diretas no banco.
+    Neste processo vale na hora; os demais workers aceitam o token antigo por
+    até ROLE_VERSION_TTL segundos (padrão 5; 0 confere o banco a cada requisição).
+    """
+    if not db.get(models.Usuario, usuario_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Usuário não encontrado")
+    incrementar_role_version(db, usuario_id)
+    db.commit()
+    return {"message": "Tokens do usuário revogados"}
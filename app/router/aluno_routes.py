@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, File, Query, Response, UploadFile, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Dict, List, Optional
+import csv
+import io
 
 from app.infra.sqlalchemy.config.database import get_db
+from app.utils.roteamento_leitura import get_db_leitura
 from app.schemas import schemas
 from app.infra.sqlalchemy.repositorios import aluno as repositorio_aluno
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO, definir_proximo_cursor
 from app.utils.jwt_bearer import get_current_user, get_user_role
+from app.utils.role_checker import role_required
 
 # Prefixo '/alunos'
 router = APIRouter(
@@ -27,8 +32,36 @@ def criar_aluno(
 
 @router.get("/", response_model=List[schemas.AlunoResponse])
 def listar_alunos(
-    db: Session = Depends(get_db),
+    response: Response,
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    curso: Optional[str] = None,
+    db: Session = Depends(get_db_leitura),
     current_user: dict = Depends(get_current_user)
 ):
     # Apenas logados podem ver a lista
-    return repositorio_aluno.listar_alunos(db)
\ No newline at end of file
+    alunos, proximo_cursor = repositorio_aluno.listar_alunos(db, cursor, limite, ordenar.value, curso)
+    definir_proximo_cursor(response, proximo_cursor)
+    return alunos
+
+@router.post("/importar", response_model=schemas.AlunoImportResponse, dependencies=[Depends(role_required("adm"))])
+def importar_alunos(
+    registros: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db)
+):
+    """
+    Importação em massa (JSON: lista de objetos com nome, email, telefone, ra, curso).
+    Linhas inválidas ou já cadastradas são reportadas em `erros` sem interromper as demais.
+    """
+    return repositorio_aluno.importar_alunos(db, registros)
+
+@router.post("/importar/csv", response_model=schemas.AlunoImportResponse, dependencies=[Depends(role_required("adm"))])
+def importar_alunos_csv(
+    arquivo: UploadFile = File(...),
+    db: Session = Depends(get_db)
+):
+    """Importação em massa a partir de CSV com cabeçalho: nome,email,telefone,ra,curso."""
+    conteudo = io.TextIOWrapper(arquivo.file, encoding="utf-8-sig")
+    registros = [dict(linha) for linha in csv.DictReader(conteudo)]
+    return repositorio_aluno.importar_alunos(db, registros)
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Body, Depends, File, Query, Response, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+import csv
+import io
+
+from app.infra.sqlalchemy.config.database_async import get_async_db
+from app.utils.roteamento_leitura import get_async_db_leitura
+from app.schemas import schemas
+from app.infra.sqlalchemy.repositorios import aluno_async as repositorio_aluno
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO, definir_proximo_cursor
+from app.utils.jwt_bearer import get_current_user_async
+from app.utils.role_checker import role_required_async
+
+# Versão async de aluno_routes (DB_ASYNC=true)
+router = APIRouter(
+    prefix="/alunos",
+    tags=["Alunos"]
+)
+
+@router.post("/", response_model=schemas.AlunoResponse, status_code=status.HTTP_201_CREATED)
+async def criar_aluno(
+    aluno: schemas.AlunoCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user_async)
+):
+    return await repositorio_aluno.criar_aluno(db, aluno)
+
+@router.get("/", response_model=List[schemas.AlunoResponse])
+async def listar_alunos(
+    response: Response,
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    curso: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db_leitura),
+    current_user: dict = Depends(get_current_user_async)
+):
+    # Apenas logados podem ver a lista
+    alunos, proximo_cursor = await repositorio_aluno.listar_alunos(db, cursor, limite, ordenar.value, curso)
+    definir_proximo_cursor(response, proximo_cursor)
+    return alunos
+
+@router.post("/importar", response_model=schemas.AlunoImportResponse, dependencies=[Depends(role_required_async("adm"))])
+async def importar_alunos(
+    registros: List[Dict[str, Any]] = Body(...),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Importação em massa (JSON: lista de objetos com nome, email, telefone, ra, curso).
+    Linhas inválidas ou já cadastradas são reportadas em `erros` sem interromper as demais.
+    """
+    return await repositorio_aluno.importar_alunos(db, registros)
+
+@router.post("/importar/csv", response_model=schemas.AlunoImportResponse, dependencies=[Depends(role_required_async("adm"))])
+async def importar_alunos_csv(
+    arquivo: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Importação em massa a partir de CSV com cabeçalho: nome,email,telefone,ra,curso."""
+    conteudo = (await arquivo.read()).decode("utf-8-sig")
+    registros = [dict(linha) for linha in csv.DictReader(io.StringIO(conteudo))]
+    return await repositorio_aluno.importar_alunos(db, registros)
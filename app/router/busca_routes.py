@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.schemas import schemas
+from app.infra.sqlalchemy.repositorios.busca import RepositorioBusca
+from app.utils.jwt_bearer import get_current_user
+from app.utils.role_checker import role_required
+from app.utils.roteamento_leitura import get_db_leitura
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO, codificar_cursor, decodificar_cursor, definir_proximo_cursor
+
+# Páginas além deste deslocamento não são servidas (refinar a busca)
+BUSCA_MAX_DESLOCAMENTO = 1000
+ORDENACAO_BUSCA = "relevancia"
+
+router = APIRouter(prefix="/busca",
+                   tags=["Busca"],
+                   dependencies=[Depends(get_current_user), Depends(role_required("adm"))])
+
+
+@router.get("/", response_model=list[schemas.ResultadoBuscaResponse], status_code=status.HTTP_200_OK)
+def buscar(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200),
+    tipo: Optional[list[schemas.TipoBusca]] = Query(None),
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    db: Session = Depends(get_db_leitura)
+):
+    """
+    Busca textual em projetos (nome e descrição), empresas (nome e descrição)
+    e nomes de alunos, ordenada por relevância. Todos os termos precisam
+    aparecer; termos com 3 letras ou mais casam por prefixo ("eng" encontra
+    "engenharia"). Filtre com `tipo` (repetível). O cursor da próxima página
+    vem no header X-Next-Cursor.
+    """
+    deslocamento = 0
+    if cursor:
+        valores = decodificar_cursor(cursor, ORDENACAO_BUSCA)
+        if len(valores) != 1 or not isinstance(valores[0], int) or valores[0] < 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido.")
+        deslocamento = valores[0]
+    tipos = [t.value for t in dict.fromkeys(tipo)] if tipo else [t.value for t in schemas.TipoBusca]
+
+    resultados, ha_mais = RepositorioBusca(db).buscar(q, tipos, limite, deslocamento)
+    if ha_mais and deslocamento + limite < BUSCA_MAX_DESLOCAMENTO:
+        definir_proximo_cursor(response, codificar_cursor(ORDENACAO_BUSCA, [deslocamento + limite]))
+    return resultados
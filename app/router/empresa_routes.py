@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.infra.sqlalchemy.config.database import get_db
+from app.utils.roteamento_leitura import get_db_leitura
 from app.schemas import schemas
 from app.infra.sqlalchemy.repositorios.empresa import RepositorioEmpresa
 from app.utils.jwt_bearer import get_current_user
 from app.utils.role_checker import role_required
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO
+from app.utils.resposta_json import resposta_lista
 
 
 router = APIRouter(prefix="/empresas", 
@@ -20,13 +24,20 @@ def criar_empresa(empresa: schemas.EmpresaCreate, db: Session = Depends(get_db))
 
 
 @router.get("/", response_model=list[schemas.EmpresaResponse], dependencies=[Depends(role_required("adm"))], status_code=status.HTTP_200_OK)
-def listar_empresas(db: Session = Depends(get_db)):
+def listar_empresas(
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    db: Session = Depends(get_db_leitura)
+):
+    """Lista paginada por cursor; o cursor da próxima página vem no header X-Next-Cursor."""
     repo = RepositorioEmpresa(db)
-    return repo.listar()
+    empresas, proximo_cursor = repo.listar(cursor, limite, ordenar.value)
+    return resposta_lista(empresas, proximo_cursor)
 
 
 @router.get("/{empresa_id}", response_model=schemas.EmpresaResponse, dependencies=[Depends(role_required("adm"))], status_code=status.HTTP_200_OK)
-def obter_empresa(empresa_id: int, db: Session = Depends(get_db)):
+def obter_empresa(empresa_id: int, db: Session = Depends(get_db_leitura)):
     repo = RepositorioEmpresa(db)
     empresa = repo.obter(empresa_id)
     if not empresa:
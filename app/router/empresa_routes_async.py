@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infra.sqlalchemy.config.database_async import get_async_db
+from app.utils.roteamento_leitura import get_async_db_leitura
+from app.schemas import schemas
+from app.infra.sqlalchemy.repositorios.empresa_async import RepositorioEmpresaAsync
+from app.utils.jwt_bearer import get_current_user_async
+from app.utils.role_checker import role_required_async
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO
+from app.utils.resposta_json import resposta_lista
+
+
+# Versão async de empresa_routes (DB_ASYNC=true)
+router = APIRouter(prefix="/empresas",
+                   tags=["Empresas"],
+                   dependencies=[Depends(get_current_user_async)]
+                   )
+
+
+@router.post("/", response_model=schemas.EmpresaResponse, dependencies=[Depends(role_required_async("adm"))], status_code=status.HTTP_201_CREATED)
+async def criar_empresa(empresa: schemas.EmpresaCreate, db: AsyncSession = Depends(get_async_db)):
+    repo = RepositorioEmpresaAsync(db)
+    return await repo.criar(empresa)
+
+
+@router.get("/", response_model=list[schemas.EmpresaResponse], dependencies=[Depends(role_required_async("adm"))], status_code=status.HTTP_200_OK)
+async def listar_empresas(
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    db: AsyncSession = Depends(get_async_db_leitura)
+):
+    """Lista paginada por cursor; o cursor da próxima página vem no header X-Next-Cursor."""
+    repo = RepositorioEmpresaAsync(db)
+    empresas, proximo_cursor = await repo.listar(cursor, limite, ordenar.value)
+    return resposta_lista(empresas, proximo_cursor)
+
+
+@router.get("/{empresa_id}", response_model=schemas.EmpresaResponse, dependencies=[Depends(role_required_async("adm"))], status_code=status.HTTP_200_OK)
+async def obter_empresa(empresa_id: int, db: AsyncSession = Depends(get_async_db_leitura)):
+    repo = RepositorioEmpresaAsync(db)
+    empresa = await repo.obter(empresa_id)
+    if not empresa:
+        raise HTTPException(status_code=404, detail="Empresa não encontrada")
+    return empresa
+
+
+@router.put("/{empresa_id}", response_model=schemas.EmpresaResponse, dependencies=[Depends(role_required_async("adm"))], status_code=status.HTTP_200_OK)
+async def editar_empresa(empresa_id: int, empresa: schemas.EmpresaUpdate, db: AsyncSession = Depends(get_async_db)):
+    """Edita os dados de uma empresa pelo seu ID."""
+    repo = RepositorioEmpresaAsync(db)
+
+    if not await repo.obter(empresa_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Empresa não encontrada")
+
+    return await repo.editar(empresa_id, empresa)
+
+
+@router.delete("/{empresa_id}", dependencies=[Depends(role_required_async("adm"))], status_code=status.HTTP_200_OK)
+async def remover_empresa(empresa_id: int, db: AsyncSession = Depends(get_async_db)):
+    repo = RepositorioEmpresaAsync(db)
+    sucesso = await repo.remover(empresa_id)
+    if not sucesso:
+        raise HTTPException(status_code=404, detail="Empresa não encontrada")
+    return {"message": "Empresa removida com sucesso"}
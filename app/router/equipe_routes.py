@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.infra.sqlalchemy.config.database import get_db
+from app.utils.roteamento_leitura import get_db_leitura
 from app.schemas import schemas
 from app.infra.sqlalchemy.repositorios.equipe import RepositorioEquipe
 from app.utils.jwt_bearer import get_current_user
 from app.utils.role_checker import role_required
-from app.infra.sqlalchemy.models import models
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO
+from app.utils.resposta_json import resposta_lista
 
 router = APIRouter(
     prefix="/equipes",
@@ -22,8 +25,17 @@ def criar_equipe(equipe: schemas.EquipeCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=list[schemas.EquipeResponse])
-def listar_equipes(db: Session = Depends(get_db)):
-    return RepositorioEquipe(db).listar_equipes()
+def listar_equipes(
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    id_projeto: Optional[int] = None,
+    semestre: Optional[int] = None,
+    db: Session = Depends(get_db_leitura)
+):
+    """Lista paginada por cursor; o cursor da próxima página vem no header X-Next-Cursor."""
+    equipes, proximo_cursor = RepositorioEquipe(db).listar_equipes(cursor, limite, ordenar.value, id_projeto, semestre)
+    return resposta_lista(equipes, proximo_cursor)
 
 
 @router.put("/{equipe_id}", response_model=schemas.EquipeResponse)
@@ -49,38 +61,46 @@ def adicionar_membros_equipe(membro_info: schemas.MembroEquipeCreate, db: Sessio
     repo = RepositorioEquipe(db)
     
     # Validação: Verifica se a equipe existe
-    equipe_existente = db.query(models.Equipe).filter(models.Equipe.id_equipe == membro_info.id_equipe).first()
-    if not equipe_existente:
+    if not repo.obter_equipe(membro_info.id_equipe):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Equipe com ID {membro_info.id_equipe} não encontrada."
         )
 
+    # Validações em lote (uma query para alunos, uma para membros existentes)
+    alunos, membros_existentes = repo.validar_membros(membro_info.id_equipe, membro_info.id_usuarios)
     for usuario_id in membro_info.id_usuarios:
-        # Validação: Verifica se o usuário é um aluno
-        aluno_existente = db.query(models.Aluno).filter(models.Aluno.id_usuario == usuario_id).first()
-        if not aluno_existente:
+        if usuario_id not in alunos:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"O usuário com ID {usuario_id} não é um aluno e não pode ser adicionado a uma equipe como membro."
             )
-        
-        # Validação: Verifica se o membro já está na equipe
-        membro_existente = db.query(models.Membro_Equipe).filter_by(
-            id_equipe=membro_info.id_equipe, 
-            id_usuario=usuario_id
-        ).first()
-        if membro_existente:
+        if usuario_id in membros_existentes:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"O usuário com ID {usuario_id} já é membro da equipe com ID {membro_info.id_equipe}."
             )
 
-    return repo.adicionar_membros(membro_info.id_equipe, membro_info.id_usuarios)
+    return repo.adicionar_membros(membro_info.id_equipe, list(dict.fromkeys(membro_info.id_usuarios)))
+
+
+@router.post("/membros/lote", response_model=schemas.MembroEquipeLoteResponse, status_code=status.HTTP_200_OK)
+def adicionar_membros_equipe_em_lote(membro_info: schemas.MembroEquipeCreate, db: Session = Depends(get_db)):
+    """
+    Adiciona uma turma inteira a uma equipe: valida todos os ids em lote, insere
+    os válidos numa única transação e devolve o resultado de cada id.
+    """
+    repo = RepositorioEquipe(db)
+    if not repo.obter_equipe(membro_info.id_equipe):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Equipe com ID {membro_info.id_equipe} não encontrada."
+        )
+    return repo.adicionar_membros_em_lote(membro_info.id_equipe, membro_info.id_usuarios)
 
 
 @router.get("/{equipe_id}/membros", response_model=list[schemas.MembroEquipeResponse])
-def listar_membros_da_equipe(equipe_id: int, db: Session = Depends(get_db)):
+def listar_membros_da_equipe(equipe_id: int, db: Session = Depends(get_db_leitura)):
     return RepositorioEquipe(db).listar_membros_por_equipe(equipe_id)
 
 
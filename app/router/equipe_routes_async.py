@@ -0,0 +1,153 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infra.sqlalchemy.config.database_async import get_async_db
+from app.utils.roteamento_leitura import get_async_db_leitura
+from app.schemas import schemas
+from app.infra.sqlalchemy.repositorios.equipe_async import RepositorioEquipeAsync
+from app.utils.jwt_bearer import get_current_user_async
+from app.utils.role_checker import role_required_async
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO
+from app.utils.resposta_json import resposta_lista
+
+# Versão async de equipe_routes (DB_ASYNC=true)
+router = APIRouter(
+    prefix="/equipes",
+    tags=["Equipes"],
+    dependencies=[Depends(get_current_user_async), Depends(role_required_async("adm"))]
+)
+
+
+# --- Rotas para Equipe ---
+
+@router.post("/", response_model=schemas.EquipeResponse, status_code=status.HTTP_201_CREATED)
+async def criar_equipe(equipe: schemas.EquipeCreate, db: AsyncSession = Depends(get_async_db)):
+    return await RepositorioEquipeAsync(db).criar_equipe(equipe)
+
+
+@router.get("/", response_model=list[schemas.EquipeResponse])
+async def listar_equipes(
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    id_projeto: Optional[int] = None,
+    semestre: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db_leitura)
+):
+    """Lista paginada por cursor; o cursor da próxima página vem no header X-Next-Cursor."""
+    equipes, proximo_cursor = await RepositorioEquipeAsync(db).listar_equipes(cursor, limite, ordenar.value, id_projeto, semestre)
+    return resposta_lista(equipes, proximo_cursor)
+
+
+@router.put("/{equipe_id}", response_model=schemas.EquipeResponse)
+async def editar_equipe(equipe_id: int, equipe: schemas.EquipeUpdate, db: AsyncSession = Depends(get_async_db)):
+    repo = RepositorioEquipeAsync(db)
+    if not await repo.obter_equipe(equipe_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Equipe não encontrada")
+    return await repo.editar_equipe(equipe_id, equipe)
+
+
+@router.delete("/{equipe_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remover_equipe(equipe_id: int, db: AsyncSession = Depends(get_async_db)):
+    if not await RepositorioEquipeAsync(db).remover_equipe(equipe_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Equipe não encontrada")
+
+
+# --- Rotas para Membros da Equipe ---
+
+@router.post("/membros", response_model=list[schemas.MembroEquipeResponse], status_code=status.HTTP_201_CREATED)
+async def adicionar_membros_equipe(membro_info: schemas.MembroEquipeCreate, db: AsyncSession = Depends(get_async_db)):
+    repo = RepositorioEquipeAsync(db)
+
+    # Validação: Verifica se a equipe existe
+    if not await repo.obter_equipe(membro_info.id_equipe):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Equipe com ID {membro_info.id_equipe} não encontrada."
+        )
+
+    # Validações em lote (uma query para alunos, uma para membros existentes)
+    alunos_validos, membros_existentes = await repo.validar_membros(membro_info.id_equipe, membro_info.id_usuarios)
+
+    for usuario_id in membro_info.id_usuarios:
+        if usuario_id not in alunos_validos:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"O usuário com ID {usuario_id} não é um aluno e não pode ser adicionado a uma equipe como membro."
+            )
+        if usuario_id in membros_existentes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"O usuário com ID {usuario_id} já é membro da equipe com ID {membro_info.id_equipe}."
+            )
+
+    return await repo.adicionar_membros(membro_info.id_equipe, list(dict.fromkeys(membro_info.id_usuarios)))
+
+
+@router.post("/membros/lote", response_model=schemas.MembroEquipeLoteResponse, status_code=status.HTTP_200_OK)
+async def adicionar_membros_equipe_em_lote(membro_info: schemas.MembroEquipeCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Adiciona uma turma inteira a uma equipe: valida todos os ids em lote, insere
+    os válidos numa única transação e devolve o resultado de cada id.
+    """
+    repo = RepositorioEquipeAsync(db)
+    if not await repo.obter_equipe(membro_info.id_equipe):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Equipe com ID {membro_info.id_equipe} não encontrada."
+        )
+    return await repo.adicionar_membros_em_lote(membro_info.id_equipe, membro_info.id_usuarios)
+
+
+@router.get("/{equipe_id}/membros", response_model=list[schemas.MembroEquipeResponse])
+async def listar_membros_da_equipe(equipe_id: int, db: AsyncSession = Depends(get_async_db_leitura)):
+    return await RepositorioEquipeAsync(db).listar_membros_por_equipe(equipe_id)
+
+
+@router.delete("/{equipe_id}/membros/{usuario_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remover_membro_da_equipe(equipe_id: int, usuario_id: int, db: AsyncSession = Depends(get_async_db)):
+    if not await RepositorioEquipeAsync(db).remover_membro(equipe_id, usuario_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail="Membro não encontrado na equipe")
+
+
+# --- Rotas para Relacionamentos ---
+
+@router.post("/projetos", response_model=schemas.EquipeProjetoResponse, status_code=status.HTTP_201_CREATED)
+async def relacionar_equipe_projeto(equipe_projeto: schemas.EquipeProjetoCreate, db: AsyncSession = Depends(get_async_db)):
+    return await RepositorioEquipeAsync(db).relacionar_projeto(equipe_projeto)
+
+@router.put("/projetos/{equipe_id}/{projeto_id}", response_model=schemas.EquipeProjetoResponse)
+async def editar_relacionamento_equipe_projeto(equipe_id: int, projeto_id: int, equipe_projeto: schemas.EquipeProjetoUpdate, db: AsyncSession = Depends(get_async_db)):
+    repo = RepositorioEquipeAsync(db)
+    relacionamento_editado = await repo.editar_relacionamento_projeto(equipe_id, projeto_id, equipe_projeto)
+    if not relacionamento_editado:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Relacionamento Equipe/Projeto não encontrado")
+    return relacionamento_editado
+
+@router.delete("/projetos/{equipe_id}/{projeto_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remover_relacionamento_equipe_projeto(equipe_id: int, projeto_id: int, db: AsyncSession = Depends(get_async_db)):
+    if not await RepositorioEquipeAsync(db).remover_relacionamento_projeto(equipe_id, projeto_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Relacionamento Equipe/Projeto não encontrado")
+
+
+@router.post("/lideranca", response_model=schemas.LiderancaResponse, status_code=status.HTTP_201_CREATED)
+async def definir_lider_equipe(lideranca: schemas.LiderancaCreate, db: AsyncSession = Depends(get_async_db)):
+    return await RepositorioEquipeAsync(db).definir_lider(lideranca)
+
+@router.delete("/lideranca/{projeto_id}/{usuario_id}/{semestre}", status_code=status.HTTP_204_NO_CONTENT)
+async def remover_lider_de_equipe(projeto_id: int, usuario_id: int, semestre: int, db: AsyncSession = Depends(get_async_db)):
+    if not await RepositorioEquipeAsync(db).remover_lider(projeto_id, usuario_id, semestre):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Liderança não encontrada")
+
+
+@router.post("/orientadores", response_model=schemas.OrientadorProjetoResponse, status_code=status.HTTP_201_CREATED)
+async def adicionar_orientador_projeto(orientador: schemas.OrientadorProjetoCreate, db: AsyncSession = Depends(get_async_db)):
+    return await RepositorioEquipeAsync(db).adicionar_orientador_projeto(orientador)
+
+@router.delete("/orientadores/{projeto_id}/{usuario_id}/{tipo_orientador_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remover_orientador_de_projeto(projeto_id: int, usuario_id: int, tipo_orientador_id: int, db: AsyncSession = Depends(get_async_db)):
+    if not await RepositorioEquipeAsync(db).remover_orientador_projeto(projeto_id, usuario_id, tipo_orientador_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Orientador do projeto não encontrado")
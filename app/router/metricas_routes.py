@@ -0,0 +1,54 @@
+import hmac
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from app.infra.sqlalchemy.config.database import get_pool_metrics
+from app.infra.sqlalchemy.config.instrumentacao import registro_instrumentacao
+from app.utils.metricas import METRICS_TOKEN, registro_metricas, escapar_rotulo
+
+router = APIRouter(tags=["Métricas"])
+
+# Campos de get_pool_metrics() exportados como gauges/counters do pool
+_METRICAS_POOL = {
+    "checked_out": ("db_pool_checked_out", "gauge", "Conexões em uso."),
+    "checked_in": ("db_pool_checked_in", "gauge", "Conexões livres no pool."),
+    "overflow": ("db_pool_overflow", "gauge", "Conexões acima de DB_POOL_SIZE."),
+    "total_checkouts": ("db_pool_checkouts_total", "counter", "Checkouts de conexão."),
+    "total_timeouts": ("db_pool_timeouts_total", "counter", "Timeouts aguardando conexão."),
+    "total_erros_conexao": ("db_pool_connect_errors_total", "counter", "Falhas ao abrir conexão nova."),
+}
+
+
+def _linhas_pool() -> list[str]:
+    linhas = []
+    pool = get_pool_metrics()
+    for campo, (nome, tipo, ajuda) in _METRICAS_POOL.items():
+        if campo in pool:
+            linhas += [f"# HELP {nome} {ajuda}", f"# TYPE {nome} {tipo}", f"{nome} {pool[campo]}"]
+    if "espera_total_ms" in pool:
+        linhas += ["# HELP db_pool_wait_seconds_total Tempo total aguardando conexão livre.",
+                   "# TYPE db_pool_wait_seconds_total counter",
+                   f"db_pool_wait_seconds_total {pool['espera_total_ms'] / 1000:.6f}"]
+    return linhas
+
+
+def _linhas_sql() -> list[str]:
+    linhas = ["# HELP db_slow_statements_total Consultas acima de SQL_LENTA_MS.",
+              "# TYPE db_slow_statements_total counter",
+              f"db_slow_statements_total {registro_instrumentacao.consultas_lentas}",
+              "# HELP db_failed_statements_total Consultas que terminaram em erro.",
+              "# TYPE db_failed_statements_total counter",
+              f"db_failed_statements_total {registro_instrumentacao.consultas_com_erro}",
+              "# HELP db_n_plus_one_total Consultas repetidas numa requisição (provável N+1), por rota.",
+              "# TYPE db_n_plus_one_total counter"]
+    for rota, total in sorted(registro_instrumentacao.n_mais_1_por_rota().items()):
+        linhas.append(f'db_n_plus_one_total{{route="{escapar_rotulo(rota)}"}} {total}')
+    return linhas
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metricas(authorization: str | None = Header(default=None)):
+    """Métricas no formato de exposição do Prometheus."""
+    if METRICS_TOKEN and not hmac.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token de métricas inválido")
+    corpo = registro_metricas.exportar() + "\n".join(_linhas_pool() + _linhas_sql()) + "\n"
+    return PlainTextResponse(corpo, media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,18 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Optional, Literal
 from sqlalchemy.orm import Session
-from app.infra.sqlalchemy.config.database import get_db
+from app.infra.sqlalchemy.config.database import get_db, SessionLeitura
+from app.utils.roteamento_leitura import get_db_leitura
 from app.schemas import schemas
 from app.infra.sqlalchemy.repositorios.projeto import RepositorioProjeto
+from app.utils.acesso_projeto import projetos_do_usuario
 from app.utils.jwt_bearer import get_current_user
 from app.utils.role_checker import role_required
-from app.infra.sqlalchemy.models import models
-from datetime import datetime
-
-def get_current_semester():
-    now = datetime.now()
-    year = now.year
-    month = now.month
-    return int(f"{year}{1 if 1 <= month <= 6 else 2}")
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO, definir_proximo_cursor
+from app.utils.resposta_json import resposta_lista
+from app.utils.semestre import get_current_semester
+from app.utils.exportacao import gerar_csv, gerar_ndjson
+from app.utils.versao_recurso import (
+    CHAVE_DASHBOARD, chave_projeto, obter_versao, obter_versao_dashboard, gerar_etag, etag_corresponde,
+    resposta_nao_modificada, definir_etag
+)
+
+COLUNAS_EXPORTACAO = [
+    "id_projeto", "nome_projeto", "status", "fase", "semestre_inicial",
+    "orientador_tecnico", "empresa_demandante", "descricao", "alunos"
+]
+
+
+def gerar_exportacao_dashboard(formato: str, semestre: int):
+    """
+    Gerador da exportação. Abre a própria sessão porque o corpo é enviado
+    depois que as dependências da rota (get_db) já foram finalizadas. Lê da réplica.
+    """
+    db = SessionLeitura()
+    try:
+        linhas = RepositorioProjeto(db).exportar_dashboard(semestre)
+        if formato == "csv":
+            yield from gerar_csv(linhas, COLUNAS_EXPORTACAO)
+        else:
+            yield from gerar_ndjson(linhas)
+    finally:
+        db.close()
+
+
+def resposta_exportacao_dashboard(formato: str, semestre: Optional[int]) -> StreamingResponse:
+    semestre = semestre or get_current_semester()
+    media_type = "text/csv; charset=utf-8" if formato == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        gerar_exportacao_dashboard(formato, semestre),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="dashboard_{semestre}.{formato}"'}
+    )
 
 
 router = APIRouter(prefix="/projetos",
@@ -33,17 +68,9 @@ async def check_projeto_acesso(
     if current_user.get("role") == "adm":
         return current_user
 
-    # Se for aluno, verifica a associação (independente do semestre)
-    membro = db.query(models.Membro_Equipe.id_usuario).join(
-        models.Equipe_Projeto, 
-        models.Membro_Equipe.id_equipe == models.Equipe_Projeto.id_equipe
-    ).filter(
-        models.Equipe_Projeto.id_projeto == projeto_id,
-        # O filtro de semestre foi REMOVIDO daqui
-        models.Membro_Equipe.id_usuario == current_user.get("user_id")
-    ).first()
-
-    if not membro:
+    # Se for aluno, verifica a associação (independente do semestre).
+    # O conjunto de projetos do aluno vem do cache (acesso_projeto), invalidado pelas escritas de equipe
+    if projeto_id not in projetos_do_usuario(db, current_user.get("user_id")):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             # Mensagem de erro atualizada
@@ -59,18 +86,34 @@ def criar_projeto(projeto: schemas.ProjetoCreate, db: Session = Depends(get_db))
 
 
 @router.get("/", response_model=list[schemas.ProjetoResponse], status_code=status.HTTP_200_OK, dependencies=[Depends(role_required("adm"))])
-def listar_projetos(db: Session = Depends(get_db)):
+def listar_projetos(
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    status_projeto: Optional[schemas.StatusProjeto] = Query(None, alias="status"),
+    id_empresa: Optional[int] = None,
+    semestre: Optional[int] = None,
+    db: Session = Depends(get_db_leitura)
+):
+    """Lista paginada por cursor; o cursor da próxima página vem no header X-Next-Cursor."""
     repo = RepositorioProjeto(db)
-    return repo.listar()
+    projetos, proximo_cursor = repo.listar(
+        cursor, limite, ordenar.value,
+        status_projeto.value if status_projeto else None, id_empresa, semestre)
+    return resposta_lista(projetos, proximo_cursor)
 
 
 @router.get("/{projeto_id}", response_model=schemas.ProjetoDashboardDetailsResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(role_required("adm"))])
-def obter_projeto(projeto_id: int, db: Session = Depends(get_db)):
-    repo = RepositorioProjeto(db)
+def obter_projeto(projeto_id: int, request: Request, response: Response, db: Session = Depends(get_db_leitura)):
     semestre_atual = get_current_semester()
+    etag = gerar_etag(chave_projeto(projeto_id), obter_versao(db, chave_projeto(projeto_id)), semestre_atual)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
+    repo = RepositorioProjeto(db)
     projeto = repo.get_dashboard_details(projeto_id, semestre_atual)
     if not projeto:
         raise HTTPException(status_code=404, detail="Projeto não encontrado")
+    definir_etag(response, etag)
     return projeto
 
 
@@ -79,16 +122,46 @@ def obter_projeto(projeto_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_200_OK,
             summary="Lista projetos para o dashboard (ADM)",
             dependencies=[Depends(role_required("adm"))])
-def get_projetos_dashboard(db: Session = Depends(get_db)):
+def get_projetos_dashboard(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    status_projeto: Optional[schemas.StatusProjeto] = Query(None, alias="status"),
+    id_empresa: Optional[int] = None,
+    semestre: Optional[int] = None,
+    db: Session = Depends(get_db_leitura)
+):
     """
     Retorna uma lista de todos os projetos com informações consolidadas
     para o dashboard (Fase, Orientador Técnico, Empresa, Líder).
     A fase e o líder são baseados no semestre atual.
     
-    Acesso restrito a administradores.
+    Acesso restrito a administradores. Responde 304 se o If-None-Match
+    corresponder à versão atual (nenhuma consulta do dashboard é executada).
     """
+    etag = gerar_etag(CHAVE_DASHBOARD, obter_versao_dashboard(db), get_current_semester(),
+                      cursor, limite, ordenar.value, status_projeto, id_empresa, semestre)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
     repo = RepositorioProjeto(db)
-    return repo.listar_projetos_dashboard()
+    projetos, proximo_cursor = repo.listar_projetos_dashboard(
+        cursor, limite, ordenar.value,
+        status_projeto.value if status_projeto else None, id_empresa, semestre)
+    definir_proximo_cursor(response, proximo_cursor)
+    definir_etag(response, etag)
+    return projetos
+
+@router.get("/dashboard/export",
+            summary="Exporta o dashboard detalhado em CSV ou NDJSON (ADM)",
+            dependencies=[Depends(role_required("adm"))])
+def exportar_projetos_dashboard(formato: Literal["csv", "ndjson"] = "csv", semestre: Optional[int] = None):
+    """
+    Exporta todos os projetos (detalhes, empresa e nomes dos alunos do semestre)
+    em streaming, com memória constante independente do número de projetos.
+    """
+    return resposta_exportacao_dashboard(formato, semestre)
 
 @router.get("/dashboard/{projeto_id}",
             response_model=schemas.ProjetoDashboardDetailsResponse,
@@ -96,16 +169,42 @@ def get_projetos_dashboard(db: Session = Depends(get_db)):
             summary="Busca detalhes de um projeto para o dashboard",
             dependencies=[Depends(check_projeto_acesso)])
 
-def get_projeto_dashboard_details(projeto_id: int, db: Session = Depends(get_db)):
+def get_projeto_dashboard_details(projeto_id: int, request: Request, response: Response, db: Session = Depends(get_db_leitura)):
     """
     Retorna os detalhes de um projeto específico (Orientador, Empresa, Fase).
-    Acesso permitido para ADM e alunos membros do projeto.
+    Acesso permitido para ADM e alunos membros do projeto. Suporta If-None-Match.
     """
     semestre_atual = get_current_semester()
+    etag = gerar_etag(chave_projeto(projeto_id), obter_versao(db, chave_projeto(projeto_id)), semestre_atual)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
     repo = RepositorioProjeto(db)
     detalhes = repo.get_dashboard_details(projeto_id, semestre_atual)
     
     if not detalhes:
         raise HTTPException(status_code=404, detail="Projeto não encontrado")
         
-    return detalhes
\ No newline at end of file
+    definir_etag(response, etag)
+    return detalhes
+
+
+@router.get("/dashboard/{projeto_id}/completo",
+            response_model=schemas.ProjetoDashboardCompletoResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Detalhes, equipe e fase de um projeto em uma única chamada",
+            dependencies=[Depends(check_projeto_acesso)])
+def get_projeto_dashboard_completo(projeto_id: int, request: Request, response: Response,
+                                   semestre: Optional[int] = None, db: Session = Depends(get_db_leitura)):
+    """
+    Página do projeto: detalhes, membros da equipe (com indicador de líder)
+    e fase do semestre informado (padrão: atual). Duas consultas ao banco.
+    """
+    semestre = semestre or get_current_semester()
+    etag = gerar_etag(chave_projeto(projeto_id), obter_versao(db, chave_projeto(projeto_id)), "completo", semestre)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
+    completo = RepositorioProjeto(db).get_dashboard_completo(projeto_id, semestre)
+    if not completo:
+        raise HTTPException(status_code=404, detail="Projeto não encontrado")
+    definir_etag(response, etag)
+    return completo
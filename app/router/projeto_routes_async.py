@@ -0,0 +1,183 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import Optional, Literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infra.sqlalchemy.config.database_async import get_async_db
+from app.utils.roteamento_leitura import get_async_db_leitura
+from app.schemas import schemas
+from app.infra.sqlalchemy.repositorios.projeto_async import RepositorioProjetoAsync
+from app.utils.acesso_projeto import cache_acesso_projeto, select_projetos_do_usuario
+from app.utils.jwt_bearer import get_current_user_async
+from app.utils.role_checker import role_required_async
+from app.utils.paginacao import LIMITE_PADRAO, LIMITE_MAXIMO, definir_proximo_cursor
+from app.utils.resposta_json import resposta_lista
+from app.utils.semestre import get_current_semester
+from app.router.projeto_routes import resposta_exportacao_dashboard
+from app.utils.versao_recurso import (
+    CHAVE_DASHBOARD, chave_projeto, select_versao, select_versao_dashboard, gerar_etag, etag_corresponde,
+    resposta_nao_modificada, definir_etag
+)
+
+
+# Versão async de projeto_routes (DB_ASYNC=true)
+router = APIRouter(prefix="/projetos",
+                   tags=["Projetos"],
+                   dependencies=[Depends(get_current_user_async)])
+
+
+async def check_projeto_acesso(
+    projeto_id: int,
+    current_user: dict = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Dependência de segurança:
+    - Permite 'adm'
+    - Permite 'aluno' SOMENTE SE ele for ou já foi membro do projeto (em qualquer semestre).
+    """
+    if current_user.get("role") == "adm":
+        return current_user
+
+    user_id = current_user.get("user_id")
+    projetos, geracao = cache_acesso_projeto.obter(user_id)
+    if projetos is None:
+        projetos = cache_acesso_projeto.registrar(
+            user_id, (await db.scalars(select_projetos_do_usuario(user_id))).all(), geracao)
+
+    if projeto_id not in projetos:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Acesso negado. Você não faz parte ou nunca fez parte deste projeto."
+        )
+    return current_user
+
+
+@router.post("/", response_model=schemas.ProjetoResponse, status_code=status.HTTP_201_CREATED, dependencies=[Depends(role_required_async("adm"))])
+async def criar_projeto(projeto: schemas.ProjetoCreate, db: AsyncSession = Depends(get_async_db)):
+    repo = RepositorioProjetoAsync(db)
+    return await repo.criar_projeto_completo(projeto)
+
+
+@router.get("/", response_model=list[schemas.ProjetoResponse], status_code=status.HTTP_200_OK, dependencies=[Depends(role_required_async("adm"))])
+async def listar_projetos(
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    status_projeto: Optional[schemas.StatusProjeto] = Query(None, alias="status"),
+    id_empresa: Optional[int] = None,
+    semestre: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db_leitura)
+):
+    """Lista paginada por cursor; o cursor da próxima página vem no header X-Next-Cursor."""
+    repo = RepositorioProjetoAsync(db)
+    projetos, proximo_cursor = await repo.listar(
+        cursor, limite, ordenar.value,
+        status_projeto.value if status_projeto else None, id_empresa, semestre)
+    return resposta_lista(projetos, proximo_cursor)
+
+
+@router.get("/{projeto_id}", response_model=schemas.ProjetoDashboardDetailsResponse, status_code=status.HTTP_200_OK, dependencies=[Depends(role_required_async("adm"))])
+async def obter_projeto(projeto_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db_leitura)):
+    semestre_atual = get_current_semester()
+    versao = await db.scalar(select_versao(chave_projeto(projeto_id))) or 0
+    etag = gerar_etag(chave_projeto(projeto_id), versao, semestre_atual)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
+    repo = RepositorioProjetoAsync(db)
+    projeto = await repo.get_dashboard_details(projeto_id, semestre_atual)
+    if not projeto:
+        raise HTTPException(status_code=404, detail="Projeto não encontrado")
+    definir_etag(response, etag)
+    return projeto
+
+
+@router.get("/dashboard/all",
+            response_model=list[schemas.ProjetoDashboardResponse],
+            status_code=status.HTTP_200_OK,
+            summary="Lista projetos para o dashboard (ADM)",
+            dependencies=[Depends(role_required_async("adm"))])
+async def get_projetos_dashboard(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limite: int = Query(LIMITE_PADRAO, ge=1, le=LIMITE_MAXIMO),
+    ordenar: schemas.OrdenacaoLista = schemas.OrdenacaoLista.ID,
+    status_projeto: Optional[schemas.StatusProjeto] = Query(None, alias="status"),
+    id_empresa: Optional[int] = None,
+    semestre: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db_leitura)
+):
+    """
+    Retorna uma lista de todos os projetos com informações consolidadas
+    para o dashboard. Acesso restrito a administradores. Suporta If-None-Match.
+    """
+    versao = await db.scalar(select_versao_dashboard())
+    etag = gerar_etag(CHAVE_DASHBOARD, versao, get_current_semester(),
+                      cursor, limite, ordenar.value, status_projeto, id_empresa, semestre)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
+    repo = RepositorioProjetoAsync(db)
+    projetos, proximo_cursor = await repo.listar_projetos_dashboard(
+        cursor, limite, ordenar.value,
+        status_projeto.value if status_projeto else None, id_empresa, semestre)
+    definir_proximo_cursor(response, proximo_cursor)
+    definir_etag(response, etag)
+    return projetos
+
+@router.get("/dashboard/export",
+            summary="Exporta o dashboard detalhado em CSV ou NDJSON (ADM)",
+            dependencies=[Depends(role_required_async("adm"))])
+def exportar_projetos_dashboard(formato: Literal["csv", "ndjson"] = "csv", semestre: Optional[int] = None):
+    """
+    Exporta todos os projetos em streaming. O gerador usa a sessão síncrona
+    (cursor do lado do servidor) e roda no threadpool do Starlette.
+    """
+    return resposta_exportacao_dashboard(formato, semestre)
+
+@router.get("/dashboard/{projeto_id}",
+            response_model=schemas.ProjetoDashboardDetailsResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Busca detalhes de um projeto para o dashboard",
+            dependencies=[Depends(check_projeto_acesso)])
+async def get_projeto_dashboard_details(projeto_id: int, request: Request, response: Response,
+                                        db: AsyncSession = Depends(get_async_db_leitura)):
+    """
+    Retorna os detalhes de um projeto específico (Orientador, Empresa, Fase).
+    Acesso permitido para ADM e alunos membros do projeto. Suporta If-None-Match.
+    """
+    semestre_atual = get_current_semester()
+    versao = await db.scalar(select_versao(chave_projeto(projeto_id))) or 0
+    etag = gerar_etag(chave_projeto(projeto_id), versao, semestre_atual)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
+    repo = RepositorioProjetoAsync(db)
+    detalhes = await repo.get_dashboard_details(projeto_id, semestre_atual)
+
+    if not detalhes:
+        raise HTTPException(status_code=404, detail="Projeto não encontrado")
+
+    definir_etag(response, etag)
+    return detalhes
+
+
+@router.get("/dashboard/{projeto_id}/completo",
+            response_model=schemas.ProjetoDashboardCompletoResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Detalhes, equipe e fase de um projeto em uma única chamada",
+            dependencies=[Depends(check_projeto_acesso)])
+async def get_projeto_dashboard_completo(projeto_id: int, request: Request, response: Response,
+                                         semestre: Optional[int] = None,
+                                         db: AsyncSession = Depends(get_async_db_leitura)):
+    """
+    Página do projeto: detalhes, membros da equipe (com indicador de líder)
+    e fase do semestre informado (padrão: atual). Duas consultas ao banco.
+    """
+    semestre = semestre or get_current_semester()
+    versao = await db.scalar(select_versao(chave_projeto(projeto_id))) or 0
+    etag = gerar_etag(chave_projeto(projeto_id), versao, "completo", semestre)
+    if etag_corresponde(request, etag):
+        return resposta_nao_modificada(etag)
+    completo = await RepositorioProjetoAsync(db).get_dashboard_completo(projeto_id, semestre)
+    if not completo:
+        raise HTTPException(status_code=404, detail="Projeto não encontrado")
+    definir_etag(response, etag)
+    return completo
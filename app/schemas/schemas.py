@@ -4,6 +4,13 @@ from datetime import date
 from enum import Enum
 
 
+## Paginação ##
+
+class OrdenacaoLista(str, Enum):
+    ID = 'id'
+    NOME = 'nome'
+
+
 ## Login ##
 
 class LoginRequest(BaseModel):
@@ -37,6 +44,16 @@ class AlunoResponse(BaseModel):
     class Config:
         from_attributes  = True
 
+class AlunoImportErro(BaseModel):
+    linha: int
+    email: Optional[str] = None
+    erro: str
+
+class AlunoImportResponse(BaseModel):
+    total: int
+    importados: int
+    erros: List[AlunoImportErro]
+
 class AlunoUpdate(BaseModel):
     nome: Optional[str] = None
     email: Optional[str] = None
@@ -172,6 +189,10 @@ class ProjetoDashboardMemberResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ProjetoDashboardCompletoResponse(ProjetoDashboardDetailsResponse):
+    semestre: int
+    equipe: List[ProjetoDashboardMemberResponse] = []
+
 
 ## Equipe ##
 
@@ -202,6 +223,22 @@ class MembroEquipeResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class StatusMembroLote(str, Enum):
+    ADICIONADO = 'adicionado'
+    NAO_ALUNO = 'nao_aluno'
+    JA_MEMBRO = 'ja_membro'
+    DUPLICADO = 'duplicado'
+
+class MembroEquipeLoteResultado(BaseModel):
+    id_usuario: int
+    status: StatusMembroLote
+
+class MembroEquipeLoteResponse(BaseModel):
+    id_equipe: int
+    adicionados: int
+    rejeitados: int
+    resultados: List[MembroEquipeLoteResultado]
+
 
 ## Equipe Projeto ##
 
@@ -262,3 +299,19 @@ class OrientadorProjetoResponse(BaseModel):
 
 class ForgotPasswordRequest(BaseModel):
     email: str
+
+
+## Busca ##
+
+class TipoBusca(str, Enum):
+    PROJETO = 'projeto'
+    EMPRESA = 'empresa'
+    ALUNO = 'aluno'
+
+class ResultadoBuscaResponse(BaseModel):
+    tipo: TipoBusca
+    id: int
+    nome: str
+    # Início da descrição (projeto/empresa) ou curso (aluno)
+    descricao: Optional[str] = None
+    relevancia: float
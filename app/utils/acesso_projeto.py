@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.infra.sqlalchemy.models import models
+
+# Por quanto tempo (s) o conjunto de projetos de um aluno é confiado sem consultar o banco.
+# No processo que fez a escrita a invalidação é imediata; nos demais workers, em até TTL.
+ACESSO_PROJETO_TTL = float(os.getenv("ACESSO_PROJETO_TTL", 60))
+ACESSO_PROJETO_MAX_ENTRIES = int(os.getenv("ACESSO_PROJETO_MAX_ENTRIES", 10000))
+
+
+def select_projetos_do_usuario(id_usuario: int):
+    """Projetos dos quais o usuário é ou já foi membro (qualquer semestre)."""
+    return select(models.Equipe_Projeto.id_projeto).join(
+        models.Membro_Equipe,
+        models.Membro_Equipe.id_equipe == models.Equipe_Projeto.id_equipe
+    ).filter(
+        models.Membro_Equipe.id_usuario == id_usuario
+    ).distinct()
+
+
+def select_membros_da_equipe(id_equipe: int):
+    return select(models.Membro_Equipe.id_usuario).filter(models.Membro_Equipe.id_equipe == id_equipe)
+
+
+class CacheAcessoProjeto:
+    """
+    Cache LRU usuário -> frozenset(ids de projeto), com TTL, usado por
+    check_projeto_acesso. Os repositórios invalidam os usuários afetados
+    após cada escrita de membros ou de equipe-projeto. Um contador de
+    geração impede que uma leitura iniciada antes da invalidação grave
+    um conjunto já desatualizado.
+    """
+
+    def __init__(self, ttl: float, max_entradas: int):
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self._entradas: OrderedDict[int, tuple[frozenset, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._geracao = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidacoes = 0
+
+    def obter(self, id_usuario: int) -> tuple[frozenset | None, int]:
+        """Retorna (projetos em cache ou None, geração atual para usar em `registrar`)."""
+        with self._lock:
+            entrada = self._entradas.get(id_usuario)
+            if entrada is not None:
+                if entrada[1] > time.monotonic():
+                    self._entradas.move_to_end(id_usuario)
+                    self.hits += 1
+                    return entrada[0], self._geracao
+                del self._entradas[id_usuario]
+            self.misses += 1
+            return None, self._geracao
+
+    def registrar(self, id_usuario: int, projetos, geracao: int) -> frozenset:
+        projetos = frozenset(projetos)
+        if self.max_entradas <= 0:
+            return projetos
+        with self._lock:
+            if geracao == self._geracao:
+                self._entradas[id_usuario] = (projetos, time.monotonic() + self.ttl)
+                self._entradas.move_to_end(id_usuario)
+                while len(self._entradas) > self.max_entradas:
+                    self._entradas.popitem(last=False)
+        return projetos
+
+    def invalidar(self, ids_usuarios):
+        with self._lock:
+            self._geracao += 1
+            for id_usuario in ids_usuarios:
+                if self._entradas.pop(id_usuario, None) is not None:
+                    self.invalidacoes += 1
+
+    def limpar(self):
+        with self._lock:
+            self._geracao += 1
+            self.invalidacoes += len(self._entradas)
+            self._entradas.clear()
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidacoes": self.invalidacoes,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+cache_acesso_projeto = CacheAcessoProjeto(ACESSO_PROJETO_TTL, ACESSO_PROJETO_MAX_ENTRIES)
+
+
+def projetos_do_usuario(db: Session, id_usuario: int) -> frozenset:
+    """Conjunto de projetos do usuário; consulta o banco apenas na falta do cache."""
+    projetos, geracao = cache_acesso_projeto.obter(id_usuario)
+    if projetos is None:
+        projetos = cache_acesso_projeto.registrar(
+            id_usuario, db.scalars(select_projetos_do_usuario(id_usuario)).all(), geracao)
+    return projetos
+
+
+def invalidar_membros_equipe(db: Session, id_equipe: int):
+    """Invalida o cache dos membros da equipe (após relacionar/desrelacionar um projeto)."""
+    cache_acesso_projeto.invalidar(db.scalars(select_membros_da_equipe(id_equipe)).all())
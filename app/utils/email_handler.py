@@ -1,41 +1,179 @@
-import os
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
-from pydantic import BaseModel, EmailStr
-from typing import List
+import logging
+import smtplib
+import ssl
+import threading
+import time
+from email.message import EmailMessage
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.configuracoes import Configuracoes
+from app.infra.sqlalchemy.config.database import SessionLocal
+from app.infra.sqlalchemy.repositorios.email_outbox import RepositorioEmailOutbox
 
+logger = logging.getLogger(__name__)
 
-class EmailSchema(BaseModel):
-    email: List[EmailStr]
+class ConexaoSMTP:
+    """Mantém uma conexão SMTP aberta e a reutiliza entre envios e lotes."""
 
+    def __init__(self, configuracoes: Configuracoes):
+        self.configuracoes = configuracoes
+        self._smtp: smtplib.SMTP | None = None
+        self._ultimo_uso = 0.0
+        self.conexoes_abertas = 0
 
-# Configuração carregada a partir das variáveis de ambiente
-conf = ConnectionConfig(
-    MAIL_USERNAME=os.getenv("MAIL_USERNAME"),
-    MAIL_PASSWORD=os.getenv("MAIL_PASSWORD"),
-    MAIL_FROM=os.getenv("MAIL_FROM"),
-    MAIL_PORT=int(os.getenv("MAIL_PORT", 587)),
-    MAIL_SERVER=os.getenv("MAIL_SERVER"),
-    MAIL_STARTTLS=os.getenv("MAIL_STARTTLS", "True").lower() == "true",
-    MAIL_SSL_TLS=os.getenv("MAIL_SSL_TLS", "False").lower() == "true",
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True
-)
+    def _abrir(self) -> smtplib.SMTP:
+        c = self.configuracoes
+        contexto = ssl.create_default_context()
+        if c.mail_ssl_tls:
+            smtp = smtplib.SMTP_SSL(c.mail_server, c.mail_port, timeout=c.mail_timeout, context=contexto)
+        else:
+            smtp = smtplib.SMTP(c.mail_server, c.mail_port, timeout=c.mail_timeout)
+            if c.mail_starttls:
+                smtp.starttls(context=contexto)
+        if c.mail_username:
+            smtp.login(c.mail_username, c.mail_password)
+        self.conexoes_abertas += 1
+        return smtp
 
+    def _ociosa(self) -> bool:
+        return time.monotonic() - self._ultimo_uso > self.configuracoes.email_smtp_ocioso
 
-async def send_email(recipient_email: str, subject: str, body: str):
+    def enviar(self, mensagem: EmailMessage):
+        if self._smtp is not None and self._ociosa():
+            self.fechar()
+        if self._smtp is None:
+            self._smtp = self._abrir()
+        try:
+            self._smtp.send_message(mensagem)
+        except smtplib.SMTPServerDisconnected:
+            # O servidor encerrou a conexão reaproveitada: reconecta uma vez
+            self._smtp = self._abrir()
+            self._smtp.send_message(mensagem)
+        self._ultimo_uso = time.monotonic()
+
+    def fechar_se_ociosa(self):
+        if self._smtp is not None and self._ociosa():
+            self.fechar()
+
+    def fechar(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+
+def montar_mensagem(remetente: str | None, destinatario: str, assunto: str, corpo: str) -> EmailMessage:
+    mensagem = EmailMessage()
+    mensagem["Subject"] = assunto
+    mensagem["From"] = remetente
+    mensagem["To"] = destinatario
+    mensagem.set_content(corpo, subtype="html")
+    return mensagem
+
+
+class WorkerEmail:
+    """
+    Thread que consome a email_outbox: reserva um lote, envia pela mesma
+    conexão SMTP e reagenda falhas com backoff exponencial. É acordada logo
+    após o commit de um e-mail enfileirado; senão, verifica a fila a cada
+    `email_worker_intervalo` segundos (para retentativas e outros processos).
+    As configurações vêm de create_app() (ver `configurar`).
+    """
+
+    def __init__(self, configuracoes: Configuracoes | None = None):
+        self._thread: threading.Thread | None = None
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._lock = threading.Lock()
+        self.total_enviados = 0
+        self.total_falhas = 0
+        self.ultimo_erro: str | None = None
+        self.configurar(configuracoes or Configuracoes())
+
+    def configurar(self, configuracoes: Configuracoes):
+        """Troca SMTP e parâmetros da fila; chamado com o worker parado."""
+        self.configuracoes = configuracoes
+        self.conexao = ConexaoSMTP(configuracoes)
+
+    def iniciar(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._parar.clear()
+            self._thread = threading.Thread(target=self._executar, name="email-worker", daemon=True)
+            self._thread.start()
+
+    def parar(self, timeout: float = 10):
+        self._parar.set()
+        self._acordar.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def notificar(self):
+        self._acordar.set()
+
+    def _executar(self):
+        while not self._parar.is_set():
+            try:
+                processados = self.processar_lote()
+            except Exception:
+                logger.exception("Erro no worker de e-mail")
+                processados = 0
+            if processados >= self.configuracoes.email_lote:
+                continue
+            self.conexao.fechar_se_ociosa()
+            self._acordar.wait(self.configuracoes.email_worker_intervalo)
+            self._acordar.clear()
+        self.conexao.fechar()
+
+    def processar_lote(self) -> int:
+        """Envia um lote da fila. Cada resultado é gravado logo após o envio."""
+        c = self.configuracoes
+        with SessionLocal(expire_on_commit=False) as db:
+            repositorio = RepositorioEmailOutbox(db)
+            emails = repositorio.reservar_lote(c.email_lote, c.email_reserva_expira)
+            for email in emails:
+                try:
+                    self.conexao.enviar(montar_mensagem(c.mail_from, email.destinatario, email.assunto, email.corpo))
+                    repositorio.marcar_enviado(email)
+                    db.commit()
+                    with self._lock:
+                        self.total_enviados += 1
+                except Exception as e:
+                    # Qualquer erro (mensagem inválida, banco...) reagenda só este
+                    # e-mail; os demais do lote seguem
+                    db.rollback()
+                    if isinstance(e, (smtplib.SMTPException, OSError)):
+                        self.conexao.fechar()
+                    logger.exception("Erro ao enviar e-mail para %s", email.destinatario)
+                    repositorio.marcar_falha(email, str(e), c.email_max_tentativas, c.email_backoff_base)
+                    db.commit()
+                    with self._lock:
+                        self.total_falhas += 1
+                        self.ultimo_erro = str(e)
+            return len(emails)
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            return {
+                "ativo": self._thread is not None and self._thread.is_alive(),
+                "total_enviados": self.total_enviados,
+                "total_falhas": self.total_falhas,
+                "conexoes_smtp_abertas": self.conexao.conexoes_abertas,
+                "ultimo_erro": self.ultimo_erro,
+            }
+
+
+worker_email = WorkerEmail()
+
+
+def enfileirar_email(db: Session, destinatario: str, assunto: str, corpo: str):
     """
-    Envia um e-mail para o destinatário especificado.
+    Grava o e-mail na email_outbox usando a transação de `db` (sem commit).
+    O worker é acordado assim que a transação for confirmada.
     """
-    try:
-        message = MessageSchema(
-            subject=subject,
-            recipients=[recipient_email],
-            body=body,
-            subtype="html"
-        )
-
-        fm = FastMail(conf)
-        await fm.send_message(message)
-        print(f"E-mail enviado para {recipient_email}")
-    except Exception as e:
-        print(f"Erro ao enviar e-mail para {recipient_email}: {e}")
+    RepositorioEmailOutbox(db).enfileirar(destinatario, assunto, corpo)
+    event.listen(db, "after_commit", lambda _sessao: worker_email.notificar(), once=True)
@@ -0,0 +1,46 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import Iterable, Iterator
+
+# Quantas linhas acumular antes de enviar um pedaço ao cliente
+LINHAS_POR_PEDACO = 500
+
+
+def _valor_json(valor):
+    if isinstance(valor, date):
+        return valor.isoformat()
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+
+def gerar_ndjson(linhas: Iterable[dict]) -> Iterator[str]:
+    """Um objeto JSON por linha, enviado em pedaços de LINHAS_POR_PEDACO."""
+    pedaco = []
+    for linha in linhas:
+        pedaco.append(json.dumps(linha, ensure_ascii=False, default=_valor_json))
+        if len(pedaco) >= LINHAS_POR_PEDACO:
+            yield "\n".join(pedaco) + "\n"
+            pedaco = []
+    if pedaco:
+        yield "\n".join(pedaco) + "\n"
+
+
+def gerar_csv(linhas: Iterable[dict], colunas: list[str]) -> Iterator[str]:
+    """CSV com cabeçalho; listas viram texto separado por '; '."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(colunas)
+    contador = 0
+    for linha in linhas:
+        writer.writerow([
+            "; ".join(valor) if isinstance(valor, list) else valor
+            for valor in (linha.get(coluna) for coluna in colunas)
+        ])
+        contador += 1
+        if contador >= LINHAS_POR_PEDACO:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            contador = 0
+    yield buffer.getvalue()
@@ -0,0 +1,163 @@
+import bisect
+import heapq
+import math
+import re
+import unicodedata
+
+# Peso de um termo encontrado no nome em relação ao encontrado só na descrição
+PESO_NOME = 3.0
+# Peso de um casamento por prefixo ("eng" -> "engenharia") em relação ao exato
+PESO_PREFIXO = 0.5
+# Termos a partir deste tamanho casam por prefixo; os menores, só exatos
+# (mesmo comportamento do innodb_ft_min_token_size padrão do MySQL)
+PREFIXO_MIN = 3
+# Olhar os tokens de um candidato custa ~ percorrer esta quantidade de postings
+CUSTO_CANDIDATO = 8
+
+_PALAVRA = re.compile(r"\w+")
+# Diacríticos combinantes que sobram da decomposição NFKD ("ã" -> "a" + "~")
+_ACENTOS = re.compile(r"[\u0300-\u036f]")
+
+
+def normalizar(texto: str) -> str:
+    """Minúsculas e sem acentos ("Gestão" -> "gestao")."""
+    texto = texto.lower()
+    if texto.isascii():
+        return texto
+    return _ACENTOS.sub("", unicodedata.normalize("NFKD", texto))
+
+
+def tokenizar(texto: str | None) -> list[str]:
+    return _PALAVRA.findall(normalizar(texto)) if texto else []
+
+
+class IndiceInvertido:
+    """
+    Índice invertido em memória: token -> conjunto dos ids dos documentos,
+    separado por campo (nome e texto). Busca com E entre os termos, prefixo
+    e ranking por IDF. Não é thread-safe: quem usa serializa o acesso.
+    """
+
+    def __init__(self):
+        self._nome: dict[str, set[int]] = {}
+        self._texto: dict[str, set[int]] = {}
+        # id -> (tokens do nome, tokens do texto), para remover/atualizar o documento
+        self._documentos: dict[int, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        self._vocabulario: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._documentos)
+
+    def adicionar(self, id_documento: int, nome: str | None, texto: str | None = None):
+        if id_documento in self._documentos:
+            self.remover(id_documento)
+        tokens_nome = tuple(dict.fromkeys(tokenizar(nome)))
+        tokens_texto = tuple(dict.fromkeys(tokenizar(texto)))
+        self._documentos[id_documento] = (tokens_nome, tokens_texto)
+        for postings, tokens in ((self._nome, tokens_nome), (self._texto, tokens_texto)):
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is None:
+                    ids = postings[token] = set()
+                    self._novo_token(token)
+                ids.add(id_documento)
+
+    def remover(self, id_documento: int):
+        tokens = self._documentos.pop(id_documento, None)
+        if tokens is None:
+            return
+        for postings, tokens_campo in zip((self._nome, self._texto), tokens):
+            for token in tokens_campo:
+                ids = postings[token]
+                ids.discard(id_documento)
+                if not ids:
+                    del postings[token]
+                    self._token_removido(token)
+
+    def _novo_token(self, token: str):
+        if self._vocabulario is not None:
+            indice = bisect.bisect_left(self._vocabulario, token)
+            if indice == len(self._vocabulario) or self._vocabulario[indice] != token:
+                self._vocabulario.insert(indice, token)
+
+    def _token_removido(self, token: str):
+        if self._vocabulario is not None and token not in self._nome and token not in self._texto:
+            indice = bisect.bisect_left(self._vocabulario, token)
+            if indice < len(self._vocabulario) and self._vocabulario[indice] == token:
+                del self._vocabulario[indice]
+
+    def _expandir(self, termo: str) -> list[tuple[str, float]]:
+        """Tokens que casam com o termo: o próprio e, se longo o bastante, os que começam com ele."""
+        if len(termo) < PREFIXO_MIN:
+            return [(termo, 1.0)]
+        if self._vocabulario is None:
+            self._vocabulario = sorted(self._nome.keys() | self._texto.keys())
+        tokens = []
+        indice = bisect.bisect_left(self._vocabulario, termo)
+        while indice < len(self._vocabulario) and self._vocabulario[indice].startswith(termo):
+            token = self._vocabulario[indice]
+            tokens.append((token, 1.0 if token == termo else PESO_PREFIXO))
+            indice += 1
+        return tokens
+
+    def _pesos(self, termo: str, total: int) -> dict[str, float]:
+        """Token -> peso (IDF x fator de prefixo) de cada token que casa com o termo."""
+        pesos = {}
+        for token, fator in self._expandir(termo):
+            frequencia = len(self._nome.get(token, ())) + len(self._texto.get(token, ()))
+            if frequencia:
+                pesos[token] = math.log(1 + total / frequencia) * fator
+        return pesos
+
+    def _pontuar_postings(self, pesos: dict[str, float]) -> dict[int, float]:
+        pontos: dict[int, float] = {}
+        for token, peso in pesos.items():
+            for id_documento in self._texto.get(token, ()):
+                if pontos.get(id_documento, 0.0) < peso:
+                    pontos[id_documento] = peso
+            peso_nome = peso * PESO_NOME
+            for id_documento in self._nome.get(token, ()):
+                if pontos.get(id_documento, 0.0) < peso_nome:
+                    pontos[id_documento] = peso_nome
+        return pontos
+
+    def _pontuar_candidatos(self, candidatos: dict[int, float], pesos: dict[str, float]) -> dict[int, float]:
+        """Como _pontuar_postings, mas olhando os tokens de cada candidato (poucos candidatos, termo comum)."""
+        pontos = {}
+        for id_documento, anterior in candidatos.items():
+            tokens_nome, tokens_texto = self._documentos[id_documento]
+            peso = max([pesos[t] * PESO_NOME for t in tokens_nome if t in pesos]
+                       + [pesos[t] for t in tokens_texto if t in pesos], default=0.0)
+            if peso:
+                pontos[id_documento] = anterior + peso
+        return pontos
+
+    def buscar(self, termos: list[str]) -> dict[int, float]:
+        """Documentos que casam com todos os termos -> relevância."""
+        total = len(self._documentos)
+        por_termo = []
+        for termo in dict.fromkeys(termos):
+            pesos = self._pesos(termo, total)
+            if not pesos:
+                return {}
+            custo = sum(len(self._nome.get(t, ())) + len(self._texto.get(t, ())) for t in pesos)
+            por_termo.append((custo, pesos))
+        # Do termo mais raro ao mais comum: os seguintes só precisam pontuar quem restou
+        por_termo.sort(key=lambda item: item[0])
+        resultado: dict[int, float] | None = None
+        for custo, pesos in por_termo:
+            if resultado is None:
+                resultado = self._pontuar_postings(pesos)
+            elif len(resultado) * CUSTO_CANDIDATO < custo:
+                resultado = self._pontuar_candidatos(resultado, pesos)
+            else:
+                pontos = self._pontuar_postings(pesos)
+                resultado = {d: p + pontos[d] for d, p in resultado.items() if d in pontos}
+            if not resultado:
+                return {}
+        return resultado or {}
+
+    @staticmethod
+    def melhores(pontos: dict[int, float], quantidade: int) -> list[tuple[int, float]]:
+        """Os `quantidade` mais relevantes; empate decidido pelo menor id."""
+        return heapq.nsmallest(quantidade, pontos.items(), key=lambda item: (-item[1], item[0]))
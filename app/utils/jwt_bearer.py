@@ -1,45 +1,82 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.utils.jwt_handler import SECRET_KEY, ALGORITHM
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.utils.jwt_handler import decodificar_token
 from app.infra.sqlalchemy.config.database import get_db
+from app.infra.sqlalchemy.config.database_async import get_async_db
 from app.infra.sqlalchemy.models import models
+from app.utils.role_version import obter_role_version, obter_role_version_async
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-):
+def _ler_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("user_id")
-        email: str = payload.get("email")
-
-        if user_id is None or email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token inválido",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        # 🔑 Calcula role sempre que validar o token
-        role = get_user_role(db, user_id)
-
-        return {
-            "user_id": user_id,
-            "email": email,
-            "role": role
-        }
-
+        payload = decodificar_token(token)
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido ou expirado",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if payload.get("user_id") is None or payload.get("email") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token inválido",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
+
+def _verificar_role_version(payload: dict, versao: int | None):
+    if payload.get("rv") != versao:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Permissões alteradas. Faça login novamente.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+):
+    payload = _ler_token(token)
+    user_id = payload["user_id"]
+
+    # 🔑 A role vem assinada no token; só consulta o banco se a versão
+    # de role em cache expirou ou se o token é antigo (sem a claim "role")
+    role = payload.get("role")
+    if role is None:
+        role = get_user_role(db, user_id)
+    else:
+        _verificar_role_version(payload, obter_role_version(db, user_id))
+    # Devolve a conexão ao pool até a rota usar o banco: rotas com outra sessão
+    # (get_db_leitura) segurariam duas conexões por requisição e esgotariam o pool
+    db.rollback()
+
+    return {"user_id": user_id, "email": payload["email"], "role": role}
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Versão de get_current_user para os routers async (DB_ASYNC): consulta pelo AsyncSession."""
+    payload = _ler_token(token)
+    user_id = payload["user_id"]
+
+    role = payload.get("role")
+    if role is None:
+        role = await get_user_role_async(db, user_id)
+    else:
+        _verificar_role_version(payload, await obter_role_version_async(db, user_id))
+    await db.rollback()
+
+    return {"user_id": user_id, "email": payload["email"], "role": role}
 
 
 def get_user_role(db: Session, user_id: int) -> str:
@@ -59,4 +96,12 @@ def get_user_role(db: Session, user_id: int) -> str:
         return "aluno"
 
     # Default
-    return "aluno"
\ No newline at end of file
+    return "aluno"
+
+async def get_user_role_async(db: AsyncSession, user_id: int) -> str:
+    gestor = await db.scalar(select(models.Orientador.id_usuario).where(
+        models.Orientador.id_usuario == user_id,
+        models.Orientador.id_tipo_orientador == 2
+    ).limit(1))
+    # Sem o tipo de gestão, o usuário é tratado como aluno (mesma regra de get_user_role)
+    return "adm" if gestor else "aluno"
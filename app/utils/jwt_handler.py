@@ -1,26 +1,113 @@
-import os
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
 from fastapi import HTTPException, status
+from app.configuracoes import Configuracoes
 
 
-SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Definida por create_app() (Configuracoes.jwt_secret_key)
+_chave_secreta: str | None = None
+
+
+def configurar_tokens(configuracoes: Configuracoes):
+    """Chave de assinatura e tamanho do cache de tokens verificados."""
+    global _chave_secreta
+    _chave_secreta = configuracoes.jwt_secret_key
+    cache_tokens.configurar(configuracoes.token_cache_max_entries)
+
+
+def _obter_chave() -> str:
+    if not _chave_secreta:
+        raise RuntimeError("JWT_SECRET_KEY não configurada (Configuracoes.jwt_secret_key).")
+    return _chave_secreta
+
 
 def criar_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
     expire = datetime.now(
         timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _obter_chave(), algorithm=ALGORITHM)
     return encoded_jwt
 
 
+class CacheTokens:
+    """
+    Cache LRU de payloads de JWT já verificados, indexado pelo SHA-256 do token.
+    Cada entrada expira no 'exp' do próprio token, então nunca devolve um
+    payload vencido. Tokens inválidos não são guardados.
+    """
+
+    def __init__(self, max_entradas: int):
+        self.max_entradas = max_entradas
+        self._entradas: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def decodificar(self, token: str) -> dict:
+        chave = hashlib.sha256(token.encode()).digest()
+        agora = time.time()
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None:
+                if entrada[1] > agora:
+                    self._entradas.move_to_end(chave)
+                    self.hits += 1
+                    return entrada[0]
+                del self._entradas[chave]
+            self.misses += 1
+
+        # Verificação da assinatura fora do lock; levanta JWTError se inválido
+        payload = jwt.decode(token, _obter_chave(), algorithms=[ALGORITHM])
+
+        exp = payload.get("exp")
+        if exp is not None and self.max_entradas > 0:
+            with self._lock:
+                self._entradas[chave] = (payload, float(exp))
+                self._entradas.move_to_end(chave)
+                while len(self._entradas) > self.max_entradas:
+                    self._entradas.popitem(last=False)
+        return payload
+
+    def configurar(self, max_entradas: int):
+        with self._lock:
+            self.max_entradas = max_entradas
+            self._entradas.clear()
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+cache_tokens = CacheTokens(Configuracoes.token_cache_max_entries)
+
+
+def decodificar_token(token: str) -> dict:
+    """Decodifica e verifica o JWT, reaproveitando verificações recentes."""
+    return cache_tokens.decodificar(token)
+
+
 def verificar_token(token: str):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decodificar_token(token)
         return payload
     except JWTError:
         raise HTTPException(
@@ -0,0 +1,154 @@
+import bisect
+import os
+import threading
+import time
+from app.infra.sqlalchemy.config.instrumentacao import EstatisticasSQL, contexto_sql, detectar_n_mais_1
+
+# Se definido, GET /metrics exige "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_CONSULTAS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Rótulo usado quando nenhuma rota casou (404), para não criar uma série por URL
+ROTA_NAO_ENCONTRADA = "nao_encontrada"
+
+
+class Histograma:
+    """Histograma cumulativo no formato do Prometheus (buckets fixos)."""
+
+    __slots__ = ("buckets", "contagens", "soma", "total")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.contagens = [0] * len(buckets)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor: float):
+        indice = bisect.bisect_left(self.buckets, valor)
+        if indice < len(self.contagens):
+            self.contagens[indice] += 1
+        self.soma += valor
+        self.total += 1
+
+    def linhas(self, nome: str, rotulos: str) -> list[str]:
+        linhas, acumulado = [], 0
+        for limite, contagem in zip(self.buckets, self.contagens):
+            acumulado += contagem
+            linhas.append(f'{nome}_bucket{{{rotulos},le="{limite}"}} {acumulado}')
+        linhas.append(f'{nome}_bucket{{{rotulos},le="+Inf"}} {self.total}')
+        linhas.append(f"{nome}_sum{{{rotulos}}} {self.soma:.6f}")
+        linhas.append(f"{nome}_count{{{rotulos}}} {self.total}")
+        return linhas
+
+
+def escapar_rotulo(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RegistroMetricas:
+    """
+    Métricas HTTP por rota (template, não a URL): latência, status, requisições
+    em andamento, tempo de banco e consultas por requisição. Cada requisição
+    faz uma única atualização sob o lock; a formatação só acontece em /metrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.em_andamento = 0
+        self.latencia: dict[tuple[str, str], Histograma] = {}
+        self.tempo_banco: dict[tuple[str, str], Histograma] = {}
+        self.consultas: dict[tuple[str, str], Histograma] = {}
+        self.respostas: dict[tuple[str, str, int], int] = {}
+
+    def iniciar_requisicao(self):
+        with self._lock:
+            self.em_andamento += 1
+
+    def finalizar_requisicao(self, metodo: str, rota: str, status_code: int, duracao: float,
+                             estatisticas: EstatisticasSQL):
+        chave = (metodo, rota)
+        with self._lock:
+            self.em_andamento -= 1
+            if chave not in self.latencia:
+                self.latencia[chave] = Histograma(BUCKETS_LATENCIA)
+                self.tempo_banco[chave] = Histograma(BUCKETS_LATENCIA)
+                self.consultas[chave] = Histograma(BUCKETS_CONSULTAS)
+            self.latencia[chave].observar(duracao)
+            self.tempo_banco[chave].observar(estatisticas.tempo_s)
+            self.consultas[chave].observar(estatisticas.consultas)
+            chave_status = (metodo, rota, status_code)
+            self.respostas[chave_status] = self.respostas.get(chave_status, 0) + 1
+
+    def exportar(self) -> str:
+        """Texto no formato de exposição do Prometheus (text/plain; version=0.0.4)."""
+        linhas = []
+        with self._lock:
+            linhas += ["# HELP http_requests_in_progress Requisições HTTP em andamento.",
+                       "# TYPE http_requests_in_progress gauge",
+                       f"http_requests_in_progress {self.em_andamento}"]
+
+            linhas += ["# HELP http_requests_total Respostas HTTP por rota e status.",
+                       "# TYPE http_requests_total counter"]
+            for (metodo, rota, status_code), total in sorted(self.respostas.items()):
+                linhas.append(f'http_requests_total{{method="{metodo}",route="{escapar_rotulo(rota)}",'
+                              f'status="{status_code}"}} {total}')
+
+            for nome, ajuda, historico in (
+                ("http_request_duration_seconds", "Latência das requisições HTTP por rota.", self.latencia),
+                ("http_request_db_seconds", "Tempo gasto no banco por requisição.", self.tempo_banco),
+                ("http_request_db_statements", "Consultas SQL executadas por requisição.", self.consultas),
+            ):
+                linhas += [f"# HELP {nome} {ajuda}", f"# TYPE {nome} histogram"]
+                for (metodo, rota), histograma in sorted(historico.items()):
+                    linhas += histograma.linhas(nome, f'method="{metodo}",route="{escapar_rotulo(rota)}"')
+        return "\n".join(linhas) + "\n"
+
+    def limpar(self):
+        with self._lock:
+            self.latencia.clear()
+            self.tempo_banco.clear()
+            self.consultas.clear()
+            self.respostas.clear()
+
+
+registro_metricas = RegistroMetricas()
+
+
+class MiddlewareMetricas:
+    """
+    Middleware ASGI puro (sem BaseHTTPMiddleware, que cria uma task por
+    requisição). A rota é lida de scope["route"], preenchido pelo roteador.
+    """
+
+    def __init__(self, app, registro: RegistroMetricas = registro_metricas):
+        self.app = app
+        self.registro = registro
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def enviar(mensagem):
+            nonlocal status_code
+            if mensagem["type"] == "http.response.start":
+                status_code = mensagem["status"]
+            await send(mensagem)
+
+        estatisticas = EstatisticasSQL(f"{scope['method']} {scope['path']}")
+        token = contexto_sql.set(estatisticas)
+        self.registro.iniciar_requisicao()
+        inicio = time.perf_counter()
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            duracao = time.perf_counter() - inicio
+            contexto_sql.reset(token)
+            rota = getattr(scope.get("route"), "path", None) or ROTA_NAO_ENCONTRADA
+            self.registro.finalizar_requisicao(scope["method"], rota, status_code, duracao, estatisticas)
+            if estatisticas.formas:
+                detectar_n_mais_1(estatisticas, f"{scope['method']} {rota}")
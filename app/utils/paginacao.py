@@ -0,0 +1,64 @@
+import base64
+import json
+import os
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+
+# Limites de página impostos pelo servidor
+LIMITE_PADRAO = int(os.getenv("PAGINACAO_LIMITE_PADRAO", 50))
+LIMITE_MAXIMO = int(os.getenv("PAGINACAO_LIMITE_MAXIMO", 500))
+
+# Header com o cursor da próxima página (ausente na última página)
+HEADER_PROXIMO_CURSOR = "X-Next-Cursor"
+
+
+def codificar_cursor(ordenar: str, valores: list) -> str:
+    """Gera o cursor opaco (base64url) com a ordenação e a chave da última linha."""
+    bruto = json.dumps({"o": ordenar, "v": valores}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(bruto.encode()).decode().rstrip("=")
+
+
+def decodificar_cursor(cursor: str, ordenar: str) -> list:
+    try:
+        preenchido = cursor + "=" * (-len(cursor) % 4)
+        dados = json.loads(base64.urlsafe_b64decode(preenchido.encode()))
+        valores = dados["v"]
+        cursor_ordenar = dados["o"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido.")
+    if cursor_ordenar != ordenar or not isinstance(valores, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor não corresponde à ordenação solicitada."
+        )
+    return valores
+
+
+def paginar(query, colunas: list, cursor: str | None, ordenar: str, limite: int):
+    """
+    Aplica a ordenação estável (a última coluna deve ser a chave primária),
+    o filtro keyset a partir do cursor e LIMIT limite+1 (para saber se há
+    próxima página). Funciona tanto com Query quanto com Select.
+    """
+    if cursor:
+        valores = decodificar_cursor(cursor, ordenar)
+        if len(valores) != len(colunas):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido.")
+        if len(colunas) == 1:
+            query = query.filter(colunas[0] > valores[0])
+        else:
+            query = query.filter(tuple_(*colunas) > tuple_(*valores))
+    return query.order_by(*colunas).limit(limite + 1)
+
+
+def fechar_pagina(linhas: list, chave, ordenar: str, limite: int) -> tuple[list, str | None]:
+    """Corta a linha extra e devolve (itens, cursor da próxima página ou None)."""
+    if len(linhas) <= limite:
+        return linhas, None
+    itens = linhas[:limite]
+    return itens, codificar_cursor(ordenar, chave(itens[-1]))
+
+
+def definir_proximo_cursor(response: Response, proximo_cursor: str | None):
+    if proximo_cursor:
+        response.headers[HEADER_PROXIMO_CURSOR] = proximo_cursor
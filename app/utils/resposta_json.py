@@ -0,0 +1,35 @@
+import orjson
+from fastapi import Response
+from app.utils.paginacao import definir_proximo_cursor
+
+
+class RespostaJSONRapida(Response):
+    """
+    JSON serializado com orjson, sem passar pelo response_model: para listas
+    já montadas como dicts de tipos simples (ver colunas_resposta). Mesmo
+    formato do caminho padrão (compacto, UTF-8, datas em ISO 8601).
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def colunas_resposta(modelo, schema) -> list:
+    """Colunas do modelo com os campos do schema de resposta, na mesma ordem (mesmo JSON)."""
+    return [getattr(modelo, campo) for campo in schema.model_fields]
+
+
+def como_dicts(linhas: list) -> list[dict]:
+    """Linhas de Core -> dicts, lendo os nomes das colunas uma vez (Row._asdict refaz a cada linha)."""
+    if not linhas:
+        return []
+    chaves = linhas[0]._fields
+    return [dict(zip(chaves, linha)) for linha in linhas]
+
+
+def resposta_lista(itens: list[dict], proximo_cursor: str | None) -> RespostaJSONRapida:
+    """Página de uma listagem de leitura, com o cursor da próxima no header X-Next-Cursor."""
+    resposta = RespostaJSONRapida(itens)
+    definir_proximo_cursor(resposta, proximo_cursor)
+    return resposta
@@ -1,5 +1,14 @@
 from fastapi import Depends, HTTPException, status
-from app.utils.jwt_bearer import get_current_user
+from app.utils.jwt_bearer import get_current_user, get_current_user_async
+
+def _verificar_role(current_user: dict, required_roles: list[str]) -> dict:
+    user_role = current_user.get("role")
+    if user_role not in required_roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Acesso negado. Requer {required_roles}, mas você é '{user_role}'."
+        )
+    return current_user
 
 def role_required(required_roles: list[str] | str):
     """
@@ -10,11 +19,14 @@ def role_required(required_roles: list[str] | str):
         required_roles = [required_roles]
 
     def wrapper(current_user: dict = Depends(get_current_user)):
-        user_role = current_user.get("role")
-        if user_role not in required_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Acesso negado. Requer {required_roles}, mas você é '{user_role}'."
-            )
-        return current_user
+        return _verificar_role(current_user, required_roles)
+    return wrapper
+
+def role_required_async(required_roles: list[str] | str):
+    """Versão de role_required para os routers async (usa get_current_user_async)."""
+    if isinstance(required_roles, str):
+        required_roles = [required_roles]
+
+    async def wrapper(current_user: dict = Depends(get_current_user_async)):
+        return _verificar_role(current_user, required_roles)
     return wrapper
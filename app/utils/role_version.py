@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+from itertools import chain
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infra.sqlalchemy.models import models
+
+# Por quanto tempo (s) a versão de role de um usuário é confiada sem consultar o banco.
+# No processo que fez a alteração a invalidação é imediata (eventos de flush/commit);
+# nos demais workers o token antigo ainda vale por até TTL segundos. 0: toda
+# requisição confere a versão no banco (uma consulta pela chave primária).
+ROLE_VERSION_TTL = float(os.getenv("ROLE_VERSION_TTL", 5))
+ROLE_VERSION_MAX_ENTRIES = int(os.getenv("ROLE_VERSION_MAX_ENTRIES", 10000))
+
+# Tabelas que definem a role (ver get_user_role)
+_CLASSES_ROLE = (models.Aluno, models.Orientador)
+
+_lock = threading.Lock()
+_versoes: dict[int, tuple[int, float]] = {}
+# Incrementada a cada invalidação: uma leitura iniciada antes dela não grava
+# no cache uma versão já desatualizada (mesmo esquema de CacheAcessoProjeto)
+_geracao = 0
+
+
+def geracao_role_versions() -> int:
+    """Geração atual; obter antes de ler a versão no banco e passar a `registrar_role_version`."""
+    with _lock:
+        return _geracao
+
+
+def registrar_role_version(user_id: int, versao: int, geracao: int):
+    if not ROLE_VERSION_TTL:
+        return
+    with _lock:
+        if geracao != _geracao:
+            return
+        if len(_versoes) >= ROLE_VERSION_MAX_ENTRIES and user_id not in _versoes:
+            _versoes.clear()
+        _versoes[user_id] = (versao, time.monotonic() + ROLE_VERSION_TTL)
+
+
+def _versao_em_cache(user_id: int) -> tuple[int | None, int]:
+    """(versão em cache ou None, geração atual)."""
+    with _lock:
+        entrada = _versoes.get(user_id)
+        geracao = _geracao
+    if entrada and entrada[1] > time.monotonic():
+        return entrada[0], geracao
+    return None, geracao
+
+
+def _select_role_version(user_id: int):
+    return select(models.Usuario.role_version).where(models.Usuario.id_usuario == user_id)
+
+
+def obter_role_version(db: Session, user_id: int) -> int | None:
+    """
+    Retorna a versão de role do usuário. Usa o cache em memória enquanto
+    estiver válido; caso contrário faz uma única consulta na tabela usuario.
+    """
+    versao, geracao = _versao_em_cache(user_id)
+    if versao is not None:
+        return versao
+    versao = db.scalar(_select_role_version(user_id))
+    if versao is not None:
+        registrar_role_version(user_id, versao, geracao)
+    return versao
+
+
+async def obter_role_version_async(db: AsyncSession, user_id: int) -> int | None:
+    """Versão de obter_role_version para os routers async."""
+    versao, geracao = _versao_em_cache(user_id)
+    if versao is not None:
+        return versao
+    versao = await db.scalar(_select_role_version(user_id))
+    if versao is not None:
+        registrar_role_version(user_id, versao, geracao)
+    return versao
+
+
+def _esquecer(user_ids):
+    global _geracao
+    with _lock:
+        _geracao += 1
+        for user_id in user_ids:
+            _versoes.pop(user_id, None)
+
+
+def _esquecer_na_transacao(db: Session, user_ids):
+    """
+    Esquece agora e de novo no fim da transação: até o commit, outras requisições
+    ainda leem a versão antiga no banco e poderiam recolocá-la no cache.
+    """
+    db.info.setdefault("roles_esquecer", set()).update(user_ids)
+    _esquecer(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _esquecer_apos_transacao(session):
+    user_ids = session.info.pop("roles_esquecer", None)
+    if user_ids:
+        _esquecer(user_ids)
+
+
+def incrementar_role_version(db: Session, user_id: int):
+    """
+    Invalida os tokens emitidos para o usuário. Não faz commit: vale junto
+    com a transação de quem chama.
+    """
+    db.execute(
+        update(models.Usuario)
+        .where(models.Usuario.id_usuario == user_id)
+        .values(role_version=models.Usuario.role_version + 1)
+    )
+    _esquecer_na_transacao(db, [user_id])
+
+
+def _role_mudou(objeto) -> bool:
+    if isinstance(objeto, models.Orientador):
+        return inspect(objeto).attrs.id_tipo_orientador.history.has_changes()
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _coletar_roles_alteradas(session, contexto):
+    """
+    Inserir ou remover Aluno/Orientador (ou trocar o tipo de orientador) pelo
+    ORM incrementa a versão de role do usuário na mesma transação. Usuários
+    criados no mesmo flush ficam de fora: ainda não têm token. Escritas de
+    Core nessas tabelas precisam chamar incrementar_role_version.
+    """
+    novos = {u.id_usuario for u in session.new if isinstance(u, models.Usuario)}
+    user_ids = {
+        objeto.id_usuario
+        for objeto in chain(session.new, session.deleted, session.dirty)
+        if isinstance(objeto, _CLASSES_ROLE) and objeto.id_usuario not in novos
+        and (objeto not in session.dirty or _role_mudou(objeto))
+    }
+    if user_ids:
+        session.info.setdefault("roles_alteradas", set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _incrementar_roles_alteradas(session, contexto):
+    user_ids = session.info.pop("roles_alteradas", None)
+    if not user_ids:
+        return
+    usuario = models.Usuario.__table__
+    session.connection().execute(
+        update(usuario)
+        .where(usuario.c.id_usuario.in_(user_ids))
+        .values(role_version=usuario.c.role_version + 1)
+    )
+    for objeto in list(session.identity_map.values()):
+        if isinstance(objeto, models.Usuario) and objeto.id_usuario in user_ids:
+            session.expire(objeto, ["role_version"])
+    _esquecer_na_transacao(session, user_ids)
+
+
+def limpar_role_versions():
+    global _geracao
+    with _lock:
+        _geracao += 1
+        _versoes.clear()
@@ -0,0 +1,161 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from fastapi import Request
+from starlette.requests import cookie_parser
+from app.infra.sqlalchemy.config.database import SessionLocal, SessionLeitura
+from app.infra.sqlalchemy.config.database_async import AsyncSessionLocal, AsyncSessionLeitura
+
+FIXACAO_MAX_ENTRIES = int(os.getenv("FIXACAO_MAX_ENTRIES", 10000))
+# Instante (ms desde a época) da última escrita do cliente; vale entre workers
+COOKIE_ULTIMA_ESCRITA = "ultima_escrita"
+METODOS_LEITURA = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class FixacaoPrimario:
+    """
+    Clientes que escreveram há pouco -> instante até o qual leem do primário,
+    para não verem a réplica atrasada em relação à própria escrita. Vale no
+    processo que recebeu a escrita; o cookie ultima_escrita cobre os demais.
+    """
+
+    def __init__(self, max_entradas: int):
+        self.max_entradas = max_entradas
+        self._entradas: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.leituras_replica = 0
+        self.leituras_primario = 0
+        self.fixacoes = 0
+
+    def fixar(self, chave: str, segundos: float):
+        with self._lock:
+            self._entradas[chave] = time.monotonic() + segundos
+            self._entradas.move_to_end(chave)
+            self.fixacoes += 1
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+
+    def fixado(self, chave: str) -> bool:
+        with self._lock:
+            expira = self._entradas.get(chave)
+            if expira is None:
+                return False
+            if expira > time.monotonic():
+                return True
+            del self._entradas[chave]
+            return False
+
+    def registrar_leitura(self, primario: bool):
+        with self._lock:
+            if primario:
+                self.leituras_primario += 1
+            else:
+                self.leituras_replica += 1
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            return {
+                "clientes_fixados": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "fixacoes": self.fixacoes,
+                "leituras_replica": self.leituras_replica,
+                "leituras_primario": self.leituras_primario,
+            }
+
+
+fixacao_primario = FixacaoPrimario(FIXACAO_MAX_ENTRIES)
+
+
+def _cabecalho(scope, nome: bytes) -> str | None:
+    for chave, valor in scope["headers"]:
+        if chave == nome:
+            return valor.decode("latin-1")
+    return None
+
+
+def chave_cliente(scope) -> str:
+    """Cliente = token enviado (hash) ou, sem Authorization, o IP de origem."""
+    autorizacao = _cabecalho(scope, b"authorization")
+    if autorizacao:
+        return hashlib.sha256(autorizacao.encode()).hexdigest()
+    cliente = scope.get("client")
+    return cliente[0] if cliente else ""
+
+
+class MiddlewareRoteamentoLeitura:
+    """
+    Middleware ASGI puro, instalado só quando há réplica configurada.
+    Escritas bem-sucedidas (POST/PUT/PATCH/DELETE com status < 400) fixam o
+    cliente no primário por `segundos` e gravam o cookie ultima_escrita;
+    em leituras, decide em request.state.ler_do_primario para get_db_leitura.
+    """
+
+    def __init__(self, app, segundos: float, fixacao: FixacaoPrimario = fixacao_primario):
+        self.app = app
+        self.segundos = segundos
+        self.fixacao = fixacao
+
+    def _escreveu_ha_pouco(self, scope) -> bool:
+        if self.fixacao.fixado(chave_cliente(scope)):
+            return True
+        cookies = _cabecalho(scope, b"cookie")
+        if not cookies:
+            return False
+        try:
+            ultima_escrita_ms = int(cookie_parser(cookies).get(COOKIE_ULTIMA_ESCRITA, ""))
+        except ValueError:
+            return False
+        return 0 <= time.time() * 1000 - ultima_escrita_ms < self.segundos * 1000
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in METODOS_LEITURA:
+            scope.setdefault("state", {})["ler_do_primario"] = self._escreveu_ha_pouco(scope)
+            await self.app(scope, receive, send)
+            return
+
+        async def enviar(mensagem):
+            if mensagem["type"] == "http.response.start" and mensagem["status"] < 400:
+                self.fixacao.fixar(chave_cliente(scope), self.segundos)
+                cookie = (f"{COOKIE_ULTIMA_ESCRITA}={int(time.time() * 1000)}; "
+                          f"Max-Age={max(int(self.segundos), 1)}; Path=/; HttpOnly; SameSite=Lax")
+                mensagem["headers"] = list(mensagem.get("headers", [])) + [(b"set-cookie", cookie.encode())]
+            await send(mensagem)
+
+        await self.app(scope, receive, enviar)
+
+
+def _ler_do_primario(request: Request) -> bool:
+    primario = getattr(request.state, "ler_do_primario", None)
+    if primario is None:
+        # Sem réplica o middleware não é instalado e SessionLeitura já usa o primário
+        return False
+    fixacao_primario.registrar_leitura(primario)
+    return primario
+
+
+def get_db_leitura(request: Request):
+    """
+    get_db das rotas só de leitura (dashboard, listar, obter): sessão na réplica,
+    ou no primário se o cliente escreveu há pouco. Não escrever com esta sessão.
+    """
+    db = SessionLocal() if _ler_do_primario(request) else SessionLeitura()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db_leitura(request: Request):
+    """Versão async de get_db_leitura."""
+    async with (AsyncSessionLocal() if _ler_do_primario(request) else AsyncSessionLeitura()) as db:
+        yield db
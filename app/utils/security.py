@@ -1,9 +1,21 @@
 # app/utils/security.py
 
+import asyncio
+import os
 import random
 import string
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from fastapi import HTTPException, status
 from passlib.hash import bcrypt
 
+# Pool dedicado ao bcrypt: "thread" (padrão) ou "process"
+PASSWORD_POOL_MODE = os.getenv("PASSWORD_POOL_MODE", "thread").lower()
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", os.cpu_count() or 2))
+# Máximo de operações aguardando/em execução; acima disso responde 503
+PASSWORD_POOL_MAX_PENDING = int(os.getenv("PASSWORD_POOL_MAX_PENDING", 64))
+
 def gerar_senha(comprimento: int = 8) -> str:
     """
     Gera uma senha aleatória de 8 caracteres com exatamente 2 números
@@ -22,8 +34,131 @@ def gerar_senha(comprimento: int = 8) -> str:
     # Retorna a senha como uma string
     return ''.join(senha_lista)
 
-def hash_senha(senha: str) -> str:
+def _bcrypt_hash(senha: str) -> str:
     return bcrypt.hash(senha)
 
-def verificar_senha(senha: str, senha_hash: str) -> bool:
+def _bcrypt_verify(senha: str, senha_hash: str) -> bool:
     return bcrypt.verify(senha, senha_hash)
+
+
+class PoolSenhas:
+    """
+    Executor limitado para o trabalho de CPU do bcrypt. Mantém uma fila
+    com no máximo `max_pendentes` operações; excedendo, rejeita com 503
+    para que uma rajada de logins não monopolize a CPU dos workers.
+    """
+
+    def __init__(self, modo: str, workers: int, max_pendentes: int):
+        self.modo = modo
+        self.workers = workers
+        self.max_pendentes = max_pendentes
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self.pendentes = 0
+        self.pico_pendentes = 0
+        self.total_concluidas = 0
+        self.total_rejeitadas = 0
+
+    def _obter_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.modo == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    def _concluir(self, _future):
+        with self._lock:
+            self.pendentes -= 1
+            self.total_concluidas += 1
+
+    def submeter(self, fn, *args):
+        with self._lock:
+            if self.pendentes >= self.max_pendentes:
+                self.total_rejeitadas += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Servidor ocupado. Tente novamente em instantes.",
+                    headers={"Retry-After": "1"},
+                )
+            self.pendentes += 1
+            self.pico_pendentes = max(self.pico_pendentes, self.pendentes)
+        try:
+            future = self._obter_executor().submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self.pendentes -= 1
+            raise
+        future.add_done_callback(self._concluir)
+        return future
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            return {
+                "modo": self.modo,
+                "workers": self.workers,
+                "max_pendentes": self.max_pendentes,
+                "pendentes": self.pendentes,
+                "pico_pendentes": self.pico_pendentes,
+                "total_concluidas": self.total_concluidas,
+                "total_rejeitadas": self.total_rejeitadas,
+            }
+
+    def encerrar(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+pool_senhas = PoolSenhas(PASSWORD_POOL_MODE, PASSWORD_POOL_WORKERS, PASSWORD_POOL_MAX_PENDING)
+
+
+def hash_senha(senha: str) -> str:
+    return pool_senhas.submeter(_bcrypt_hash, senha).result()
+
+def verificar_senha(senha: str, senha_hash: str) -> bool:
+    return pool_senhas.submeter(_bcrypt_verify, senha, senha_hash).result()
+
+def _janela_hashes() -> int:
+    return max(1, min(pool_senhas.workers * 2, pool_senhas.max_pendentes // 2))
+
+def hash_senhas(senhas: list[str]) -> list[str]:
+    """
+    Gera os hashes de várias senhas em paralelo no pool (use PASSWORD_POOL_MODE=process
+    para usar todos os núcleos). Mantém no máximo uma janela de tarefas na fila
+    para não esgotar PASSWORD_POOL_MAX_PENDING e não rejeitar logins concorrentes.
+    """
+    janela = _janela_hashes()
+    hashes: list[str] = []
+    pendentes = deque()
+    for senha in senhas:
+        if len(pendentes) >= janela:
+            hashes.append(pendentes.popleft().result())
+        pendentes.append(pool_senhas.submeter(_bcrypt_hash, senha))
+    while pendentes:
+        hashes.append(pendentes.popleft().result())
+    return hashes
+
+async def hash_senhas_async(senhas: list[str]) -> list[str]:
+    """Versão de hash_senhas para rotas async (mesma janela): não bloqueia o event loop."""
+    janela = _janela_hashes()
+    hashes: list[str] = []
+    pendentes = deque()
+    for senha in senhas:
+        if len(pendentes) >= janela:
+            hashes.append(await pendentes.popleft())
+        pendentes.append(asyncio.wrap_future(pool_senhas.submeter(_bcrypt_hash, senha)))
+    while pendentes:
+        hashes.append(await pendentes.popleft())
+    return hashes
+
+async def hash_senha_async(senha: str) -> str:
+    """Versão para rotas async: não bloqueia o event loop."""
+    return await asyncio.wrap_future(pool_senhas.submeter(_bcrypt_hash, senha))
+
+async def verificar_senha_async(senha: str, senha_hash: str) -> bool:
+    """Versão para rotas async: não bloqueia o event loop."""
+    return await asyncio.wrap_future(pool_senhas.submeter(_bcrypt_verify, senha, senha_hash))
@@ -0,0 +1,15 @@
+from datetime import date, datetime
+
+
+def get_current_semester() -> int:
+    """Semestre atual no formato YYYYS (ex.: 20251, 20252)."""
+    now = datetime.now()
+    return int(f"{now.year}{1 if 1 <= now.month <= 6 else 2}")
+
+
+def formatar_semestre_inicial(data_ini: date | None) -> str | None:
+    """Formata a data de início como 'YYYY.S' (ex.: '2025.1')."""
+    if not data_ini:
+        return None
+    sem = 1 if 1 <= data_ini.month <= 6 else 2
+    return f"{data_ini.year}.{sem}"
@@ -0,0 +1,152 @@
+import hashlib
+from fastapi import Request, Response, status
+from sqlalchemy import select, update, insert, func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.infra.sqlalchemy.models import models
+
+# Versão da coleção /projetos/dashboard/all, dividida em FRACOES_DASHBOARD linhas
+# ("dashboard:<n>", escolhida pelo id do projeto) somadas na leitura: escritas em
+# projetos diferentes não disputam a mesma linha. Cada projeto tem a sua ("projeto:<id>").
+CHAVE_DASHBOARD = "dashboard"
+PREFIXO_DASHBOARD = "dashboard:"
+FRACOES_DASHBOARD = 16
+PREFIXO_PROJETO = "projeto:"
+
+
+def chave_projeto(projeto_id: int) -> str:
+    return f"{PREFIXO_PROJETO}{projeto_id}"
+
+
+def chave_dashboard(projeto_id: int) -> str:
+    return f"{PREFIXO_DASHBOARD}{projeto_id % FRACOES_DASHBOARD}"
+
+
+def select_versao(chave: str):
+    return select(models.Versao_Recurso.versao).where(models.Versao_Recurso.chave == chave)
+
+
+def select_versao_dashboard():
+    """Soma das frações da versão do dashboard (uma leitura por faixa da chave primária)."""
+    return select(func.coalesce(func.sum(models.Versao_Recurso.versao), 0)).where(
+        models.Versao_Recurso.chave.startswith(PREFIXO_DASHBOARD))
+
+
+def obter_versao(db: Session, chave: str) -> int:
+    """Versão atual do recurso (0 se nunca foi alterado). Uma consulta por chave primária."""
+    return db.scalar(select_versao(chave)) or 0
+
+
+def obter_versao_dashboard(db: Session) -> int:
+    return db.scalar(select_versao_dashboard())
+
+
+def _upsert_versoes(dialeto: str, chaves: list[str]):
+    """INSERT ... (versao=1) que, se a chave existir, incrementa a versão; None se o banco não suporta."""
+    tabela = models.Versao_Recurso.__table__
+    linhas = [{"chave": chave, "versao": 1} for chave in chaves]
+    if dialeto == "mysql":
+        comando = mysql.insert(tabela).values(linhas)
+        return comando.on_duplicate_key_update(versao=tabela.c.versao + 1)
+    if dialeto == "sqlite":
+        comando = sqlite.insert(tabela).values(linhas)
+    elif dialeto == "postgresql":
+        comando = postgresql.insert(tabela).values(linhas)
+    else:
+        return None
+    return comando.on_conflict_do_update(index_elements=[tabela.c.chave], set_={"versao": tabela.c.versao + 1})
+
+
+def incrementar_versoes(db: Session, chaves: list[str]):
+    """
+    Incrementa as versões informadas (criando as que faltam) com um único
+    upsert: duas primeiras escritas concorrentes na mesma chave não colidem.
+    As chaves vão ordenadas (mesma ordem de bloqueio entre transações). Não faz commit.
+    """
+    chaves = sorted(set(chaves))
+    if not chaves:
+        return
+    comando = _upsert_versoes(db.get_bind().dialect.name, chaves)
+    if comando is not None:
+        db.execute(comando)
+        return
+    existentes = set(db.scalars(
+        select(models.Versao_Recurso.chave).where(models.Versao_Recurso.chave.in_(chaves))
+    ).all())
+    if existentes:
+        db.execute(
+            update(models.Versao_Recurso)
+            .where(models.Versao_Recurso.chave.in_(existentes))
+            .values(versao=models.Versao_Recurso.versao + 1)
+            .execution_options(synchronize_session=False)
+        )
+    novas = [{"chave": chave, "versao": 1} for chave in chaves if chave not in existentes]
+    if novas:
+        db.execute(insert(models.Versao_Recurso), novas)
+
+
+def incrementar_versoes_projetos(db: Session, projeto_ids: list[int] | None):
+    """
+    Invalida os ETags do dashboard e dos projetos informados (None = todos).
+    Chamado na mesma transação da escrita, antes do commit.
+    """
+    if projeto_ids is None:
+        db.execute(
+            update(models.Versao_Recurso)
+            .where(models.Versao_Recurso.chave.startswith(PREFIXO_PROJETO))
+            .values(versao=models.Versao_Recurso.versao + 1)
+            .execution_options(synchronize_session=False)
+        )
+        incrementar_versoes(db, [chave_dashboard(0)])
+        return
+    incrementar_versoes(db, [chave_dashboard(pid) for pid in projeto_ids]
+                        + [chave_projeto(pid) for pid in projeto_ids])
+
+
+def incrementar_versoes_equipe(db: Session, id_equipe: int):
+    """Invalida os projetos aos quais a equipe está relacionada (mudança de membros)."""
+    projeto_ids = db.scalars(
+        select(models.Equipe_Projeto.id_projeto)
+        .where(models.Equipe_Projeto.id_equipe == id_equipe)
+        .distinct()
+    ).all()
+    if projeto_ids:
+        incrementar_versoes_projetos(db, list(projeto_ids))
+
+
+def incrementar_versoes_empresa(db: Session, id_empresa: int):
+    """Invalida os projetos da empresa (o nome dela aparece nos detalhes)."""
+    projeto_ids = db.scalars(
+        select(models.Projeto.id_projeto).where(models.Projeto.id_empresa == id_empresa)
+    ).all()
+    if projeto_ids:
+        incrementar_versoes_projetos(db, list(projeto_ids))
+
+
+def gerar_etag(*partes) -> str:
+    """ETag fraco a partir da versão e dos parâmetros que alteram o corpo."""
+    bruto = "|".join(str(parte) for parte in partes)
+    return 'W/"' + hashlib.sha1(bruto.encode()).hexdigest()[:20] + '"'
+
+
+def etag_corresponde(request: Request, etag: str) -> bool:
+    """Compara com If-None-Match (comparação fraca, aceita lista e '*')."""
+    cabecalho = request.headers.get("if-none-match")
+    if not cabecalho:
+        return False
+    valor = etag.removeprefix("W/")
+    for candidato in cabecalho.split(","):
+        candidato = candidato.strip()
+        if candidato == "*" or candidato.removeprefix("W/") == valor:
+            return True
+    return False
+
+
+def resposta_nao_modificada(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+
+def definir_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
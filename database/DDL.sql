@@ -9,14 +9,17 @@ CREATE TABLE Usuario (
     nome       VARCHAR(255) NOT NULL,
     email      VARCHAR(255) NOT NULL UNIQUE,
     telefone   VARCHAR(20),
-    senha_hash VARCHAR(255) NOT NULL
+    senha_hash VARCHAR(255) NOT NULL,
+    role_version INT NOT NULL DEFAULT 0,  -- Incrementado ao mudar a role (invalida tokens)
+    FULLTEXT INDEX ft_usuario_nome (nome)  -- GET /busca
 );
 
 CREATE TABLE Empresa (
     id_empresa INT AUTO_INCREMENT PRIMARY KEY,
     nome       VARCHAR(255) NOT NULL,
     cnpj       VARCHAR(255) NOT NULL,
-    descricao  VARCHAR(455) NOT NULL
+    descricao  VARCHAR(455) NOT NULL,
+    FULLTEXT INDEX ft_empresa_nome_descricao (nome, descricao)  -- GET /busca
 );
 
 CREATE TABLE Aluno (
@@ -66,13 +69,31 @@ CREATE TABLE Projeto (
     status          ENUM('Ativo', 'Concluído', 'Cancelado') NOT NULL,
     nome_orientador VARCHAR(255),  -- Campo novo que adicionamos
     id_empresa      INT,           -- Agora vinculado a Empresa, não mais a Cliente
+    INDEX idx_projeto_status (status, id_projeto),
+    FULLTEXT INDEX ft_projeto_nome_descricao (nome, descricao),  -- GET /busca
     FOREIGN KEY (id_empresa) REFERENCES Empresa(id_empresa)
 );
 
+-- Resumo desnormalizado do dashboard (mantido pelos repositórios)
+CREATE TABLE Projeto_Dashboard (
+    id_projeto          INT PRIMARY KEY,
+    nome_projeto        VARCHAR(100) NOT NULL,
+    descricao           TEXT,
+    status              VARCHAR(20) NOT NULL,
+    fase                CHAR(1),
+    orientador_tecnico  VARCHAR(255),
+    semestre_inicial    VARCHAR(7),
+    semestre_referencia INT NOT NULL,
+    INDEX idx_projeto_dashboard_semestre (semestre_referencia),
+    INDEX idx_projeto_dashboard_status (status, id_projeto),
+    FOREIGN KEY (id_projeto) REFERENCES Projeto(id_projeto) ON DELETE CASCADE
+);
+
 CREATE TABLE Membro_Equipe (
     id_equipe  INT,
     id_usuario INT,
     PRIMARY KEY (id_equipe, id_usuario),
+    INDEX idx_membro_equipe_usuario (id_usuario, id_equipe),  -- check_projeto_acesso
     FOREIGN KEY (id_equipe) REFERENCES Equipe(id_equipe),
     FOREIGN KEY (id_usuario) REFERENCES Usuario(id_usuario)
 );
@@ -83,6 +104,7 @@ CREATE TABLE Equipe_Projeto (
     semestre   INT, 
     fase       CHAR(1), 
     PRIMARY KEY (id_equipe, id_projeto, semestre),
+    INDEX idx_equipe_projeto_projeto_semestre (id_projeto, semestre, id_equipe, fase),
     FOREIGN KEY (id_equipe) REFERENCES Equipe(id_equipe),
     FOREIGN KEY (id_projeto) REFERENCES Projeto(id_projeto)
 );
@@ -92,6 +114,7 @@ CREATE TABLE Lideranca (
     id_usuario INT,
     semestre   INT,
     PRIMARY KEY (id_projeto, id_usuario, semestre),
+    INDEX idx_lideranca_projeto_semestre (id_projeto, semestre, id_usuario),
     FOREIGN KEY (id_projeto) REFERENCES Projeto(id_projeto),
     FOREIGN KEY (id_usuario) REFERENCES Usuario(id_usuario)
 );
@@ -107,6 +130,29 @@ CREATE TABLE Orientador_Projeto (
     FOREIGN KEY (id_tipo_orientador) REFERENCES Tipo_Orientador(id_tipo_orientador)
 );
 
+-- Versões dos recursos do dashboard (ETag / If-None-Match)
+CREATE TABLE Versao_Recurso (
+    chave  VARCHAR(64) PRIMARY KEY,  -- 'dashboard:<n>' (n = id do projeto % 16) ou 'projeto:<id>'
+    versao INT NOT NULL DEFAULT 0
+);
+
+-- Fila persistente de e-mails (consumida pelo worker em segundo plano)
+CREATE TABLE Email_Outbox (
+    id_email          INT AUTO_INCREMENT PRIMARY KEY,
+    destinatario      VARCHAR(255) NOT NULL,
+    assunto           VARCHAR(255) NOT NULL,
+    corpo             TEXT NOT NULL,
+    status            ENUM('pendente', 'enviando', 'enviado', 'falhou') NOT NULL DEFAULT 'pendente',
+    tentativas        INT NOT NULL DEFAULT 0,
+    proxima_tentativa DATETIME NOT NULL,
+    reservado_em      DATETIME,
+    lote              VARCHAR(32),
+    ultimo_erro       VARCHAR(500),
+    criado_em         DATETIME NOT NULL,
+    enviado_em        DATETIME,
+    INDEX idx_email_outbox_status_proxima (status, proxima_tentativa)
+);
+
 -- =======================================================
 -- 3. INSERTS INICIAIS OBRIGATÓRIOS
 -- =======================================================
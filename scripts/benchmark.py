@@ -0,0 +1,253 @@
+"""
+Benchmark HTTP dos endpoints principais sobre um banco local populado.
+
+    python scripts/benchmark.py
+        Popula um SQLite temporário (gerar_dados.py), sobe app.main:app com uvicorn e compara
+        o resultado com scripts/benchmark_baseline.json (sai com 1 se regredir).
+
+    python scripts/benchmark.py --salvar-baseline
+        Grava a baseline desta máquina (latências dependem do hardware).
+
+    DATABASE_URL=mysql+pymysql://... python scripts/benchmark.py --sem-semear --senha ...
+        Usa um banco já populado com gerar_dados.py (ex.: MySQL local em container).
+
+Para cada cenário informa p50/p95/p99, vazão (req/s) e consultas SQL por
+requisição. As consultas são contadas em processo (TestClient), com os
+caches já aquecidos; a latência é medida via HTTP com clientes concorrentes.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+BASELINE_PADRAO = os.path.join(RAIZ, "scripts", "benchmark_baseline.json")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alunos", type=int, default=2000)
+    parser.add_argument("--projetos", type=int, default=300)
+    parser.add_argument("--semestres", type=int, default=4)
+    parser.add_argument("--concorrencia", type=int, default=16)
+    parser.add_argument("--requisicoes", type=int, default=400, help="requisições por cenário (login usa 1/8)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--semestre-final", type=int, help="último semestre da massa, AAAAS (padrão: o de gerar_dados.py)")
+    parser.add_argument("--sem-semear", action="store_true", help="usa o banco de DATABASE_URL como está")
+    parser.add_argument("--senha", help="senha dos usuários (padrão: a de gerar_dados.py)")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO)
+    parser.add_argument("--salvar-baseline", action="store_true")
+    parser.add_argument("--tolerancia", type=float, default=0.5,
+                        help="piora relativa aceita em p95 e vazão (padrão 0.5 = 50%%)")
+    return parser.parse_args()
+
+
+args = parse_args()
+# Configuração do app em processo e do servidor (uvicorn lê do ambiente do subprocesso)
+ambiente = {"DB_ENGINE_MODE": "prod", "DB_ECHO": "false", "EMAIL_WORKER_ATIVO": "false",
+            "JWT_SECRET_KEY": "benchmark", **os.environ}
+if not args.sem_semear:
+    ambiente["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "benchmark.db")
+
+import httpx  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+from app.configuracoes import Configuracoes  # noqa: E402
+from app.infra.sqlalchemy.config.database import Base, configurar_banco, get_engine  # noqa: E402
+from app.infra.sqlalchemy.config.instrumentacao import contar_consultas  # noqa: E402
+from app.infra.sqlalchemy.models import models  # noqa: E402
+from gerar_dados import EMAIL_ADM, SEMESTRE_FINAL, SENHA_PADRAO, gerar  # noqa: E402
+
+args.senha = args.senha or SENHA_PADRAO
+configuracoes = Configuracoes.de_ambiente(ambiente)
+configurar_banco(configuracoes)
+engine = get_engine()
+
+def semear():
+    """Massa sintética de gerar_dados.py com os volumes informados."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        gerar(conn, args.alunos, args.projetos, args.semestres, seed=args.seed, senha=args.senha,
+              semestre_final=args.semestre_final or SEMESTRE_FINAL)
+
+
+def cenarios(senha: str, total_projetos: int, total_equipes: int):
+    """(nome, método, função(aleatorio) -> (url, corpo), usa token de adm, requisições)."""
+    return [
+        ("login", "POST", lambda r: ("/auth/login", {"email": EMAIL_ADM, "senha": senha}), False,
+         max(1, args.requisicoes // 8)),
+        ("dashboard_all", "GET", lambda r: ("/projetos/dashboard/all?limite=50", None), True, args.requisicoes),
+        ("dashboard_id", "GET", lambda r: (f"/projetos/dashboard/{r.randint(1, total_projetos)}", None), True,
+         args.requisicoes),
+        ("equipes_membros", "GET", lambda r: (f"/equipes/{r.randint(1, total_equipes)}/membros", None), True,
+         args.requisicoes),
+        ("listar_alunos", "GET", lambda r: ("/alunos/?limite=50", None), True, args.requisicoes),
+    ]
+
+
+def consultas_por_requisicao(lista) -> dict[str, float]:
+    """Consultas SQL por requisição de cada cenário, em processo e com caches aquecidos."""
+    from fastapi.testclient import TestClient
+    from app.fabrica import create_app
+
+    cliente = TestClient(create_app(configuracoes))
+    token = cliente.post("/auth/login", json={"email": EMAIL_ADM, "senha": args.senha}).json()["access_token"]
+    cabecalhos = {"Authorization": f"Bearer {token}"}
+    aleatorio = random.Random(args.seed)
+    resultado = {}
+    for nome, metodo, requisicao, autenticada, _total in lista:
+        for rodada in range(6):
+            # a primeira rodada só aquece os caches
+            with contar_consultas(engine) as contador:
+                url, corpo = requisicao(aleatorio)
+                resposta = cliente.request(metodo, url, json=corpo, headers=cabecalhos if autenticada else None)
+            if resposta.status_code >= 400:
+                raise SystemExit(f"{nome}: {url} respondeu {resposta.status_code} {resposta.text[:200]}")
+            if rodada:
+                resultado[nome] = resultado.get(nome, 0) + contador.total / 5
+        resultado[nome] = round(resultado[nome], 2)
+    return resultado
+
+
+def porta_livre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def subir_servidor(porta: int) -> subprocess.Popen:
+    processo = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(porta), "--log-level", "warning"],
+        cwd=RAIZ, env=ambiente, stdout=subprocess.DEVNULL)
+    limite = time.monotonic() + 30
+    while time.monotonic() < limite:
+        try:
+            if httpx.get(f"http://127.0.0.1:{porta}/", timeout=1).status_code == 200:
+                return processo
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    processo.kill()
+    raise SystemExit("uvicorn não respondeu em 30s")
+
+
+def percentil(valores: list[float], p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+async def carga(base: str, token: str, nome, metodo, requisicao, autenticada, total) -> dict:
+    aleatorio = random.Random(f"{args.seed}-{nome}")
+    pedidos = [requisicao(aleatorio) for _ in range(total)]
+    cabecalhos = {"Authorization": f"Bearer {token}"} if autenticada else {}
+    latencias, erros = [], 0
+    limites = httpx.Limits(max_connections=args.concorrencia)
+
+    async with httpx.AsyncClient(base_url=base, headers=cabecalhos, limits=limites, timeout=60) as cliente:
+        async def trabalhador():
+            nonlocal erros
+            while pedidos:
+                url, corpo = pedidos.pop()
+                inicio = time.perf_counter()
+                resposta = await cliente.request(metodo, url, json=corpo)
+                latencias.append((time.perf_counter() - inicio) * 1000)
+                erros += resposta.status_code >= 400
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(trabalhador() for _ in range(args.concorrencia)))
+        duracao = time.perf_counter() - inicio
+
+    return {
+        "requisicoes": total,
+        "erros": erros,
+        "rps": round(total / duracao, 1),
+        "p50_ms": round(percentil(latencias, 50), 2),
+        "p95_ms": round(percentil(latencias, 95), 2),
+        "p99_ms": round(percentil(latencias, 99), 2),
+    }
+
+
+def comparar(resultados: dict, baseline: dict) -> list[str]:
+    """Regressões: mais consultas por requisição, ou p95/vazão piores que a tolerância."""
+    regressoes = []
+    mesmos_parametros = baseline.get("parametros") == parametros()
+    if not mesmos_parametros:
+        print("Aviso: parâmetros diferentes da baseline; comparando só consultas por requisição.")
+    for nome, atual in resultados.items():
+        base = baseline.get("cenarios", {}).get(nome)
+        if base is None:
+            continue
+        if atual["queries_por_req"] > base["queries_por_req"] + 0.01:
+            regressoes.append(f"{nome}: {atual['queries_por_req']} consultas/req (baseline {base['queries_por_req']})")
+        if not mesmos_parametros:
+            continue
+        if atual["p95_ms"] > base["p95_ms"] * (1 + args.tolerancia):
+            regressoes.append(f"{nome}: p95 {atual['p95_ms']}ms (baseline {base['p95_ms']}ms)")
+        if atual["rps"] < base["rps"] * (1 - args.tolerancia):
+            regressoes.append(f"{nome}: {atual['rps']} req/s (baseline {base['rps']} req/s)")
+        if atual["erros"]:
+            regressoes.append(f"{nome}: {atual['erros']} respostas com erro")
+    return regressoes
+
+
+def parametros() -> dict:
+    return {"alunos": args.alunos, "projetos": args.projetos, "semestres": args.semestres,
+            "concorrencia": args.concorrencia, "requisicoes": args.requisicoes}
+
+
+def main():
+    if not args.sem_semear:
+        semear()
+    with engine.connect() as conn:
+        total_projetos = conn.scalar(select(models.Projeto.id_projeto).order_by(models.Projeto.id_projeto.desc()).limit(1))
+        total_equipes = conn.scalar(select(models.Equipe.id_equipe).order_by(models.Equipe.id_equipe.desc()).limit(1))
+    lista = cenarios(args.senha, total_projetos, total_equipes)
+    consultas = consultas_por_requisicao(lista)
+
+    porta = porta_livre()
+    servidor = subir_servidor(porta)
+    base = f"http://127.0.0.1:{porta}"
+    try:
+        token = httpx.post(f"{base}/auth/login", json={"email": EMAIL_ADM, "senha": args.senha}).json()["access_token"]
+        resultados = {}
+        for nome, metodo, requisicao, autenticada, total in lista:
+            asyncio.run(carga(base, token, nome, metodo, requisicao, autenticada, min(total, 20)))  # aquecimento
+            resultados[nome] = asyncio.run(carga(base, token, nome, metodo, requisicao, autenticada, total))
+            resultados[nome]["queries_por_req"] = consultas[nome]
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+    print(f"{'cenário':<18}{'req':>6}{'erros':>7}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'SQL/req':>9}")
+    for nome, r in resultados.items():
+        print(f"{nome:<18}{r['requisicoes']:>6}{r['erros']:>7}{r['rps']:>9}{r['p50_ms']:>9}"
+              f"{r['p95_ms']:>9}{r['p99_ms']:>9}{r['queries_por_req']:>9}")
+
+    if args.salvar_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as arquivo:
+            json.dump({"parametros": parametros(), "cenarios": resultados}, arquivo, indent=2, ensure_ascii=False)
+            arquivo.write("\n")
+        print(f"\nBaseline gravada em {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("\nSem baseline para comparar (use --salvar-baseline).")
+        return
+    with open(args.baseline, encoding="utf-8") as arquivo:
+        regressoes = comparar(resultados, json.load(arquivo))
+    if regressoes:
+        print("\nRegressões:")
+        for regressao in regressoes:
+            print(f"  - {regressao}")
+        sys.exit(1)
+    print("\nSem regressões em relação à baseline.")
+
+
+if __name__ == "__main__":
+    main()
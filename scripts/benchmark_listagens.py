@@ -0,0 +1,148 @@
+"""
+Compara as listagens de leitura (projetos, empresas, equipes) no caminho
+antigo (entidades ORM + revalidação pelo response_model) e no atual (só as
+colunas da resposta, como linhas de Core, serializadas com orjson).
+
+    python scripts/benchmark_listagens.py
+        Popula um SQLite temporário (gerar_dados.py) e mede páginas de --limite itens.
+
+    DATABASE_URL=mysql+pymysql://... python scripts/benchmark_listagens.py --sem-semear
+        Usa um banco já populado com gerar_dados.py.
+
+Cada página é montada como numa requisição (sessão nova, consulta e
+serialização). Para cada listagem informa o tempo de CPU por página
+(mediana) e o pico de memória alocada (tracemalloc), e confere que os dois
+caminhos geram o mesmo JSON, byte a byte. Sai com 1 se o JSON divergir ou
+se o caminho atual não for mais barato.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alunos", type=int, default=4000)
+    parser.add_argument("--projetos", type=int, default=2000)
+    parser.add_argument("--empresas", type=int, default=1000)
+    parser.add_argument("--semestres", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--sem-semear", action="store_true", help="usa o banco de DATABASE_URL como está")
+    parser.add_argument("--limite", type=int, help="itens por página (padrão: PAGINACAO_LIMITE_MAXIMO)")
+    parser.add_argument("--repeticoes", type=int, default=30, help="páginas medidas por caminho")
+    return parser.parse_args()
+
+
+args = parse_args()
+if not args.sem_semear:
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "benchmark_listagens.db")
+os.environ.setdefault("DB_ENGINE_MODE", "prod")
+os.environ.setdefault("DB_ECHO", "false")
+
+from pydantic import TypeAdapter  # noqa: E402
+from app.infra.sqlalchemy.config.database import Base, SessionLocal, get_engine  # noqa: E402
+from app.infra.sqlalchemy.models import models  # noqa: E402
+from app.infra.sqlalchemy.repositorios.empresa import ORDENACOES_EMPRESA, RepositorioEmpresa  # noqa: E402
+from app.infra.sqlalchemy.repositorios.equipe import ORDENACOES_EQUIPE, RepositorioEquipe  # noqa: E402
+from app.infra.sqlalchemy.repositorios.projeto import ORDENACOES_PROJETO, RepositorioProjeto  # noqa: E402
+from app.schemas import schemas  # noqa: E402
+from app.utils.paginacao import LIMITE_MAXIMO, paginar  # noqa: E402
+from app.utils.resposta_json import RespostaJSONRapida  # noqa: E402
+from gerar_dados import gerar  # noqa: E402
+
+limite = args.limite or LIMITE_MAXIMO
+
+# (nome, modelo, ordenação por id, schema de resposta, listagem atual)
+LISTAGENS = [
+    ("projetos", models.Projeto, ORDENACOES_PROJETO["id"], schemas.ProjetoResponse,
+     lambda db: RepositorioProjeto(db).listar(None, limite)),
+    ("empresas", models.Empresa, ORDENACOES_EMPRESA["id"], schemas.EmpresaResponse,
+     lambda db: RepositorioEmpresa(db).listar(None, limite)),
+    ("equipes", models.Equipe, ORDENACOES_EQUIPE["id"], schemas.EquipeResponse,
+     lambda db: RepositorioEquipe(db).listar_equipes(None, limite)),
+]
+
+
+def semear():
+    """Massa sintética de gerar_dados.py com os volumes informados."""
+    Base.metadata.create_all(get_engine())
+    with get_engine().begin() as conn:
+        gerar(conn, args.alunos, args.projetos, args.semestres, empresas=args.empresas, seed=args.seed)
+
+
+def caminho_orm(modelo, ordenacao, schema):
+    """Como antes: entidades no identity map, validadas e serializadas pelo response_model."""
+    adaptador = TypeAdapter(list[schema])
+    colunas, _ = ordenacao
+
+    def pagina() -> bytes:
+        db = SessionLocal()
+        try:
+            entidades = paginar(db.query(modelo), colunas, None, "id", limite).all()[:limite]
+            return adaptador.dump_json(adaptador.validate_python(entidades, from_attributes=True))
+        finally:
+            db.close()
+    return pagina
+
+
+def caminho_core(listar):
+    def pagina() -> bytes:
+        db = SessionLocal()
+        try:
+            itens, _ = listar(db)
+            return RespostaJSONRapida(itens).body
+        finally:
+            db.close()
+    return pagina
+
+
+def medir(pagina) -> tuple[float, int, bytes]:
+    """(CPU por página em ms, mediana; pico de memória alocada em bytes; JSON gerado)."""
+    corpo = pagina()  # aquecimento (compilação das consultas, caches do SQLAlchemy)
+    tempos = []
+    for _ in range(args.repeticoes):
+        inicio = time.process_time()
+        pagina()
+        tempos.append(time.process_time() - inicio)
+    tracemalloc.start()
+    pagina()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(tempos) * 1000, pico, corpo
+
+
+def main():
+    if not args.sem_semear:
+        semear()
+
+    falhas = []
+    print(f"{'listagem':<10}{'itens':>6}{'CPU ORM ms':>12}{'CPU Core ms':>13}{'ganho':>7}"
+          f"{'pico ORM KiB':>14}{'pico Core KiB':>15}{'ganho':>7}")
+    for nome, modelo, ordenacao, schema, listar in LISTAGENS:
+        cpu_orm, pico_orm, corpo_orm = medir(caminho_orm(modelo, ordenacao, schema))
+        cpu_core, pico_core, corpo_core = medir(caminho_core(listar))
+        itens = len(TypeAdapter(list).validate_json(corpo_core))
+        print(f"{nome:<10}{itens:>6}{cpu_orm:>12.2f}{cpu_core:>13.2f}{cpu_orm / cpu_core:>6.1f}x"
+              f"{pico_orm / 1024:>14.0f}{pico_core / 1024:>15.0f}{pico_orm / pico_core:>6.1f}x")
+        if corpo_core != corpo_orm:
+            falhas.append(f"{nome}: JSON diferente do caminho ORM")
+        if cpu_core >= cpu_orm or pico_core >= pico_orm:
+            falhas.append(f"{nome}: caminho Core não foi mais barato")
+
+    if falhas:
+        print("\nFalhas:")
+        for falha in falhas:
+            print(f"  - {falha}")
+        sys.exit(1)
+    print("\nMesmo JSON nos dois caminhos.")
+
+
+if __name__ == "__main__":
+    main()
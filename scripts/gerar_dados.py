@@ -0,0 +1,300 @@
+"""
+Gera uma massa de dados sintética e determinística (por seed) para testes de escala.
+
+    python scripts/gerar_dados.py --recriar
+        Recria as tabelas do banco de DATABASE_URL e carrega o cenário padrão.
+
+    python scripts/gerar_dados.py --recriar --alunos 100000 --projetos 40000 --semestres 12
+        Cenário de ~1M de linhas (alguns minutos em SQLite ou MySQL local).
+
+    python scripts/gerar_dados.py --recriar --semestre-final 20271
+        Os semestres terminam em --semestre-final (padrão fixo SEMESTRE_FINAL, para a
+        mesma seed gerar sempre os mesmos dados). O dashboard mostra o semestre atual:
+        para vê-lo populado, passe o semestre corrente.
+
+Distribuições:
+- Projetos começam em qualquer um dos semestres e duram 1 a 4 semestres (em sua maioria 2).
+  Os que já terminaram ficam Concluídos ou Cancelados, e os em andamento ficam Ativos.
+- Cada projeto tem uma equipe de 3 a 7 alunos por semestre, com fase crescente.
+  Em ~60% das viradas de semestre a equipe continua a mesma.
+  Um aluno participa de no máximo uma equipe por semestre.
+- Cada semestre tem 1 líder por equipe, às vezes 2.
+- Empresas e orientadores técnicos seguem uma distribuição de cauda longa.
+  Poucos concentram muitos projetos.
+- Há um adm (Orientador de Gestão de Projeto) com o e-mail EMAIL_ADM. ~10% dos orientadores também são de gestão.
+
+Todos os usuários compartilham a mesma senha (--senha); o hash bcrypt é
+calculado uma única vez, com salt derivado da seed.
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passlib.hash import bcrypt  # noqa: E402
+from sqlalchemy import func, insert, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from app.infra.sqlalchemy.config.database import Base, get_engine  # noqa: E402
+from app.infra.sqlalchemy.models import models  # noqa: E402
+from app.infra.sqlalchemy.repositorios.dashboard_resumo import RepositorioDashboardResumo  # noqa: E402
+
+EMAIL_ADM = "adm@exemplo.com"
+SENHA_PADRAO = "senha123"
+TAMANHO_LOTE = 5000
+SEMESTRE_FINAL = 20262
+
+NOMES = ["Ana", "Bruno", "Carla", "Diego", "Eduarda", "Felipe", "Gabriela", "Heitor", "Isabela", "João",
+         "Larissa", "Lucas", "Mariana", "Matheus", "Natália", "Otávio", "Paula", "Rafael", "Sofia", "Thiago",
+         "Vitória", "Gustavo", "Beatriz", "Pedro", "Camila", "Rodrigo", "Juliana", "André", "Letícia", "Caio"]
+SOBRENOMES = ["Silva", "Santos", "Oliveira", "Souza", "Lima", "Pereira", "Ferreira", "Costa", "Rodrigues",
+              "Almeida", "Nascimento", "Carvalho", "Gomes", "Martins", "Araújo", "Ribeiro", "Barbosa", "Rocha"]
+CURSOS = (["ADS", "Engenharia de Software", "Ciência da Computação", "Sistemas de Informação", "Redes"],
+          [40, 25, 15, 15, 5])
+DEPARTAMENTOS = ["Computação", "Engenharia", "Gestão", "Design"]
+SETORES = ["Tecnologia", "Varejo", "Saúde", "Educação", "Logística", "Agronegócio", "Finanças"]
+DURACAO_SEMESTRES = ([1, 2, 3, 4], [15, 45, 25, 15])
+TAMANHO_EQUIPE = ([3, 4, 5, 6, 7], [10, 25, 35, 20, 10])
+
+# Ordem de inserção (chaves estrangeiras)
+TABELAS = [models.Tipo_Orientador, models.Usuario, models.Aluno, models.Orientador, models.Empresa,
+           models.Projeto, models.Equipe, models.Equipe_Projeto, models.Membro_Equipe, models.Lideranca,
+           models.Orientador_Projeto]
+
+
+def semestres_recentes(quantidade: int, semestre_final: int = SEMESTRE_FINAL) -> list[int]:
+    """Os `quantidade` semestres terminando em `semestre_final` (AAAAS), em ordem crescente."""
+    ano, sem = divmod(semestre_final, 10)
+    semestres = []
+    for _ in range(quantidade):
+        semestres.append(ano * 10 + sem)
+        ano, sem = (ano, 1) if sem == 2 else (ano - 1, 2)
+    return semestres[::-1]
+
+
+def inicio_semestre(semestre: int) -> date:
+    ano, sem = divmod(semestre, 10)
+    return date(ano, 2 if sem == 1 else 8, 1)
+
+
+def fim_semestre(semestre: int) -> date:
+    ano, sem = divmod(semestre, 10)
+    return date(ano, 6, 30) if sem == 1 else date(ano, 12, 15)
+
+
+def pesos_cauda_longa(quantidade: int, expoente: float = 0.9) -> list[float]:
+    """Pesos acumulados ~ 1/rank^expoente, para random.choices(cum_weights=...)."""
+    return list(itertools.accumulate(1 / (rank ** expoente) for rank in range(1, quantidade + 1)))
+
+
+def hash_deterministico(senha: str, aleatorio: random.Random) -> str:
+    alfabeto = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+    salt = "".join(aleatorio.choice(alfabeto) for _ in range(21)) + aleatorio.choice(".Oeu")
+    return bcrypt.using(salt=salt).hash(senha)
+
+
+class Carga:
+    """
+    Acumula linhas por tabela e as insere com executemany em lotes.
+    Ao esvaziar, insere todas as tabelas na ordem de TABELAS (chaves estrangeiras).
+    """
+
+    def __init__(self, conn, tamanho_lote: int = TAMANHO_LOTE):
+        self.conn = conn
+        self.tamanho_lote = tamanho_lote
+        self.pendentes = {modelo: [] for modelo in TABELAS}
+        self.totais = {modelo.__tablename__: 0 for modelo in TABELAS}
+
+    def adicionar(self, modelo, linha: dict):
+        pendentes = self.pendentes[modelo]
+        pendentes.append(linha)
+        if len(pendentes) >= self.tamanho_lote:
+            self.esvaziar()
+
+    def esvaziar(self):
+        for modelo, linhas in self.pendentes.items():
+            if linhas:
+                self.conn.execute(insert(modelo), linhas)
+                self.totais[modelo.__tablename__] += len(linhas)
+                linhas.clear()
+
+
+def gerar(conn, alunos: int, projetos: int, semestres: int, orientadores: int | None = None,
+          empresas: int | None = None, seed: int = 42, senha: str = SENHA_PADRAO,
+          tamanho_lote: int = TAMANHO_LOTE, semestre_final: int = SEMESTRE_FINAL) -> dict[str, int]:
+    """Carrega o cenário na conexão informada (sem commit). Retorna as linhas inseridas por tabela."""
+    aleatorio = random.Random(seed)
+    orientadores = orientadores or max(2, alunos // 100)
+    empresas = empresas or max(1, projetos // 10)
+    lista_semestres = semestres_recentes(semestres, semestre_final)
+    senha_hash = hash_deterministico(senha, aleatorio)
+    carga = Carga(conn, tamanho_lote)
+
+    def nome_pessoa() -> str:
+        return f"{aleatorio.choice(NOMES)} {aleatorio.choice(SOBRENOMES)} {aleatorio.choice(SOBRENOMES)}"
+
+    carga.adicionar(models.Tipo_Orientador, {"id_tipo_orientador": 1, "nome": "Orientador de Execução Técnica"})
+    carga.adicionar(models.Tipo_Orientador, {"id_tipo_orientador": 2, "nome": "Orientador de Gestão de Projeto"})
+
+    # Usuário 1 é o adm; depois os orientadores e, por fim, os alunos
+    carga.adicionar(models.Usuario, {"id_usuario": 1, "nome": "Administrador", "email": EMAIL_ADM,
+                                     "telefone": "11900000000", "senha_hash": senha_hash})
+    carga.adicionar(models.Orientador, {"id_usuario": 1, "id_tipo_orientador": 2, "departamento": "Gestão"})
+    ids_orientadores = list(range(2, orientadores + 2))
+    nomes_orientadores, gestores = {}, [1]
+    for id_usuario in ids_orientadores:
+        nomes_orientadores[id_usuario] = "Prof. " + nome_pessoa()
+        carga.adicionar(models.Usuario, {
+            "id_usuario": id_usuario, "nome": nomes_orientadores[id_usuario],
+            "email": f"orientador{id_usuario}@exemplo.com", "telefone": f"119{id_usuario:08d}",
+            "senha_hash": senha_hash})
+        departamento = aleatorio.choice(DEPARTAMENTOS)
+        carga.adicionar(models.Orientador, {"id_usuario": id_usuario, "id_tipo_orientador": 1,
+                                            "departamento": departamento})
+        if aleatorio.random() < 0.1:
+            gestores.append(id_usuario)
+            carga.adicionar(models.Orientador, {"id_usuario": id_usuario, "id_tipo_orientador": 2,
+                                                "departamento": departamento})
+
+    primeiro_aluno = orientadores + 2
+    ids_alunos = range(primeiro_aluno, primeiro_aluno + alunos)
+    for id_usuario in ids_alunos:
+        ingresso = aleatorio.choice(lista_semestres)
+        carga.adicionar(models.Usuario, {
+            "id_usuario": id_usuario, "nome": nome_pessoa(), "email": f"aluno{id_usuario}@exemplo.com",
+            "telefone": f"119{id_usuario:08d}", "senha_hash": senha_hash})
+        carga.adicionar(models.Aluno, {"id_usuario": id_usuario, "ra": f"{ingresso}{id_usuario:07d}",
+                                       "curso": aleatorio.choices(*CURSOS)[0]})
+
+    for id_empresa in range(1, empresas + 1):
+        carga.adicionar(models.Empresa, {
+            "id_empresa": id_empresa, "nome": f"Empresa {id_empresa:05d} {aleatorio.choice(SOBRENOMES)}",
+            "cnpj": f"{aleatorio.randrange(10 ** 13, 10 ** 14)}",
+            "descricao": f"Empresa do setor de {aleatorio.choice(SETORES)}"})
+
+    pesos_empresas = pesos_cauda_longa(empresas)
+    pesos_orientadores = pesos_cauda_longa(len(ids_orientadores))
+    ocupados = {semestre: set() for semestre in lista_semestres}
+    proximo_equipe = itertools.count(1)
+
+    def sortear_membros(semestre: int, quantidade: int) -> list[int]:
+        usados = ocupados[semestre]
+        membros = []
+        for _ in range(quantidade * 20):
+            if len(membros) == quantidade:
+                break
+            candidato = aleatorio.choice(ids_alunos)
+            # Com alunos esgotados no semestre, aceita repetir
+            if (candidato not in usados or len(usados) >= len(ids_alunos)) and candidato not in membros:
+                membros.append(candidato)
+        usados.update(membros)
+        return membros
+
+    ultimo = len(lista_semestres) - 1
+    for id_projeto in range(1, projetos + 1):
+        inicio = aleatorio.randrange(len(lista_semestres))
+        fim = inicio + aleatorio.choices(*DURACAO_SEMESTRES)[0] - 1
+        em_andamento = fim >= ultimo
+        fim = min(fim, ultimo)
+        if em_andamento:
+            status_projeto = "Ativo" if aleatorio.random() < 0.92 else "Cancelado"
+        else:
+            status_projeto = "Concluído" if aleatorio.random() < 0.85 else "Cancelado"
+        orientador = aleatorio.choices(ids_orientadores, cum_weights=pesos_orientadores)[0]
+
+        carga.adicionar(models.Projeto, {
+            "id_projeto": id_projeto, "nome": f"Projeto {id_projeto:06d}",
+            "descricao": f"Projeto de {aleatorio.choice(SETORES).lower()} iniciado em {lista_semestres[inicio]}",
+            "data_ini": inicio_semestre(lista_semestres[inicio]),
+            "data_fim": None if status_projeto == "Ativo" else fim_semestre(lista_semestres[fim]),
+            "status": status_projeto, "nome_orientador": nomes_orientadores[orientador],
+            "id_empresa": aleatorio.choices(range(1, empresas + 1), cum_weights=pesos_empresas)[0]})
+        carga.adicionar(models.Orientador_Projeto, {"id_projeto": id_projeto, "id_usuario": orientador,
+                                                    "id_tipo_orientador": 1})
+        carga.adicionar(models.Orientador_Projeto, {"id_projeto": id_projeto, "id_usuario": aleatorio.choice(gestores),
+                                                    "id_tipo_orientador": 2})
+
+        id_equipe, membros = None, []
+        for ordem, semestre in enumerate(lista_semestres[inicio:fim + 1]):
+            # A equipe continua se os membros ainda estiverem livres no semestre
+            continua = id_equipe is not None and aleatorio.random() < 0.6 and ocupados[semestre].isdisjoint(membros)
+            if not continua:
+                id_equipe = next(proximo_equipe)
+                membros = sortear_membros(semestre, aleatorio.choices(*TAMANHO_EQUIPE)[0])
+                carga.adicionar(models.Equipe, {"id_equipe": id_equipe, "nome": f"Equipe {id_equipe:06d}"})
+                for id_usuario in membros:
+                    carga.adicionar(models.Membro_Equipe, {"id_equipe": id_equipe, "id_usuario": id_usuario})
+            else:
+                ocupados[semestre].update(membros)
+            carga.adicionar(models.Equipe_Projeto, {"id_equipe": id_equipe, "id_projeto": id_projeto,
+                                                    "semestre": semestre, "fase": str(min(4, ordem + 1))})
+            lideres = aleatorio.sample(membros, min(len(membros), 2 if aleatorio.random() < 0.1 else 1))
+            for id_usuario in lideres:
+                carga.adicionar(models.Lideranca, {"id_projeto": id_projeto, "id_usuario": id_usuario,
+                                                   "semestre": semestre})
+
+    carga.esvaziar()
+    return carga.totais
+
+
+def semestre(valor: str) -> int:
+    """Tipo do argparse para semestres no formato AAAAS (ex.: 20261)."""
+    if not valor.isdigit() or len(valor) != 5 or valor[-1] not in "12":
+        raise argparse.ArgumentTypeError(f"semestre inválido: {valor} (use AAAAS, ex.: 20261)")
+    return int(valor)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alunos", type=int, default=20000)
+    parser.add_argument("--projetos", type=int, default=4000)
+    parser.add_argument("--semestres", type=int, default=10)
+    parser.add_argument("--semestre-final", type=semestre, default=SEMESTRE_FINAL,
+                        help=f"último semestre gerado, AAAAS (padrão {SEMESTRE_FINAL})")
+    parser.add_argument("--orientadores", type=int, help="padrão: 1 para cada 100 alunos")
+    parser.add_argument("--empresas", type=int, help="padrão: 1 para cada 10 projetos")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--senha", default=SENHA_PADRAO, help="senha de todos os usuários gerados")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE, help="linhas por executemany")
+    parser.add_argument("--recriar", action="store_true", help="APAGA e recria todas as tabelas antes de gerar")
+    parser.add_argument("--sem-resumo", action="store_true", help="não preenche a tabela projeto_dashboard")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    engine = get_engine()
+    if args.recriar:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    inicio = time.perf_counter()
+    with engine.begin() as conn:
+        if conn.scalar(select(func.count()).select_from(models.Usuario)):
+            raise SystemExit("O banco já tem usuários; use --recriar para gerar do zero.")
+        totais = gerar(conn, args.alunos, args.projetos, args.semestres, args.orientadores, args.empresas,
+                       args.seed, args.senha, args.lote, args.semestre_final)
+
+    if not args.sem_resumo:
+        with Session(engine) as db:
+            RepositorioDashboardResumo(db).atualizar()
+            db.commit()
+            totais[models.Projeto_Dashboard.__tablename__] = db.scalar(
+                select(func.count()).select_from(models.Projeto_Dashboard))
+
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+
+    for tabela, total in totais.items():
+        print(f"{tabela:<22}{total:>10}")
+    print(f"{'total':<22}{sum(totais.values()):>10}  ({time.perf_counter() - inicio:.1f}s)")
+    print(f"\nLogin de adm: {EMAIL_ADM} / {args.senha}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Réplica de leitura local com dois arquivos SQLite, para testar o roteamento
+de leituras (DATABASE_READ_URL) sem um MySQL replicado.
+
+    python scripts/replicar_sqlite.py database/primario.db database/replica.db --intervalo 2
+
+    DATABASE_URL=sqlite:///database/primario.db \\
+    DATABASE_READ_URL=sqlite:///database/replica.db \\
+    uvicorn app.main:app
+
+Copia o primário para a réplica a cada --intervalo segundos (API de backup
+do SQLite, cópia consistente mesmo com escritas em andamento). O intervalo
+faz o papel do atraso de replicação: uma leitura logo após uma escrita só a
+vê se o cliente estiver fixado no primário (DB_LEITURA_PRIMARIO_S).
+
+Com duas instâncias MySQL locais, configurar a replicação do próprio MySQL
+(CHANGE REPLICATION SOURCE TO ...) e apontar DATABASE_READ_URL para a réplica.
+"""
+import argparse
+import sqlite3
+import time
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("primario", help="arquivo SQLite do primário (DATABASE_URL)")
+    parser.add_argument("replica", help="arquivo SQLite da réplica (DATABASE_READ_URL)")
+    parser.add_argument("--intervalo", type=float, default=2, help="segundos entre cópias (atraso simulado)")
+    parser.add_argument("--uma-vez", action="store_true", help="copia uma vez e sai")
+    return parser.parse_args()
+
+
+def replicar(primario: str, replica: str) -> float:
+    """Copia o primário inteiro para a réplica. Retorna a duração em segundos."""
+    inicio = time.perf_counter()
+    origem = sqlite3.connect(f"file:{primario}?mode=ro", uri=True)
+    destino = sqlite3.connect(replica, timeout=30)
+    try:
+        origem.backup(destino)
+    finally:
+        destino.close()
+        origem.close()
+    return time.perf_counter() - inicio
+
+
+def main():
+    args = parse_args()
+    while True:
+        duracao = replicar(args.primario, args.replica)
+        if args.uma_vez:
+            print(f"Réplica atualizada em {duracao * 1000:.0f}ms")
+            return
+        time.sleep(max(args.intervalo - duracao, 0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Confere se as consultas quentes de dashboard/autorização usam índice.
+
+    python scripts/verificar_planos.py
+        Cria um SQLite temporário, popula com dados sintéticos e verifica os planos.
+
+    DATABASE_URL=mysql+pymysql://... python scripts/verificar_planos.py --sem-semear
+        Verifica um banco já populado (schema com as migrations aplicadas).
+
+Sai com código 1 se alguma consulta fizer varredura completa de tabela.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sem-semear", action="store_true",
+                        help="usa o banco de DATABASE_URL como está, sem criar tabelas nem inserir dados")
+    parser.add_argument("--projetos", type=int, default=2000, help="projetos no banco sintético")
+    return parser.parse_args()
+
+
+args = parse_args()
+if not args.sem_semear:
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "planos.db")
+os.environ.setdefault("DB_ECHO", "false")
+
+from sqlalchemy import select, insert, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from app.infra.sqlalchemy.config.database import Base, get_engine  # noqa: E402
+from app.infra.sqlalchemy.models import models  # noqa: E402
+from app.infra.sqlalchemy.repositorios.projeto import (  # noqa: E402
+    filtrar_projetos, select_projeto_completo, select_membros_projeto
+)
+from app.utils.acesso_projeto import select_projetos_do_usuario  # noqa: E402
+from app.infra.sqlalchemy.repositorios.email_outbox import agora  # noqa: E402
+from app.infra.sqlalchemy.repositorios.dashboard_resumo import RepositorioDashboardResumo  # noqa: E402
+from app.utils.paginacao import paginar  # noqa: E402
+from gerar_dados import gerar  # noqa: E402
+
+engine = get_engine()
+
+def semear(total_projetos: int):
+    """Massa sintética de gerar_dados.py, resumo do dashboard e uma fila de e-mails já enviados."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        gerar(conn, alunos=total_projetos * 5, projetos=total_projetos, semestres=4)
+        conn.execute(insert(models.Email_Outbox), [
+            {"destinatario": f"aluno{i}@exemplo.com", "assunto": "-", "corpo": "-",
+             "status": "enviado", "tentativas": 1, "proxima_tentativa": agora(), "criado_em": agora()}
+            for i in range(1, 2001)])
+    with Session(engine) as db:
+        RepositorioDashboardResumo(db).atualizar()
+        db.commit()
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+
+
+def consultas(projeto_id: int, id_usuario: int, semestre: int):
+    """(nome, tabelas que não podem ser varridas, consulta) — as mesmas usadas pela aplicação."""
+    return [
+        ("check_projeto_acesso (projetos do usuário)", ["membro_equipe", "equipe_projeto"],
+         select_projetos_do_usuario(id_usuario)),
+        ("dashboard completo (projeto, fase, equipe)", ["projeto", "equipe_projeto"],
+         select_projeto_completo(projeto_id, semestre)),
+        ("dashboard completo (membros e líderes)", ["membro_equipe", "equipe_projeto", "lideranca"],
+         select_membros_projeto(projeto_id, semestre)),
+        ("líderes do projeto no semestre", ["lideranca"],
+         select(models.Lideranca.id_usuario).filter(
+             models.Lideranca.id_projeto == projeto_id, models.Lideranca.semestre == semestre)),
+        ("listar projetos por status", ["projeto"],
+         paginar(filtrar_projetos(select(models.Projeto.id_projeto), status="Cancelado"),
+                 [models.Projeto.id_projeto], None, "id", 50)),
+        ("dashboard resumo por status", ["projeto_dashboard"],
+         paginar(select(models.Projeto_Dashboard.id_projeto).filter(models.Projeto_Dashboard.status == "Cancelado"),
+                 [models.Projeto_Dashboard.id_projeto], None, "id", 50)),
+        ("reserva da fila de e-mails", ["email_outbox"],
+         select(models.Email_Outbox.id_email).where(
+             models.Email_Outbox.status == "pendente", models.Email_Outbox.proxima_tentativa <= agora())),
+    ]
+
+
+def plano(conn, consulta) -> list[str]:
+    sql = str(consulta.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    if engine.dialect.name == "sqlite":
+        return [linha.detail for linha in conn.execute(text("EXPLAIN QUERY PLAN " + sql))]
+    return [
+        f"{linha._mapping['table']}: type={linha._mapping['type']} key={linha._mapping['key']}"
+        for linha in conn.execute(text("EXPLAIN " + sql))
+    ]
+
+
+def varreduras(linhas: list[str], tabelas: list[str]) -> list[str]:
+    """Linhas do plano que leem uma das tabelas inteira (sem índice)."""
+    ruins = []
+    for linha in linhas:
+        if engine.dialect.name == "sqlite":
+            partes = linha.split()
+            if len(partes) >= 2 and partes[0] == "SCAN" and partes[1] in tabelas and "INDEX" not in linha:
+                ruins.append(linha)
+        elif "type=ALL" in linha and linha.split(":")[0].lower() in tabelas:
+            ruins.append(linha)
+    return ruins
+
+
+def main():
+    if not args.sem_semear:
+        semear(args.projetos)
+
+    with engine.connect() as conn:
+        projeto_id, id_usuario, semestre = conn.execute(
+            select(models.Equipe_Projeto.id_projeto, models.Membro_Equipe.id_usuario, models.Equipe_Projeto.semestre)
+            .join(models.Membro_Equipe, models.Membro_Equipe.id_equipe == models.Equipe_Projeto.id_equipe)
+            .limit(1)
+        ).one()
+
+        falhas = 0
+        for nome, tabelas, consulta in consultas(projeto_id, id_usuario, semestre):
+            linhas = plano(conn, consulta)
+            ruins = varreduras(linhas, tabelas)
+            falhas += bool(ruins)
+            print(f"[{'FALHA' if ruins else 'OK'}] {nome}")
+            for linha in linhas:
+                print(f"    {linha}")
+
+    print(f"\n{falhas} consulta(s) com varredura completa." if falhas else "\nTodas as consultas usam índice.")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    main()
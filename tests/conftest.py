@@ -0,0 +1,60 @@
+"""
+Fixtures: banco SQLite temporário com a massa pequena e determinística de
+gerar_dados.py, sessões e clientes HTTP autenticados como adm.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.configuracoes import Configuracoes
+from app.fabrica import create_app
+from app.infra.sqlalchemy.config.database import Base, SessionLocal, configurar_banco, get_engine
+from gerar_dados import EMAIL_ADM, SENHA_PADRAO, gerar
+
+ALUNOS = 60
+PROJETOS = 12
+SEMESTRES = 3
+
+
+def configuracoes(url_banco: str, db_async: bool = False) -> Configuracoes:
+    return Configuracoes(database_url=url_banco, db_async=db_async, email_worker_ativo=False,
+                         jwt_secret_key="testes")
+
+
+@pytest.fixture(scope="session")
+def url_banco(tmp_path_factory) -> str:
+    url = f"sqlite:///{tmp_path_factory.mktemp('banco') / 'testes.db'}"
+    configurar_banco(configuracoes(url))
+    Base.metadata.create_all(get_engine())
+    with get_engine().begin() as conn:
+        gerar(conn, ALUNOS, PROJETOS, SEMESTRES, seed=7)
+    return url
+
+
+@pytest.fixture
+def db(url_banco):
+    configurar_banco(configuracoes(url_banco))
+    sessao = SessionLocal()
+    try:
+        yield sessao
+    finally:
+        sessao.rollback()
+        sessao.close()
+
+
+def _cliente(url_banco: str, db_async: bool):
+    app = create_app(configuracoes(url_banco, db_async))
+    with TestClient(app) as cliente:
+        resposta = cliente.post("/auth/login", json={"email": EMAIL_ADM, "senha": SENHA_PADRAO})
+        cliente.headers["Authorization"] = "Bearer " + resposta.json()["access_token"]
+        yield cliente
+
+
+@pytest.fixture
+def cliente(url_banco):
+    """Cliente autenticado como adm, com os routers síncronos."""
+    yield from _cliente(url_banco, db_async=False)
+
+
+@pytest.fixture
+def cliente_async(url_banco):
+    """Cliente autenticado como adm, com os routers assíncronos (DB_ASYNC)."""
+    yield from _cliente(url_banco, db_async=True)
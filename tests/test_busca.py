@@ -0,0 +1,38 @@
+import shutil
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.repositorios.busca import indice_busca
+from app.utils.indice_invertido import IndiceInvertido
+
+
+def test_recarga_do_indice_le_do_primario_com_a_replica_atrasada(db, url_banco, tmp_path):
+    # Réplica parada antes do commit do projeto novo
+    replica = tmp_path / "replica.db"
+    shutil.copy(url_banco.removeprefix("sqlite:///"), replica)
+    engine_replica = create_engine(f"sqlite:///{replica}")
+    indice_busca.limpar()
+    with Session(engine_replica, info={"leitura": True}) as leitura:
+        indice_busca.buscar(leitura, ["zebrafish"], ["projeto"], 10)
+
+        projeto = models.Projeto(nome="Zebrafish", status="Ativo", id_empresa=1)
+        db.add(projeto)
+        db.commit()
+
+        encontrados = indice_busca.buscar(leitura, ["zebrafish"], ["projeto"], 10)
+    engine_replica.dispose()
+
+    assert [(tipo, id_documento) for tipo, id_documento, _ in encontrados] == [("projeto", projeto.id_projeto)]
+
+
+def test_remover_e_atualizar_documento_do_indice():
+    indice = IndiceInvertido()
+    indice.adicionar(1, "Robótica", "braço")
+    indice.adicionar(2, "Robótica educacional")
+    indice.adicionar(1, "Química")
+    indice.remover(2)
+    indice.remover(3)
+
+    assert indice.buscar(["robo"]) == {}
+    assert list(indice.buscar(["quimica"])) == [1]
+    assert len(indice) == 1
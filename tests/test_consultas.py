@@ -0,0 +1,94 @@
+"""
+Número de consultas SQL por requisição nos endpoints principais: constante,
+independente do tamanho da entrada (uma regressão para N+1 muda a contagem).
+A versão de role do token vem do cache preenchido no login e não entra na conta.
+"""
+import pytest
+from sqlalchemy import select
+from app.infra.sqlalchemy.config.instrumentacao import contar_consultas, limitar_consultas
+from app.infra.sqlalchemy.models import models
+from app.utils import role_version
+
+
+@pytest.fixture(autouse=True)
+def role_version_em_cache(monkeypatch):
+    """TTL longo: a contagem não depende de quanto o teste demora."""
+    monkeypatch.setattr(role_version, "ROLE_VERSION_TTL", 3600)
+
+
+@pytest.fixture(params=["cliente", "cliente_async"])
+def api(request):
+    """Mesmo teste com os routers síncronos e com os assíncronos (DB_ASYNC)."""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def alunos(db) -> list[int]:
+    return db.scalars(select(models.Aluno.id_usuario).order_by(models.Aluno.id_usuario)).all()
+
+
+@pytest.fixture
+def projeto_id(db) -> int:
+    return db.scalar(select(models.Projeto.id_projeto).order_by(models.Projeto.id_projeto))
+
+
+def consultas(cliente, metodo: str, url: str, **kwargs) -> int:
+    with contar_consultas() as contador:
+        resposta = cliente.request(metodo, url, **kwargs)
+    assert resposta.status_code < 300, resposta.text
+    return contador.total
+
+
+@pytest.mark.parametrize("participantes", [2, 20])
+def test_criar_projeto_completo(api, db, alunos, participantes):
+    empresa_id = db.scalar(select(models.Empresa.id_empresa).order_by(models.Empresa.id_empresa))
+    projeto = {"nome": "Consultas", "status": "Ativo", "id_empresa": empresa_id,
+               "id_alunos_participantes": alunos[:participantes]}
+
+    assert consultas(api, "POST", "/projetos/", json=projeto) == 10
+
+
+@pytest.mark.parametrize("limite", [1, 50])
+def test_listar_projetos_dashboard(api, limite):
+    api.get("/projetos/dashboard/all")  # sincroniza o resumo do semestre
+
+    assert consultas(api, "GET", "/projetos/dashboard/all", params={"limite": limite}) == 2
+
+
+def test_get_dashboard_completo(api, projeto_id):
+    with limitar_consultas(3):
+        resposta = api.get(f"/projetos/dashboard/{projeto_id}/completo")
+    assert resposta.status_code == 200
+
+    with pytest.raises(AssertionError, match="3 consultas executadas"):
+        with limitar_consultas(2):
+            api.get(f"/projetos/dashboard/{projeto_id}/completo")
+
+
+@pytest.mark.parametrize("quantidade", [2, 30])
+def test_adicionar_membros_em_lote(api, alunos, quantidade):
+    equipe_id = api.post("/equipes/", json={"nome": "Consultas"}).json()["id_equipe"]
+    lote = {"id_equipe": equipe_id, "id_usuarios": alunos[:quantidade]}
+
+    assert consultas(api, "POST", "/equipes/membros/lote", json=lote) == 5
+
+
+@pytest.mark.parametrize("limite", [5, 50])
+def test_listar_alunos(api, limite):
+    with contar_consultas() as contador:
+        resposta = api.get("/alunos/", params={"limite": limite})
+
+    assert len(resposta.json()) == limite
+    assert contador.total == 1
+
+
+@pytest.mark.parametrize("quantidade", [2, 30])
+def test_listar_membros_por_equipe(api, alunos, quantidade):
+    equipe_id = api.post("/equipes/", json={"nome": "Consultas"}).json()["id_equipe"]
+    api.post("/equipes/membros/lote", json={"id_equipe": equipe_id, "id_usuarios": alunos[:quantidade]})
+
+    with contar_consultas() as contador:
+        resposta = api.get(f"/equipes/{equipe_id}/membros")
+
+    assert len(resposta.json()) == quantidade
+    assert contador.total == 1
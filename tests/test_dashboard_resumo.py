@@ -0,0 +1,31 @@
+import math
+from sqlalchemy import func, select
+from app.infra.sqlalchemy.config.instrumentacao import contar_consultas
+from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.repositorios import dashboard_resumo
+from app.infra.sqlalchemy.repositorios.dashboard_resumo import RepositorioDashboardResumo
+
+
+def inserts_resumo(contador) -> list[str]:
+    return [sql for sql in contador.sqls if sql.startswith("INSERT INTO projeto_dashboard")]
+
+
+def test_atualizar_insere_cada_lote_em_um_executemany(db, monkeypatch):
+    monkeypatch.setattr(dashboard_resumo, "TAMANHO_LOTE", 5)
+    total = db.scalar(select(func.count()).select_from(models.Projeto))
+
+    with contar_consultas() as contador:
+        RepositorioDashboardResumo(db).atualizar()
+
+    assert len(inserts_resumo(contador)) == math.ceil(total / 5)
+    assert db.scalar(select(func.count()).select_from(models.Projeto_Dashboard)) == total
+    # Projetos sem equipe no semestre (fase None) ficam no mesmo lote dos demais
+    assert db.scalar(select(func.count()).select_from(models.Projeto_Dashboard)
+                     .where(models.Projeto_Dashboard.fase.is_(None))) > 0
+
+
+def test_atualizar_projetos_informados(db):
+    with contar_consultas() as contador:
+        RepositorioDashboardResumo(db).atualizar([1, 2, 3])
+
+    assert len(inserts_resumo(contador)) == 1
@@ -0,0 +1,39 @@
+from dataclasses import replace
+from datetime import datetime
+from sqlalchemy import delete
+from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.repositorios.email_outbox import RepositorioEmailOutbox
+from app.utils.email_handler import WorkerEmail
+from conftest import configuracoes
+
+
+def test_erro_qualquer_reagenda_so_o_email_que_falhou(url_banco, db, monkeypatch):
+    repositorio = RepositorioEmailOutbox(db)
+    repositorio.enfileirar("falha@exemplo.com", "Assunto", "Corpo")
+    repositorio.enfileirar("ok@exemplo.com", "Assunto", "Corpo")
+    db.commit()
+    worker = WorkerEmail(replace(configuracoes(url_banco), email_lote=10_000))  # inclui o que outros testes enfileiraram
+    enviados = []
+
+    def enviar(mensagem):
+        if mensagem["To"] == "falha@exemplo.com":
+            raise ValueError("mensagem inválida")
+        enviados.append(mensagem["To"])
+    monkeypatch.setattr(worker.conexao, "enviar", enviar)
+
+    try:
+        worker.processar_lote()
+
+        db.expire_all()
+        emails = {e.destinatario: e for e in db.query(models.Email_Outbox).filter(
+            models.Email_Outbox.destinatario.in_(["falha@exemplo.com", "ok@exemplo.com"]))}
+        assert "ok@exemplo.com" in enviados
+        assert emails["ok@exemplo.com"].status == "enviado"
+        falha = emails["falha@exemplo.com"]
+        assert (falha.status, falha.tentativas, falha.ultimo_erro) == ("pendente", 1, "mensagem inválida")
+        assert falha.proxima_tentativa > datetime.now()
+        assert worker.estatisticas()["total_falhas"] == 1
+    finally:
+        db.execute(delete(models.Email_Outbox).where(
+            models.Email_Outbox.destinatario.in_(["falha@exemplo.com", "ok@exemplo.com"])))
+        db.commit()
@@ -0,0 +1,20 @@
+from dataclasses import replace
+from fastapi.testclient import TestClient
+from jose import jwt
+from app.fabrica import create_app
+from app.utils.email_handler import worker_email
+from app.utils.jwt_handler import ALGORITHM, cache_tokens
+from gerar_dados import EMAIL_ADM, SENHA_PADRAO
+from conftest import configuracoes
+
+
+def test_create_app_configura_tokens_e_worker_de_email(url_banco):
+    config = replace(configuracoes(url_banco), jwt_secret_key="outra-chave", token_cache_max_entries=7,
+                     mail_from="sistema@exemplo.com", email_lote=3)
+
+    with TestClient(create_app(config)) as cliente:
+        token = cliente.post("/auth/login", json={"email": EMAIL_ADM, "senha": SENHA_PADRAO}).json()["access_token"]
+        assert jwt.decode(token, "outra-chave", algorithms=[ALGORITHM])["email"] == EMAIL_ADM
+        assert cache_tokens.max_entradas == 7
+        assert worker_email.configuracoes.mail_from == "sistema@exemplo.com"
+        assert worker_email.configuracoes.email_lote == 3
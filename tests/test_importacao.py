@@ -0,0 +1,30 @@
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from app.infra.sqlalchemy.models import models
+from app.infra.sqlalchemy.repositorios import aluno as repositorio_aluno
+
+
+def registros(quantidade: int) -> list[dict]:
+    return [{"nome": f"Importado {i}", "email": f"importado{i}@exemplo.com", "telefone": "1",
+             "ra": f"IMP{i}", "curso": "ADS"} for i in range(quantidade)]
+
+
+def test_importar_alunos_com_pool_de_senhas_cheio_devolve_relatorio(db, monkeypatch):
+    hash_senhas = repositorio_aluno.hash_senhas
+    chamadas = []
+
+    def hash_senhas_ocupado(senhas):
+        chamadas.append(len(senhas))
+        if len(chamadas) > 1:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Servidor ocupado.")
+        return hash_senhas(senhas)
+
+    monkeypatch.setattr(repositorio_aluno, "hash_senhas", hash_senhas_ocupado)
+    alunos_antes = db.scalar(select(func.count()).select_from(models.Aluno))
+
+    relatorio = repositorio_aluno.importar_alunos(db, registros(7), tamanho_lote=3)
+
+    assert relatorio["importados"] == 3
+    assert [erro["linha"] for erro in relatorio["erros"]] == [4, 5, 6, 7]
+    assert {erro["erro"] for erro in relatorio["erros"]} == {"Servidor ocupado."}
+    assert db.scalar(select(func.count()).select_from(models.Aluno)) == alunos_antes + 3
@@ -0,0 +1,26 @@
+import time
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from app.infra.sqlalchemy.config.database import get_engine
+from app.infra.sqlalchemy.config.instrumentacao import EstatisticasSQL, contexto_sql, registro_instrumentacao
+
+
+def test_consulta_com_erro_nao_afeta_a_medicao_da_seguinte(url_banco):
+    erros_antes = registro_instrumentacao.consultas_com_erro
+    estatisticas = EstatisticasSQL()
+    token = contexto_sql.set(estatisticas)
+    try:
+        with get_engine().connect() as conn:
+            with pytest.raises(IntegrityError):
+                conn.execute(text("INSERT INTO tipo_orientador (id_tipo_orientador, nome) VALUES (1, 'x')"))
+            conn.rollback()
+            time.sleep(0.05)
+            conn.execute(text("SELECT 1"))
+    finally:
+        contexto_sql.reset(token)
+
+    assert registro_instrumentacao.consultas_com_erro == erros_antes + 1
+    assert estatisticas.consultas == 2
+    # Sem a pausa entre as duas: a falha não deixa um início pendente na conexão
+    assert estatisticas.tempo_s < 0.05
@@ -0,0 +1,26 @@
+from sqlalchemy import select
+from app.infra.sqlalchemy.models import models
+from app.utils import role_version
+from gerar_dados import EMAIL_ADM
+
+
+def test_revogar_tokens_invalida_o_cache_na_hora(cliente, db, monkeypatch):
+    monkeypatch.setattr(role_version, "ROLE_VERSION_TTL", 3600)
+    usuario_id = db.scalar(select(models.Usuario.id_usuario).where(models.Usuario.email == EMAIL_ADM))
+    assert cliente.get("/alunos/").status_code == 200
+
+    assert cliente.post(f"/admin/usuarios/{usuario_id}/revogar-tokens").status_code == 200
+    assert cliente.get("/alunos/").status_code == 401
+
+
+def test_leitura_anterior_a_invalidacao_nao_volta_ao_cache(monkeypatch):
+    monkeypatch.setattr(role_version, "ROLE_VERSION_TTL", 3600)
+    role_version.limpar_role_versions()
+    geracao = role_version.geracao_role_versions()
+    role_version._esquecer([1])
+
+    role_version.registrar_role_version(1, 0, geracao)
+    assert role_version._versao_em_cache(1)[0] is None
+
+    role_version.registrar_role_version(1, 1, role_version.geracao_role_versions())
+    assert role_version._versao_em_cache(1)[0] == 1
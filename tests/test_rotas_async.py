@@ -0,0 +1,32 @@
+"""Com DB_ASYNC, as rotas (inclusive a autenticação) não usam o engine síncrono."""
+import pytest
+from app.infra.sqlalchemy.config.database import get_engine
+from app.infra.sqlalchemy.config.instrumentacao import contar_consultas
+from app.infra.sqlalchemy.repositorios import dashboard_resumo
+
+
+@pytest.mark.parametrize("url", ["/alunos/", "/empresas/", "/equipes/", "/projetos/dashboard/all"])
+def test_listagens_async_sem_engine_sincrono(cliente_async, url, monkeypatch):
+    # Força a verificação do resumo do dashboard na primeira leitura
+    monkeypatch.setattr(dashboard_resumo, "_semestre_sincronizado", None)
+
+    with contar_consultas(get_engine()) as sincronas, contar_consultas() as todas:
+        resposta = cliente_async.get(url)
+
+    assert resposta.status_code == 200, resposta.text
+    assert sincronas.total == 0
+    assert todas.total > 0
+
+
+def test_importar_alunos_async(cliente_async):
+    registros = [{"nome": f"Async {i}", "email": f"async{i}@exemplo.com", "telefone": "1",
+                  "ra": f"ASY{i}", "curso": "ADS"} for i in range(3)]
+    registros.append(registros[0])
+
+    with contar_consultas(get_engine()) as sincronas:
+        resposta = cliente_async.post("/alunos/importar", json=registros)
+
+    assert resposta.status_code == 200, resposta.text
+    assert resposta.json()["importados"] == 3
+    assert [erro["linha"] for erro in resposta.json()["erros"]] == [4]
+    assert sincronas.total == 0
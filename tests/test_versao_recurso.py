@@ -0,0 +1,29 @@
+from app.infra.sqlalchemy.config.instrumentacao import contar_consultas
+from app.utils.versao_recurso import (
+    chave_dashboard, chave_projeto, incrementar_versoes, incrementar_versoes_projetos,
+    obter_versao, obter_versao_dashboard
+)
+
+
+def test_incrementar_versoes_cria_e_incrementa_em_um_upsert(db):
+    chaves = ["teste:a", "teste:b"]
+    with contar_consultas() as contador:
+        incrementar_versoes(db, chaves + ["teste:a"])
+        incrementar_versoes(db, chaves)
+
+    assert contador.total == 2
+    assert [obter_versao(db, chave) for chave in chaves] == [2, 2]
+
+
+def test_incrementar_versoes_projetos_muda_a_versao_do_dashboard(db):
+    antes = obter_versao_dashboard(db)
+    versao_projeto = obter_versao(db, chave_projeto(5))
+
+    incrementar_versoes_projetos(db, [5])
+    assert obter_versao_dashboard(db) == antes + 1
+    assert obter_versao(db, chave_dashboard(5)) >= 1
+    assert obter_versao(db, chave_projeto(5)) == versao_projeto + 1
+
+    incrementar_versoes_projetos(db, None)
+    assert obter_versao_dashboard(db) == antes + 2
+    assert obter_versao(db, chave_projeto(5)) == versao_projeto + 2